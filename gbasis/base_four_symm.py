@@ -157,11 +157,103 @@ class BaseFourIndexSymmetric(BaseGaussianRelatedArray):
 
         """
 
-    def construct_array_cartesian(self, **kwargs):
+    def _get_sizes(self, coord_types):
+        """Return the number of contractions in each shell in the given coordinate systems."""
+        return [
+            cont.num_seg_cont * (cont.num_sph if coord_type == "spherical" else cont.num_cart)
+            for cont, coord_type in zip(self.contractions, coord_types)
+        ]
+
+    @staticmethod
+    def _assign_zero_blocks(all_blocks, sizes, ind_a, ind_b, ind_c, ind_d):
+        """Set the blocks of the given shell quartet and of its permutations to zero."""
+        # pylint: disable=R0913
+        for ind in [
+            (ind_a, ind_b, ind_c, ind_d),
+            (ind_a, ind_b, ind_d, ind_c),
+            (ind_b, ind_a, ind_c, ind_d),
+            (ind_b, ind_a, ind_d, ind_c),
+            (ind_c, ind_d, ind_a, ind_b),
+            (ind_d, ind_c, ind_a, ind_b),
+            (ind_c, ind_d, ind_b, ind_a),
+            (ind_d, ind_c, ind_b, ind_a),
+        ]:
+            all_blocks[ind] = np.zeros([sizes[index] for index in ind])
+
+    def compute_schwarz_bounds(self, coord_types, **kwargs):
+        r"""Return the Schwarz bounds of the pairs of shells.
+
+        By the Cauchy-Schwarz inequality, each integral of a shell quartet is bounded by
+
+        .. math::
+
+            |(ab|cd)| \leq \sqrt{(ab|ab)} \sqrt{(cd|cd)} \leq Q_{AB} Q_{CD}
+
+        where :math:`Q_{AB}` is the bound of the pair of shells :math:`A` and :math:`B`. Since the
+        diagonal block of the pair, :math:`(ab|a'b')`, is positive semidefinite, the square of the
+        bound is given by its largest eigenvalue, multiplied by the largest squared norm of the
+        rows of the Cartesian to spherical transformations of spherical shells.
+
+        Parameters
+        ----------
+        coord_types : list/tuple of str
+            Types of the coordinate system for each GeneralizedContractionShell.
+            Each entry must be one of "cartesian" or "spherical".
+        kwargs : dict
+            Other keyword arguments that will be used to construct the array.
+            These keyword arguments are passed entirely to `construct_array_contraction`. See
+            `construct_array_contraction` for details on the keyword arguments.
+
+        Returns
+        -------
+        bounds : np.ndarray(N_shell, N_shell)
+            Schwarz bounds, :math:`Q_{AB}`, of each pair of shells.
+            `N_shell` is the number of shells within the instance.
+
+        Notes
+        -----
+        The bounds are only valid if the array returned from `construct_array_contraction` is a
+        positive semidefinite kernel with respect to the pairs of the first two and last two
+        indices, which is the case for the electron repulsion integrals.
+
+        """
+        scales = []
+        for cont, coord_type in zip(self.contractions, coord_types):
+            if coord_type == "spherical":
+                transform = generate_transformation(
+                    cont.angmom, cont.angmom_components_cart, cont.angmom_components_sph, "left"
+                )
+                scales.append(np.max(np.sum(transform**2, axis=1)))
+            else:
+                scales.append(1.0)
+
+        bounds = np.zeros((len(self.contractions),) * 2)
+        for (i, cont_one), (j, cont_two) in it.combinations_with_replacement(
+            enumerate(self.contractions), 2
+        ):
+            block = self.construct_array_contraction(
+                cont_one, cont_two, cont_one, cont_two, **kwargs
+            )
+            # normalize contractions
+            norm = cont_one.norm_cont[:, :, None, None] * cont_two.norm_cont[None, None, :, :]
+            block *= norm[:, :, :, :, None, None, None, None]
+            block *= norm[None, None, None, None, :, :, :, :]
+            size = norm.size
+            block = block.reshape(size, size)
+            max_eigval = np.max(np.linalg.eigvalsh((block + block.T) / 2))
+            bounds[i, j] = bounds[j, i] = np.sqrt(max(max_eigval, 0) * scales[i] * scales[j])
+        return bounds
+
+    def construct_array_cartesian(self, screen_tol=None, **kwargs):
         """Return the array associated with the given set(s) of contracted Cartesian Gaussians.
 
         Parameters
         ----------
+        screen_tol : float, optional
+            Tolerance used in the Schwarz screening of the shell quartets. The blocks of the shell
+            quartets whose Schwarz bound (see `compute_schwarz_bounds`) is smaller than
+            `screen_tol` are not computed and are set to zero.
+            Default does not screen the shell quartets.
         kwargs : dict
             Other keyword arguments that will be used to construct the array.
             These keyword arguments are passed entirely to `construct_array_contraction`. See
@@ -186,9 +278,16 @@ class BaseFourIndexSymmetric(BaseGaussianRelatedArray):
         # pylint: disable=C0103,R0914
         all_blocks = np.zeros((len(self.contractions),) * 4, dtype=object)
 
+        if screen_tol is not None:
+            coord_types = ["cartesian"] * len(self.contractions)
+            bounds = self.compute_schwarz_bounds(coord_types, **kwargs)
+            sizes = self._get_sizes(coord_types)
         pair_i_cont = list(it.combinations_with_replacement(enumerate(self.contractions), 2))
         for pair_ind, ((i, cont_one), (j, cont_two)) in enumerate(pair_i_cont):
             for (k, cont_three), (l, cont_four) in pair_i_cont[pair_ind:]:
+                if screen_tol is not None and bounds[i, j] * bounds[k, l] < screen_tol:
+                    self._assign_zero_blocks(all_blocks, sizes, i, j, k, l)
+                    continue
                 block = self.construct_array_contraction(
                     cont_one, cont_two, cont_three, cont_four, **kwargs
                 )
@@ -243,11 +342,16 @@ class BaseFourIndexSymmetric(BaseGaussianRelatedArray):
             axis=0,
         )
 
-    def construct_array_spherical(self, **kwargs):
+    def construct_array_spherical(self, screen_tol=None, **kwargs):
         """Return the array associated with four contracted spherical Gaussians (atomic orbitals).
 
         Parameters
         ----------
+        screen_tol : float, optional
+            Tolerance used in the Schwarz screening of the shell quartets. The blocks of the shell
+            quartets whose Schwarz bound (see `compute_schwarz_bounds`) is smaller than
+            `screen_tol` are not computed and are set to zero.
+            Default does not screen the shell quartets.
         kwargs : dict
             Other keyword arguments that will be used to construct the array.
             These keyword arguments are passed entirely to `construct_array_contraction`. See
@@ -275,6 +379,10 @@ class BaseFourIndexSymmetric(BaseGaussianRelatedArray):
         # NOTE: we get list of unique pairs of (index, contraction_instance) to avoid double
         # counting the ij and kl. e.g. 0, 1, 0, 0 and 0, 0, 0, 1 will both be present with the
         # previous approach
+        if screen_tol is not None:
+            coord_types = ["spherical"] * len(self.contractions)
+            bounds = self.compute_schwarz_bounds(coord_types, **kwargs)
+            sizes = self._get_sizes(coord_types)
         pair_i_cont = list(it.combinations_with_replacement(enumerate(self.contractions), 2))
         for pair_ind, ((i, cont_one), (j, cont_two)) in enumerate(pair_i_cont):
             transform_one = generate_transformation(
@@ -290,6 +398,9 @@ class BaseFourIndexSymmetric(BaseGaussianRelatedArray):
                 "left",
             )
             for (k, cont_three), (l, cont_four) in pair_i_cont[pair_ind:]:
+                if screen_tol is not None and bounds[i, j] * bounds[k, l] < screen_tol:
+                    self._assign_zero_blocks(all_blocks, sizes, i, j, k, l)
+                    continue
                 transform_three = generate_transformation(
                     cont_three.angmom,
                     cont_three.angmom_components_cart,
@@ -388,7 +499,7 @@ class BaseFourIndexSymmetric(BaseGaussianRelatedArray):
             axis=0,
         )
 
-    def construct_array_mix(self, coord_types, **kwargs):
+    def construct_array_mix(self, coord_types, screen_tol=None, **kwargs):
         """Return the array associated with a set of Gaussians of the given coordinate systems.
 
         Parameters
@@ -396,6 +507,11 @@ class BaseFourIndexSymmetric(BaseGaussianRelatedArray):
         coord_types : list/tuple of str
             Types of the coordinate system for each `GeneralizedContractionShell`.
             Each entry must be one of "cartesian" or "spherical".
+        screen_tol : float, optional
+            Tolerance used in the Schwarz screening of the shell quartets. The blocks of the shell
+            quartets whose Schwarz bound (see `compute_schwarz_bounds`) is smaller than
+            `screen_tol` are not computed and are set to zero.
+            Default does not screen the shell quartets.
         kwargs : dict
             Other keyword arguments that will be used to construct the array.
 
@@ -432,6 +548,9 @@ class BaseFourIndexSymmetric(BaseGaussianRelatedArray):
             )
 
         all_blocks = np.zeros((len(self.contractions),) * 4, dtype=object)
+        if screen_tol is not None:
+            bounds = self.compute_schwarz_bounds(coord_types, **kwargs)
+            sizes = self._get_sizes(coord_types)
         pair_i_cont = list(
             it.combinations_with_replacement(
                 zip(range(len(self.contractions)), self.contractions, coord_types), 2
@@ -453,6 +572,9 @@ class BaseFourIndexSymmetric(BaseGaussianRelatedArray):
                     "left",
                 )
             for (k, cont_three, type_three), (l, cont_four, type_four) in pair_i_cont[pair_ind:]:
+                if screen_tol is not None and bounds[i, j] * bounds[k, l] < screen_tol:
+                    self._assign_zero_blocks(all_blocks, sizes, i, j, k, l)
+                    continue
                 block = self.construct_array_contraction(
                     cont_one, cont_two, cont_three, cont_four, **kwargs
                 )
@@ -565,12 +687,14 @@ class BaseFourIndexSymmetric(BaseGaussianRelatedArray):
 
         Parameters
         ----------
-        transform : np.ndarray(K_orbs, K_cont)
+        transform : {np.ndarray(K_orbs, K_cont), list/tuple of 4 np.ndarray(K_orbs_i, K_cont)}
             Transformation matrix from contractions in the given coordinate system (e.g. AO) to
             linear combinations of contractions (e.g. MO).
             Transformation is applied to the left.
             Rows correspond to the linear combinations (i.e. MO) and the columns correspond to the
             contractions (i.e. AO).
+            If four transformation matrices are given, the `i`-th matrix is applied to the `i`-th
+            index of the array. An entry of None leaves the corresponding index untransformed.
         coord_type : list/tuple of str
             Types of the coordinate system for each GeneralizedContractionShell.
             Each entry must be one of "cartesian" or "spherical". If multiple
@@ -596,8 +720,16 @@ class BaseFourIndexSymmetric(BaseGaussianRelatedArray):
         ------
         TypeError
             If `coord_type` is not a list/tuple of the strings 'cartesian' or 'spherical'.
+            If `transform` is not a `numpy` array or a list/tuple of four transformation matrices.
 
         """
+        if isinstance(transform, np.ndarray):
+            transform = [transform] * 4
+        elif not (isinstance(transform, (list, tuple)) and len(transform) == 4):
+            raise TypeError(
+                "`transform` must be a `numpy` array or a list/tuple of four transformation "
+                "matrices."
+            )
         if all(ct == "cartesian" for ct in coord_type):
             array = self.construct_array_cartesian(**kwargs)
         elif all(ct == "spherical" for ct in coord_type):
@@ -608,9 +740,8 @@ class BaseFourIndexSymmetric(BaseGaussianRelatedArray):
             raise TypeError(
                 "`coord_type` must be a list/tuple of the strings 'cartesian' or 'spherical'"
             )
-        array = np.tensordot(transform, array, (1, 0))
-        array = np.tensordot(transform, array, (1, 1))
-        array = np.tensordot(transform, array, (1, 2))
-        array = np.tensordot(transform, array, (1, 3))
-        array = np.swapaxes(np.swapaxes(array, 0, 3), 1, 2)
+        # transform one index at a time
+        for axis, trans in enumerate(transform):
+            if trans is not None:
+                array = np.moveaxis(np.tensordot(trans, array, (1, axis)), 0, axis)
         return array
@@ -0,0 +1,416 @@
+"""Base class for arrays that depend on three contracted Gaussians."""
+import abc
+
+from gbasis.base import BaseGaussianRelatedArray
+from gbasis.spherical import generate_transformation
+import numpy as np
+
+
+# pylint: disable=W0235
+class BaseThreeIndex(BaseGaussianRelatedArray):
+    """Base class for constructing arrays with three indices, each with its own set of contractions.
+
+    Each of the first three indices of the returned array is associated with its own set of
+    contracted Gaussians (or some linear combination of them). The sets may be the same, e.g. the
+    first two indices of the three-center integrals used in density fitting are associated with the
+    same basis set and the third index is associated with the auxiliary basis set.
+
+    Attributes
+    ----------
+    _axes_contractions : tuple of tuple of GeneralizedContractionShell
+        Sets of contractions associated with each axis of the array.
+    contractions_one : tuple of GeneralizedContractionShell
+        Contractions that are associated with the first index of the array.
+        Property of `BaseThreeIndex`.
+    contractions_two : tuple of GeneralizedContractionShell
+        Contractions that are associated with the second index of the array.
+        Property of `BaseThreeIndex`.
+    contractions_three : tuple of GeneralizedContractionShell
+        Contractions that are associated with the third index of the array.
+        Property of `BaseThreeIndex`.
+
+    Methods
+    -------
+    __init__(self, contractions_one, contractions_two, contractions_three)
+        Initialize.
+    construct_array_contraction(self, contractions_one, contractions_two, contractions_three,
+                                **kwargs) :
+        **np.ndarray(M_1, L_cart_1, M_2, L_cart_2, M_3, L_cart_3, ...)**
+
+        Return the array associated with a `GeneralizedContractionShell` instance.
+        `M_i` is the number of segmented contractions with the same exponents (and angular
+        momentum) associated with the `i`-th index.
+        `L_cart_i` is the number of Cartesian contractions for the given angular momentum
+        associated with the `i`-th index.
+    construct_array_cartesian(self, **kwargs) : np.ndarray(K_cart_1, K_cart_2, K_cart_3, ...)
+        Return the array associated with Cartesian Gaussians.
+        `K_cart_i` is the total number of Cartesian contractions associated with the `i`-th index.
+    construct_array_spherical(self, **kwargs) : np.ndarray(K_sph_1, K_sph_2, K_sph_3, ...)
+        Return the array associated with spherical Gaussians (atomic orbitals).
+        `K_sph_i` is the total number of spherical contractions associated with the `i`-th index.
+    construct_array_mix(self, coord_types_one, coord_types_two, coord_types_three, **kwargs) :
+        **np.ndarray(K_cont_1, K_cont_2, K_cont_3, ...)**
+
+        Return the array associated with a set of Gaussians of the given coordinate systems.
+        `K_cont_i` is the total number of contractions associated with the `i`-th index.
+    construct_array_lincomb(self, transform_one, transform_two, transform_three, coord_type_one,
+                            coord_type_two, coord_type_three, **kwargs) :
+        **np.ndarray(K_orbs_1, K_orbs_2, K_orbs_3, ...)**
+
+        Return the array associated with linear combinations of contractions in the given coordinate
+        system.
+        `K_orbs_i` is the number of basis functions produced by linear combinations of the
+        contractions associated with the `i`-th index.
+
+    """
+
+    def __init__(self, contractions_one, contractions_two, contractions_three):
+        """Initialize.
+
+        Parameters
+        ----------
+        contractions_one : list/tuple of GeneralizedContractionShell
+            Contractions that are associated with the first index of the array.
+        contractions_two : list/tuple of GeneralizedContractionShell
+            Contractions that are associated with the second index of the array.
+        contractions_three : list/tuple of GeneralizedContractionShell
+            Contractions that are associated with the third index of the array.
+
+        """
+        super().__init__(contractions_one, contractions_two, contractions_three)
+
+    @property
+    def contractions_one(self):
+        """Contractions that are associated with the first index of the array.
+
+        Returns
+        -------
+        contractions_one : tuple of GeneralizedContractionShell
+            Contractions that are associated with the first index of the array.
+
+        """
+        return self._axes_contractions[0]
+
+    @property
+    def contractions_two(self):
+        """Contractions that are associated with the second index of the array.
+
+        Returns
+        -------
+        contractions_two : tuple of GeneralizedContractionShell
+            Contractions that are associated with the second index of the array.
+
+        """
+        return self._axes_contractions[1]
+
+    @property
+    def contractions_three(self):
+        """Contractions that are associated with the third index of the array.
+
+        Returns
+        -------
+        contractions_three : tuple of GeneralizedContractionShell
+            Contractions that are associated with the third index of the array.
+
+        """
+        return self._axes_contractions[2]
+
+    @abc.abstractmethod
+    def construct_array_contraction(
+        self, contractions_one, contractions_two, contractions_three, **kwargs
+    ):
+        """Return the array associated with three sets of contracted Cartesian Gaussians.
+
+        Parameters
+        ----------
+        contractions_one : GeneralizedContractionShell
+            Contracted Cartesian Gaussians (of the same shell) associated with the first index of
+            the array.
+        contractions_two : GeneralizedContractionShell
+            Contracted Cartesian Gaussians (of the same shell) associated with the second index of
+            the array.
+        contractions_three : GeneralizedContractionShell
+            Contracted Cartesian Gaussians (of the same shell) associated with the third index of
+            the array.
+        kwargs : dict
+            Other keyword arguments that will be used to construct the array.
+
+        Returns
+        -------
+        array_contraction : np.ndarray(M_1, L_cart_1, M_2, L_cart_2, M_3, L_cart_3, ...)
+            Array associated with the given instances of GeneralizedContractionShell.
+            Dimensions 0, 2, and 4 correspond to the segmented contractions within
+            `contractions_one`, `contractions_two`, and `contractions_three`, respectively.
+            `M_i` is the number of segmented contractions with the same exponents (and angular
+            momentum) associated with the `i`-th index.
+            Dimensions 1, 3, and 5 correspond to the angular momentum vectors of
+            `contractions_one`, `contractions_two`, and `contractions_three`, respectively.
+            `L_cart_i` is the number of Cartesian contractions for the given angular momentum
+            associated with the `i`-th index.
+
+        Notes
+        -----
+        The methods `construct_array_cartesian`, `construct_array_spherical`, `construct_array_mix`
+        and `construct_array_lincomb` depend on this function to produce an array with the shape
+        (M_1, L_cart_1, M_2, L_cart_2, M_3, L_cart_3, ...). These other methods **will** fail with
+        little warning if the shape of the output is different. Even if the contractions are
+        segmented, the dimensions that correspond to the segmented contractions must be present,
+        i.e. the shape must still be (1, L_1, 1, L_2, 1, L_3).
+
+        """
+
+    def _construct_block(self, conts, coord_types, **kwargs):
+        """Return the normalized block of the array in the given coordinate systems.
+
+        Parameters
+        ----------
+        conts : 3-tuple of GeneralizedContractionShell
+            Contractions associated with the first, second, and third indices of the array.
+        coord_types : 3-tuple of str
+            Coordinate systems of the contractions. Each entry must be one of "cartesian" or
+            "spherical".
+        kwargs : dict
+            Other keyword arguments that will be used to construct the array.
+
+        Returns
+        -------
+        block : np.ndarray(M_1 L_1, M_2 L_2, M_3 L_3, ...)
+            Block of the array associated with the given contractions, where `L_i` is the number of
+            contractions for the given angular momentum in the given coordinate system.
+
+        """
+        block = self.construct_array_contraction(*conts, **kwargs)
+        for i, (cont, coord_type) in enumerate(zip(conts, coord_types)):
+            # normalize contractions
+            block *= cont.norm_cont.reshape(
+                *[1 for _ in range(2 * i)],
+                *cont.norm_cont.shape,
+                *[1 for _ in block.shape[2 * i + 2 :]],
+            )
+            # transform
+            if coord_type == "spherical":
+                transform = generate_transformation(
+                    cont.angmom, cont.angmom_components_cart, cont.angmom_components_sph, "left"
+                )
+                block = np.moveaxis(np.tensordot(transform, block, (1, 2 * i + 1)), 0, 2 * i + 1)
+        # array now has shape (M_1, L_1, M_2, L_2, M_3, L_3, ...)
+        return block.reshape(
+            block.shape[0] * block.shape[1],
+            block.shape[2] * block.shape[3],
+            block.shape[4] * block.shape[5],
+            *block.shape[6:],
+        )
+
+    def construct_array_cartesian(self, **kwargs):
+        """Return the array associated with the given sets of contracted Cartesian Gaussians.
+
+        Parameters
+        ----------
+        kwargs : dict
+            Other keyword arguments that will be used to construct the array.
+            These keyword arguments are passed entirely to `construct_array_contraction`. See
+            `construct_array_contraction` for details on the keyword arguments.
+
+        Returns
+        -------
+        array : np.ndarray(K_cart_1, K_cart_2, K_cart_3, ...)
+            Array associated with the given sets of contracted Cartesian Gaussians.
+            Dimensions 0, 1, and 2 correspond to the Cartesian contractions within
+            `contractions_one`, `contractions_two`, and `contractions_three`, respectively.
+            `K_cart_i` is the total number of Cartesian contractions associated with the `i`-th
+            index.
+
+        """
+        return self.construct_array_mix(
+            ["cartesian"] * len(self.contractions_one),
+            ["cartesian"] * len(self.contractions_two),
+            ["cartesian"] * len(self.contractions_three),
+            **kwargs,
+        )
+
+    def construct_array_spherical(self, **kwargs):
+        """Return the array associated with three sets of contracted spherical Gaussians.
+
+        Parameters
+        ----------
+        kwargs : dict
+            Other keyword arguments that will be used to construct the array.
+            These keyword arguments are passed entirely to `construct_array_contraction`. See
+            `construct_array_contraction` for details on the keyword arguments.
+
+        Returns
+        -------
+        array : np.ndarray(K_sph_1, K_sph_2, K_sph_3, ...)
+            Array associated with the atomic orbitals associated with the given sets of contracted
+            Cartesian Gaussians.
+            Dimensions 0, 1, and 2 correspond to the spherical contractions within
+            `contractions_one`, `contractions_two`, and `contractions_three`, respectively.
+            `K_sph_i` is the total number of spherical contractions associated with the `i`-th
+            index.
+
+        """
+        return self.construct_array_mix(
+            ["spherical"] * len(self.contractions_one),
+            ["spherical"] * len(self.contractions_two),
+            ["spherical"] * len(self.contractions_three),
+            **kwargs,
+        )
+
+    def construct_array_mix(self, coord_types_one, coord_types_two, coord_types_three, **kwargs):
+        """Return the array associated with sets of Gaussians of the given coordinate systems.
+
+        Parameters
+        ----------
+        coord_types_one : list/tuple of str
+            Types of the coordinate system for `GeneralizedContractionShell` associated with the
+            first index of the array.
+            Each entry must be one of "cartesian" or "spherical".
+        coord_types_two : list/tuple of str
+            Types of the coordinate system for `GeneralizedContractionShell` associated with the
+            second index of the array.
+            Each entry must be one of "cartesian" or "spherical".
+        coord_types_three : list/tuple of str
+            Types of the coordinate system for `GeneralizedContractionShell` associated with the
+            third index of the array.
+            Each entry must be one of "cartesian" or "spherical".
+        kwargs : dict
+            Other keyword arguments that will be used to construct the array.
+
+        Returns
+        -------
+        array : np.ndarray(K_cont_1, K_cont_2, K_cont_3, ...)
+            Array associated with the given sets of contractions in the given coordinate systems.
+            `K_cont_i` is the total number of contractions associated with the `i`-th index.
+
+        Raises
+        ------
+        TypeError
+            If `coord_types_one`, `coord_types_two`, or `coord_types_three` is not a list/tuple.
+        ValueError
+            If `coord_types_one`, `coord_types_two`, or `coord_types_three` has an entry that is not
+            "cartesian" or "spherical".
+            If `coord_types_one`, `coord_types_two`, or `coord_types_three` has a different number
+            of entries as the number of `GeneralizedContractionShell` associated with the
+            corresponding index.
+
+        """
+        all_coord_types = (coord_types_one, coord_types_two, coord_types_three)
+        for name, coord_types, contractions in zip(
+            ["one", "two", "three"], all_coord_types, self._axes_contractions
+        ):
+            if not isinstance(coord_types, (list, tuple)):
+                raise TypeError("`coord_types_{}` must be a list or a tuple.".format(name))
+            if not all(i in ["cartesian", "spherical"] for i in coord_types):
+                raise ValueError(
+                    "Each entry of `coord_types_{}` must be one of 'cartesian' or 'spherical'."
+                    "".format(name)
+                )
+            if len(coord_types) != len(contractions):
+                raise ValueError(
+                    "`coord_types_{}` must have the same number of entries as the number of "
+                    "`GeneralizedContractionShell` associated with the index.".format(name)
+                )
+
+        matrices = []
+        for cont_one, type_one in zip(self.contractions_one, coord_types_one):
+            matrices_cols = []
+            for cont_two, type_two in zip(self.contractions_two, coord_types_two):
+                matrices_cols.append(
+                    np.concatenate(
+                        [
+                            self._construct_block(
+                                (cont_one, cont_two, cont_three),
+                                (type_one, type_two, type_three),
+                                **kwargs,
+                            )
+                            for cont_three, type_three in zip(
+                                self.contractions_three, coord_types_three
+                            )
+                        ],
+                        axis=2,
+                    )
+                )
+            matrices.append(np.concatenate(matrices_cols, axis=1))
+        return np.concatenate(matrices, axis=0)
+
+    def construct_array_lincomb(
+        self,
+        transform_one,
+        transform_two,
+        transform_three,
+        coord_type_one,
+        coord_type_two,
+        coord_type_three,
+        **kwargs,
+    ):
+        r"""Return the array associated with linear combinations of contractions.
+
+        .. math::
+
+            \sum_{j} T^{one}_{i_1 j} \sum_{k} T^{two}_{i_2 k} \sum_{l} T^{three}_{i_3 l} M_{jkl...}
+            = M^{trans}_{i_1 i_2 i_3 ...}
+
+        Parameters
+        ----------
+        transform_one : np.ndarray
+            Array associated with the linear combinations of contractions associated with the first
+            index.
+            If None, then transformation is skipped.
+        transform_two : np.ndarray
+            Array associated with the linear combinations of contractions associated with the second
+            index.
+            If None, then transformation is skipped.
+        transform_three : np.ndarray
+            Array associated with the linear combinations of contractions associated with the third
+            index.
+            If None, then transformation is skipped.
+        coord_type_one : list/tuple of string
+            Types of the coordinate system for the contractions associated with the first index.
+            Each entry must be one of "cartesian" or "spherical". If only one string ("cartesian"
+            or "spherical") is provided, all of the contractions will be treated according to that
+            string.
+        coord_type_two : list/tuple of string
+            Types of the coordinate system for the contractions associated with the second index.
+            Each entry must be one of "cartesian" or "spherical". If only one string ("cartesian"
+            or "spherical") is provided, all of the contractions will be treated according to that
+            string.
+        coord_type_three : list/tuple of string
+            Types of the coordinate system for the contractions associated with the third index.
+            Each entry must be one of "cartesian" or "spherical". If only one string ("cartesian"
+            or "spherical") is provided, all of the contractions will be treated according to that
+            string.
+        kwargs : dict
+            Other keyword arguments that will be used to construct the array.
+            These keyword arguments are passed directly to `construct_array_mix`, which will
+            then pass it down to `construct_array_contraction`. See `construct_array_contraction`
+            for details on the keyword arguments.
+
+        Returns
+        -------
+        array : np.ndarray(K_orbs_1, K_orbs_2, K_orbs_3, ...)
+            Array associated with the linear combinations of the given three sets of contractions.
+            Dimensions 0, 1, and 2 correspond to the linear combinations of the contractions
+            associated with `contractions_one`, `contractions_two`, and `contractions_three`,
+            respectively. `K_orbs_i` is the number of basis functions produced by the linear
+            combinations associated with the `i`-th index.
+
+        Raises
+        ------
+        TypeError
+            If `coord_type_one`, `coord_type_two`, or `coord_type_three` is not a list/tuple of the
+            strings 'cartesian' or 'spherical'.
+
+        """
+        all_coord_types = [coord_type_one, coord_type_two, coord_type_three]
+        for i, contractions in enumerate(self._axes_contractions):
+            if all_coord_types[i] in ["cartesian", "spherical"]:
+                all_coord_types[i] = [all_coord_types[i]] * len(contractions)
+            if not isinstance(all_coord_types[i], (list, tuple)):
+                raise TypeError(
+                    "`coord_type` must be a list/tuple of the strings 'cartesian' or 'spherical'"
+                )
+        array = self.construct_array_mix(*all_coord_types, **kwargs)
+        for i, transform in enumerate([transform_one, transform_two, transform_three]):
+            if transform is not None:
+                array = np.moveaxis(np.tensordot(transform, array, (1, i)), 0, i)
+        return array
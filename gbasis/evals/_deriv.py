@@ -385,3 +385,110 @@ def _second_derivative(center_coords, gauss, indices_second_deriv, angmom_comps,
     second_deriv = np.prod(raw_second_deriv, axis=1)
 
     return second_deriv
+
+
+def _eval_zeroth_first_second_order_deriv_contractions(
+    coords, center, angmom_comps, alphas, prim_coeffs, norm
+):
+    """Return the evaluation of a Cartesian contraction and all of its first and second derivatives.
+
+    The Gaussian exponentials and the powers of the shifted coordinates are evaluated once and
+    reused for all ten derivatives, which are ordered as
+    :math:`(1, x, y, z, xx, xy, xz, yy, yz, zz)`.
+
+    Parameters
+    ----------
+    coords : np.ndarray(N, 3)
+        Point in space where the derivative of the Gaussian primitive is evaluated.
+        Coordinates must be given as a two dimensional array, even if only one point is given.
+    center : np.ndarray(3,)
+        Center of the Gaussian primitive.
+    angmom_comps : np.ndarray(L, 3)
+        Components of the angular momentum, :math:`(a_x, a_y, a_z)`.
+        Angular momentum components must be given as a two dimensional array, even if only one
+        set of components is given.
+    alphas : np.ndarray(K,)
+        Values of the (square root of the) precisions of the primitives.
+    prim_coeffs : np.ndarray(K, M)
+        Contraction coefficients of the primitives.
+        The coefficients always correspond to generalized contractions, i.e. two-dimensional array
+        where the first index corresponds to the primitive and the second index corresponds to the
+        contraction (with the same exponents and angular momentum).
+    norm : np.ndarray(L, K)
+        Normalization constants for the primitives in each contraction.
+
+    Returns
+    -------
+    derivatives : np.ndarray(M, L, 10, N)
+        Evaluation of the contraction and its derivatives at each given coordinate.
+        Dimension 0 corresponds to the contraction, with `M` as the number of given contractions.
+        Dimension 1 corresponds to the angular momentum vector, ordered as in `angmom_comps`.
+        Dimension 2 corresponds to the derivative, ordered as
+        :math:`(1, x, y, z, xx, xy, xz, yy, yz, zz)`.
+        Dimension 3 corresponds to the point at which the derivative is evaluated, ordered as in
+        `coords`.
+
+    Notes
+    -----
+    The input is not checked. This means that you must provide the parameters as they are specified
+    in the docstring. They must all be `numpy` arrays with the **correct shape**.
+
+    """
+    # NOTE: following convention will be used to organize the axis of the multidimensional arrays
+    # axis 0 = index for primitive (size: K)
+    # axis 1 = index for angular momentum vector (size: L)
+    # axis 2 = index for dimension (x, y, z) of coordinate (size: 3)
+    # axis 3 = index for coordinate (out of a grid) (size: N)
+    new_coords = coords.T - center[:, np.newaxis]
+    gauss = np.exp(-alphas[:, np.newaxis, np.newaxis] * new_coords**2)[:, np.newaxis]
+    alphas = alphas[:, np.newaxis, np.newaxis, np.newaxis]
+
+    # powers of the shifted coordinates, from 0 to L + 2
+    powers = np.ones((np.max(angmom_comps) + 3, *new_coords.shape))
+    for i in range(1, powers.shape[0]):
+        powers[i] = powers[i - 1] * new_coords
+    # select the powers needed for each angular momentum component
+    # NOTE: negative powers are replaced by zeroth powers since their coefficients are always zero
+    angmoms = angmom_comps[:, :, np.newaxis]
+    dims = np.arange(3)[np.newaxis, :]
+    power_minus_two = powers[np.maximum(angmom_comps - 2, 0), dims]
+    power_minus_one = powers[np.maximum(angmom_comps - 1, 0), dims]
+    power_zero = powers[angmom_comps, dims]
+    power_plus_one = powers[angmom_comps + 1, dims]
+    power_plus_two = powers[angmom_comps + 2, dims]
+
+    # one dimensional factors and their first and second derivatives
+    zeroth = power_zero * gauss
+    first = (angmoms * power_minus_one - 2 * alphas * power_plus_one) * gauss
+    second = (
+        angmoms * (angmoms - 1) * power_minus_two
+        - 2 * alphas * (2 * angmoms + 1) * power_zero
+        + 4 * alphas**2 * power_plus_two
+    ) * gauss
+
+    zeroth_x, zeroth_y, zeroth_z = np.moveaxis(zeroth, 2, 0)
+    first_x, first_y, first_z = np.moveaxis(first, 2, 0)
+    second_x, second_y, second_z = np.moveaxis(second, 2, 0)
+    zeroth_yz = zeroth_y * zeroth_z
+    zeroth_xz = zeroth_x * zeroth_z
+    zeroth_xy = zeroth_x * zeroth_y
+    derivs = np.stack(
+        [
+            zeroth_x * zeroth_yz,
+            first_x * zeroth_yz,
+            first_y * zeroth_xz,
+            first_z * zeroth_xy,
+            second_x * zeroth_yz,
+            first_x * first_y * zeroth_z,
+            first_x * first_z * zeroth_y,
+            second_y * zeroth_xz,
+            first_y * first_z * zeroth_x,
+            second_z * zeroth_xy,
+        ],
+        axis=2,
+    )
+    # NOTE: `derivs` now has axis 0 for primitives, 1 for angular momentum vector, axis 2 for
+    # derivatives, and axis 3 for coordinates
+
+    norm = norm.T[:, :, np.newaxis, np.newaxis]
+    return np.tensordot(prim_coeffs, norm * derivs, (0, 0))
@@ -1,11 +1,14 @@
 """Density Evaluation."""
 from gbasis.evals.eval import evaluate_basis
-from gbasis.evals.eval_deriv import evaluate_deriv_basis
+from gbasis.evals.eval_deriv import DerivBasisCache
+from gbasis.utils import chunked_points
 import numpy as np
 from scipy.special import comb
 
 
-def evaluate_density_using_evaluated_orbs(one_density_matrix, orb_eval):
+def evaluate_density_using_evaluated_orbs(
+    one_density_matrix, orb_eval, check_symmetry=True, tol_screen=None
+):
     """Return the evaluation of the density given the evaluated orbitals.
 
     Parameters
@@ -16,6 +19,17 @@ def evaluate_density_using_evaluated_orbs(one_density_matrix, orb_eval):
         Orbitals evaluated at :math:`N` grid points.
         The set of orbitals must be the same basis set used to build the one-electron density
         matrix.
+    check_symmetry : bool, optional
+        Flag for checking that the density matrix is symmetric.
+        Default is True.
+    tol_screen : float, optional
+        Tolerance used to screen the orbitals. Only the orbitals whose magnitude is larger than
+        `tol_screen` at one of the given points are included in the contraction with the density
+        matrix, such that only the corresponding block of the density matrix is used. For
+        orbitals that are evaluated with spatial screening on a compact block of points, this
+        reduces the cost from the square of all orbitals to the square of the orbitals that are
+        significant within the block.
+        Default includes all of the orbitals.
 
     Returns
     -------
@@ -49,7 +63,7 @@ def evaluate_density_using_evaluated_orbs(one_density_matrix, orb_eval):
         )
     if one_density_matrix.shape[0] != one_density_matrix.shape[1]:
         raise ValueError("One-electron density matrix must be a square matrix.")
-    if not np.allclose(one_density_matrix, one_density_matrix.T):
+    if check_symmetry and not np.allclose(one_density_matrix, one_density_matrix.T):
         raise ValueError("One-electron density matrix must be symmetric.")
     if one_density_matrix.shape[0] != orb_eval.shape[0]:
         raise ValueError(
@@ -57,12 +71,37 @@ def evaluate_density_using_evaluated_orbs(one_density_matrix, orb_eval):
             " of the orbital evaluations."
         )
 
+    if tol_screen is not None:
+        significant = np.max(np.abs(orb_eval), axis=1, initial=0) > tol_screen
+        if not np.all(significant):
+            orb_eval = orb_eval[significant]
+            one_density_matrix = one_density_matrix[np.ix_(significant, significant)]
     density = one_density_matrix.dot(orb_eval)
     density *= orb_eval
     return np.sum(density, axis=0)
 
 
-def evaluate_density(one_density_matrix, basis, points, transform=None, threshold=1.0e-8):
+def _get_deriv_cache(basis, points, transform, deriv_type, deriv_cache):
+    """Return the given derivative cache, or a new one if none is given."""
+    if deriv_cache is None:
+        return DerivBasisCache(basis, points, transform=transform, deriv_type=deriv_type)
+    if not isinstance(deriv_cache, DerivBasisCache):
+        raise TypeError("`deriv_cache` must be a `DerivBasisCache` instance.")
+    return deriv_cache
+
+
+def evaluate_density(
+    one_density_matrix,
+    basis,
+    points,
+    transform=None,
+    threshold=1.0e-8,
+    deriv_cache=None,
+    chunk_size=None,
+    n_workers=None,
+    tol_screen=None,
+    check_symmetry=True,
+):
     r"""Return the density of the given basis set at the given points.
 
     Parameters
@@ -87,6 +126,31 @@ def evaluate_density(one_density_matrix, basis, points, transform=None, threshol
     threshold : float, optional
         The absolute value below which negative density values are acceptable. Any negative density
         value with an absolute value smaller than this threshold will be set to zero.
+    deriv_cache : DerivBasisCache, optional
+        Cache of the derivatives of the basis functions that can be shared between several density
+        functions evaluated on the same points. It must have been created with the same `basis`,
+        `points`, and `transform`.
+        Default evaluates the basis functions without caching them.
+    chunk_size : int, optional
+        Maximum number of points that are evaluated at once (see `gbasis.utils.chunked_points`).
+        Cannot be used together with `deriv_cache`.
+        Default evaluates all points at once.
+    n_workers : int, optional
+        Number of threads that evaluate blocks of points concurrently (see
+        `gbasis.utils.chunked_points`).
+        Cannot be used together with `deriv_cache`.
+        Default evaluates all blocks in the calling thread.
+    tol_screen : float, optional
+        Tolerance used to screen the basis functions. The shells are screened spatially when the
+        basis functions are evaluated (see `evaluate_basis`), and only the basis functions that are
+        larger than `tol_screen` within each block of points are contracted with the density
+        matrix (see `evaluate_density_using_evaluated_orbs`). It is best used with `chunk_size`
+        and points that are ordered in space.
+        Default does not screen the basis functions.
+    check_symmetry : bool, optional
+        Flag for checking that the density matrix is symmetric. When the points are evaluated in
+        blocks, the check is done once instead of for every block of points.
+        Default is True.
 
     Returns
     -------
@@ -94,8 +158,48 @@ def evaluate_density(one_density_matrix, basis, points, transform=None, threshol
         Density evaluated at `N` grid points.
 
     """
-    orb_eval = evaluate_basis(basis, points, transform=transform)
-    output = evaluate_density_using_evaluated_orbs(one_density_matrix, orb_eval)
+    # the symmetry is checked once instead of for every block of points
+    if check_symmetry and (chunk_size is not None or n_workers is not None):
+        if not np.allclose(one_density_matrix, one_density_matrix.T):
+            raise ValueError("One-electron density matrix must be symmetric.")
+        check_symmetry = False
+    return _evaluate_density(
+        one_density_matrix,
+        basis,
+        points,
+        transform=transform,
+        threshold=threshold,
+        deriv_cache=deriv_cache,
+        chunk_size=chunk_size,
+        n_workers=n_workers,
+        tol_screen=tol_screen,
+        check_symmetry=check_symmetry,
+    )
+
+
+@chunked_points()
+def _evaluate_density(
+    one_density_matrix,
+    basis,
+    points,
+    transform=None,
+    threshold=1.0e-8,
+    deriv_cache=None,
+    chunk_size=None,
+    n_workers=None,
+    tol_screen=None,
+    check_symmetry=True,
+):
+    """Return the density of the given basis set at the given points (see `evaluate_density`)."""
+    if deriv_cache is None:
+        orb_eval = evaluate_basis(basis, points, transform=transform, tol_screen=tol_screen)
+    else:
+        orb_eval = _get_deriv_cache(basis, points, transform, None, deriv_cache).evaluate(
+            np.zeros(3, dtype=int)
+        )
+    output = evaluate_density_using_evaluated_orbs(
+        one_density_matrix, orb_eval, check_symmetry=check_symmetry, tol_screen=tol_screen
+    )
     # Fix #117: check magnitude of small negative density values, then use clip to remove them
     min_output = np.min(output)
     if min_output < 0.0 and abs(min_output) > threshold:
@@ -103,6 +207,7 @@ def evaluate_density(one_density_matrix, basis, points, transform=None, threshol
     return output.clip(min=0.0)
 
 
+@chunked_points()
 def evaluate_deriv_reduced_density_matrix(
     orders_one,
     orders_two,
@@ -111,6 +216,9 @@ def evaluate_deriv_reduced_density_matrix(
     points,
     transform=None,
     deriv_type="general",
+    deriv_cache=None,
+    chunk_size=None,
+    n_workers=None,
 ):
     r"""Return the derivative of the first-order reduced density matrix at the given points.
 
@@ -162,6 +270,20 @@ def evaluate_deriv_reduced_density_matrix(
         to general implementation of any order derivative function (_eval_deriv_contractions())
         and "direct" makes reference to specific implementation of first and second order
         derivatives for generalized contraction (_eval_first_second_order_deriv_contractions()).
+    deriv_cache : DerivBasisCache, optional
+        Cache of the derivatives of the basis functions that can be shared between several density
+        functions evaluated on the same points. It must have been created with the same `basis`,
+        `points`, `transform`, and `deriv_type`.
+        Default creates a cache that is only used within this call.
+    chunk_size : int, optional
+        Maximum number of points that are evaluated at once (see `gbasis.utils.chunked_points`).
+        Cannot be used together with `deriv_cache`.
+        Default evaluates all points at once.
+    n_workers : int, optional
+        Number of threads that evaluate blocks of points concurrently (see
+        `gbasis.utils.chunked_points`).
+        Cannot be used together with `deriv_cache`.
+        Default evaluates all blocks in the calling thread.
 
     Returns
     -------
@@ -169,29 +291,16 @@ def evaluate_deriv_reduced_density_matrix(
         Derivative of the first-order reduced density matrix evaluated at `N` grid points.
 
     """
-    deriv_orb_eval_one = evaluate_deriv_basis(
-        basis,
-        points,
-        orders_one,
-        transform=transform,
-        deriv_type=deriv_type,
-    )
-    if np.array_equal(orders_one, orders_two):
-        deriv_orb_eval_two = deriv_orb_eval_one
-    else:
-        deriv_orb_eval_two = evaluate_deriv_basis(
-            basis,
-            points,
-            orders_two,
-            transform=transform,
-            deriv_type=deriv_type,
-        )
+    deriv_cache = _get_deriv_cache(basis, points, transform, deriv_type, deriv_cache)
+    deriv_orb_eval_one = deriv_cache.evaluate(orders_one)
+    deriv_orb_eval_two = deriv_cache.evaluate(orders_two)
     density = one_density_matrix.dot(deriv_orb_eval_two)
     density *= deriv_orb_eval_one
     density = np.sum(density, axis=0)
     return density
 
 
+@chunked_points()
 def evaluate_deriv_density(
     orders,
     one_density_matrix,
@@ -199,6 +308,9 @@ def evaluate_deriv_density(
     points,
     transform=None,
     deriv_type="general",
+    deriv_cache=None,
+    chunk_size=None,
+    n_workers=None,
 ):
     r"""Return the derivative of density of the given transformed basis set at the given points.
 
@@ -228,6 +340,20 @@ def evaluate_deriv_density(
         to general implementation of any order derivative function (_eval_deriv_contractions())
         and "direct" makes reference to specific implementation of first and second order
         derivatives for generalized contraction (_eval_first_second_order_deriv_contractions()).
+    deriv_cache : DerivBasisCache, optional
+        Cache of the derivatives of the basis functions that can be shared between several density
+        functions evaluated on the same points. It must have been created with the same `basis`,
+        `points`, `transform`, and `deriv_type`.
+        Default creates a cache that is only used within this call.
+    chunk_size : int, optional
+        Maximum number of points that are evaluated at once (see `gbasis.utils.chunked_points`).
+        Cannot be used together with `deriv_cache`.
+        Default evaluates all points at once.
+    n_workers : int, optional
+        Number of threads that evaluate blocks of points concurrently (see
+        `gbasis.utils.chunked_points`).
+        Cannot be used together with `deriv_cache`.
+        Default evaluates all blocks in the calling thread.
 
     Returns
     -------
@@ -237,6 +363,8 @@ def evaluate_deriv_density(
     """
     # pylint: disable=R0914
     total_l_x, total_l_y, total_l_z = orders
+    # NOTE: orders greater than 2 are evaluated with the "general" implementation by the cache
+    deriv_cache = _get_deriv_cache(basis, points, transform, deriv_type, deriv_cache)
 
     output = np.zeros(points.shape[0])
     for l_x in range(total_l_x // 2 + 1):
@@ -253,36 +381,30 @@ def evaluate_deriv_density(
                 num_occurence = comb(total_l_x, l_x) * comb(total_l_y, l_y) * comb(total_l_z, l_z)
                 orders_one = np.array([l_x, l_y, l_z])
                 orders_two = orders - orders_one
-                if any(orders_one > 2) or any(orders_two > 2):
-                    density = evaluate_deriv_reduced_density_matrix(
-                        orders_one,
-                        orders_two,
-                        one_density_matrix,
-                        basis,
-                        points,
-                        transform=transform,
-                        deriv_type="general",
-                    )
-                else:
-                    density = evaluate_deriv_reduced_density_matrix(
-                        orders_one,
-                        orders_two,
-                        one_density_matrix,
-                        basis,
-                        points,
-                        transform=transform,
-                        deriv_type=deriv_type,
-                    )
+                density = evaluate_deriv_reduced_density_matrix(
+                    orders_one,
+                    orders_two,
+                    one_density_matrix,
+                    basis,
+                    points,
+                    transform=transform,
+                    deriv_type=deriv_type,
+                    deriv_cache=deriv_cache,
+                )
                 output += factor * num_occurence * density
     return output
 
 
+@chunked_points(axis=0)
 def evaluate_density_gradient(
     one_density_matrix,
     basis,
     points,
     transform=None,
     deriv_type="general",
+    deriv_cache=None,
+    chunk_size=None,
+    n_workers=None,
 ):
     r"""Return the gradient of the density evaluated at the given points.
 
@@ -310,6 +432,20 @@ def evaluate_density_gradient(
         to general implementation of any order derivative function (_eval_deriv_contractions())
         and "direct" makes reference to specific implementation of first and second order
         derivatives for generalized contraction (_eval_first_second_order_deriv_contractions()).
+    deriv_cache : DerivBasisCache, optional
+        Cache of the derivatives of the basis functions that can be shared between several density
+        functions evaluated on the same points. It must have been created with the same `basis`,
+        `points`, `transform`, and `deriv_type`.
+        Default creates a cache that is only used within this call.
+    chunk_size : int, optional
+        Maximum number of points that are evaluated at once (see `gbasis.utils.chunked_points`).
+        Cannot be used together with `deriv_cache`.
+        Default evaluates all points at once.
+    n_workers : int, optional
+        Number of threads that evaluate blocks of points concurrently (see
+        `gbasis.utils.chunked_points`).
+        Cannot be used together with `deriv_cache`.
+        Default evaluates all blocks in the calling thread.
 
     Returns
     -------
@@ -319,24 +455,13 @@ def evaluate_density_gradient(
     """
     orders_one = np.array(([1, 0, 0], [0, 1, 0], [0, 0, 1]))
     output = np.zeros((3, len(points)))
+    deriv_cache = _get_deriv_cache(basis, points, transform, deriv_type, deriv_cache)
     # Evaluation of generalized contraction shell for zeroth order = 0,0,0
-    zeroth_deriv = evaluate_deriv_basis(
-        basis,
-        points,
-        np.array([0, 0, 0]),
-        transform=transform,
-        deriv_type=deriv_type,
-    )
+    zeroth_deriv = deriv_cache.evaluate(np.array([0, 0, 0]))
 
     # Evaluation of generalized contraction shell for each partial derivative
     for ind, orders in enumerate(orders_one):
-        deriv_comp = evaluate_deriv_basis(
-            basis,
-            points,
-            orders,
-            transform=transform,
-            deriv_type=deriv_type,
-        )
+        deriv_comp = deriv_cache.evaluate(orders)
         # output[ind] = 2*(np.einsum('ij,ik,jk -> k',one_density_matrix, zeroth_deriv, deriv_comp))
         density = one_density_matrix.dot(zeroth_deriv)
         density *= deriv_comp
@@ -344,12 +469,16 @@ def evaluate_density_gradient(
     return output.T
 
 
+@chunked_points()
 def evaluate_density_laplacian(
     one_density_matrix,
     basis,
     points,
     transform=None,
     deriv_type="general",
+    deriv_cache=None,
+    chunk_size=None,
+    n_workers=None,
 ):
     r"""Return the Laplacian of the density evaluated at the given points.
 
@@ -377,6 +506,20 @@ def evaluate_density_laplacian(
         to general implementation of any order derivative function (_eval_deriv_contractions())
         and "direct" makes reference to specific implementation of first and second order
         derivatives for generalized contraction (_eval_first_second_order_deriv_contractions()).
+    deriv_cache : DerivBasisCache, optional
+        Cache of the derivatives of the basis functions that can be shared between several density
+        functions evaluated on the same points. It must have been created with the same `basis`,
+        `points`, `transform`, and `deriv_type`.
+        Default creates a cache that is only used within this call.
+    chunk_size : int, optional
+        Maximum number of points that are evaluated at once (see `gbasis.utils.chunked_points`).
+        Cannot be used together with `deriv_cache`.
+        Default evaluates all points at once.
+    n_workers : int, optional
+        Number of threads that evaluate blocks of points concurrently (see
+        `gbasis.utils.chunked_points`).
+        Cannot be used together with `deriv_cache`.
+        Default evaluates all blocks in the calling thread.
 
     Returns
     -------
@@ -388,45 +531,21 @@ def evaluate_density_laplacian(
     orders_one_first = np.array(([1, 0, 0], [0, 1, 0], [0, 0, 1]))
     orders_two = np.array(([1, 0, 0], [0, 1, 0], [0, 0, 1]))
     output = np.zeros(points.shape[0])
+    deriv_cache = _get_deriv_cache(basis, points, transform, deriv_type, deriv_cache)
     # Evaluation of generalized contraction shell for zeroth order = 0,0,0
-    zeroth_deriv = evaluate_deriv_basis(
-        basis,
-        points,
-        np.array([0, 0, 0]),
-        transform=transform,
-        deriv_type=deriv_type,
-    )
+    zeroth_deriv = deriv_cache.evaluate(np.array([0, 0, 0]))
 
     # Evaluation of generalized contraction shell for each partial derivative
     for orders in orders_one_second:
-        deriv_one = evaluate_deriv_basis(
-            basis,
-            points,
-            orders,
-            transform=transform,
-            deriv_type=deriv_type,
-        )
+        deriv_one = deriv_cache.evaluate(orders)
 
         density = one_density_matrix.dot(zeroth_deriv)
         density *= deriv_one
         output += 2 * 1 * np.sum(density, axis=0)
 
     for orders in zip(orders_one_first, orders_two):
-        deriv_one = evaluate_deriv_basis(
-            basis,
-            points,
-            orders[0],
-            transform=transform,
-            deriv_type=deriv_type,
-        )
-
-        deriv_two = evaluate_deriv_basis(
-            basis,
-            points,
-            orders[1],
-            transform=transform,
-            deriv_type=deriv_type,
-        )
+        deriv_one = deriv_cache.evaluate(orders[0])
+        deriv_two = deriv_cache.evaluate(orders[1])
         # output[ind] = 2*(np.einsum('ij,ik,jk -> k',one_density_matrix, zeroth_deriv, deriv_comp))
         density = one_density_matrix.dot(deriv_two)
         density *= deriv_one
@@ -435,12 +554,16 @@ def evaluate_density_laplacian(
     return output
 
 
+@chunked_points(axis=0)
 def evaluate_density_hessian(
     one_density_matrix,
     basis,
     points,
     transform=None,
     deriv_type="general",
+    deriv_cache=None,
+    chunk_size=None,
+    n_workers=None,
 ):
     r"""Return the Hessian of the density evaluated at the given points.
 
@@ -468,6 +591,20 @@ def evaluate_density_hessian(
         to general implementation of any order derivative function (_eval_deriv_contractions())
         and "direct" makes reference to specific implementation of first and second order
         derivatives for generalized contraction (_eval_first_second_order_deriv_contractions()).
+    deriv_cache : DerivBasisCache, optional
+        Cache of the derivatives of the basis functions that can be shared between several density
+        functions evaluated on the same points. It must have been created with the same `basis`,
+        `points`, `transform`, and `deriv_type`.
+        Default creates a cache that is only used within this call.
+    chunk_size : int, optional
+        Maximum number of points that are evaluated at once (see `gbasis.utils.chunked_points`).
+        Cannot be used together with `deriv_cache`.
+        Default evaluates all points at once.
+    n_workers : int, optional
+        Number of threads that evaluate blocks of points concurrently (see
+        `gbasis.utils.chunked_points`).
+        Cannot be used together with `deriv_cache`.
+        Default evaluates all blocks in the calling thread.
 
     Returns
     -------
@@ -496,14 +633,9 @@ def evaluate_density_hessian(
         )
     )
 
+    deriv_cache = _get_deriv_cache(basis, points, transform, deriv_type, deriv_cache)
     # Evaluation of generalized contraction shell for zeroth order = 0,0,0
-    zeroth_deriv = evaluate_deriv_basis(
-        basis,
-        points,
-        np.array([0, 0, 0]),
-        transform=transform,
-        deriv_type=deriv_type,
-    )
+    zeroth_deriv = deriv_cache.evaluate(np.array([0, 0, 0]))
 
     # Arrays for derivative
     zeroth_arr = np.full((3, 3, one_density_matrix.shape[0], points.shape[0]), zeroth_deriv)
@@ -514,27 +646,9 @@ def evaluate_density_hessian(
     for i in range(3):
         for j in range(i + 1):
             # for j in range(3):
-            one_zeroth_arr[j][i] = evaluate_deriv_basis(
-                basis,
-                points,
-                orders_one_zeroth[j][i],
-                transform=transform,
-                deriv_type=deriv_type,
-            )
-            one_two_arr_1[j][i] = evaluate_deriv_basis(
-                basis,
-                points,
-                orders_one_two[j][j],
-                transform=transform,
-                deriv_type=deriv_type,
-            )
-            one_two_arr_2[j][i] = evaluate_deriv_basis(
-                basis,
-                points,
-                orders_one_two[j][i],
-                transform=transform,
-                deriv_type=deriv_type,
-            )
+            one_zeroth_arr[j][i] = deriv_cache.evaluate(orders_one_zeroth[j][i])
+            one_two_arr_1[j][i] = deriv_cache.evaluate(orders_one_two[j][j])
+            one_two_arr_2[j][i] = deriv_cache.evaluate(orders_one_two[j][i])
 
     # double orders-zeroth density
     raw_density_1 = np.tensordot(one_zeroth_arr, one_density_matrix, (2, 1))
@@ -554,6 +668,7 @@ def evaluate_density_hessian(
     return output.T + upp
 
 
+@chunked_points()
 def evaluate_posdef_kinetic_energy_density(
     one_density_matrix,
     basis,
@@ -561,6 +676,9 @@ def evaluate_posdef_kinetic_energy_density(
     transform=None,
     deriv_type="general",
     threshold=1.0e-8,
+    deriv_cache=None,
+    chunk_size=None,
+    n_workers=None,
 ):
     r"""Return evaluations of positive definite kinetic energy density at the given points.
 
@@ -602,6 +720,20 @@ def evaluate_posdef_kinetic_energy_density(
     threshold : float, optional
         The absolute value below which negative density values are acceptable. Any negative density
         value with an absolute value smaller than this threshold will be set to zero.
+    deriv_cache : DerivBasisCache, optional
+        Cache of the derivatives of the basis functions that can be shared between several density
+        functions evaluated on the same points. It must have been created with the same `basis`,
+        `points`, `transform`, and `deriv_type`.
+        Default creates a cache that is only used within this call.
+    chunk_size : int, optional
+        Maximum number of points that are evaluated at once (see `gbasis.utils.chunked_points`).
+        Cannot be used together with `deriv_cache`.
+        Default evaluates all points at once.
+    n_workers : int, optional
+        Number of threads that evaluate blocks of points concurrently (see
+        `gbasis.utils.chunked_points`).
+        Cannot be used together with `deriv_cache`.
+        Default evaluates all blocks in the calling thread.
 
     Returns
     -------
@@ -611,6 +743,7 @@ def evaluate_posdef_kinetic_energy_density(
 
     """
     output = np.zeros(points.shape[0])
+    deriv_cache = _get_deriv_cache(basis, points, transform, deriv_type, deriv_cache)
     for orders in np.identity(3, dtype=int):
         output += evaluate_deriv_reduced_density_matrix(
             orders,
@@ -620,6 +753,7 @@ def evaluate_posdef_kinetic_energy_density(
             points,
             transform=transform,
             deriv_type=deriv_type,
+            deriv_cache=deriv_cache,
         )
     # Fix #117: check magnitude of small negative density values, then use clip to remove them
     min_output = np.min(output)
@@ -629,6 +763,7 @@ def evaluate_posdef_kinetic_energy_density(
 
 
 # TODO: test against a reference
+@chunked_points()
 def evaluate_general_kinetic_energy_density(
     one_density_matrix,
     basis,
@@ -636,6 +771,9 @@ def evaluate_general_kinetic_energy_density(
     alpha,
     transform=None,
     deriv_type="general",
+    deriv_cache=None,
+    chunk_size=None,
+    n_workers=None,
 ):
     r"""Return evaluations of general form of the kinetic energy density at the given points.
 
@@ -671,6 +809,20 @@ def evaluate_general_kinetic_energy_density(
         to general implementation of any order derivative function (_eval_deriv_contractions())
         and "direct" makes reference to specific implementation of first and second order
         derivatives for generalized contraction (_eval_first_second_order_deriv_contractions()).
+    deriv_cache : DerivBasisCache, optional
+        Cache of the derivatives of the basis functions that can be shared between several density
+        functions evaluated on the same points. It must have been created with the same `basis`,
+        `points`, `transform`, and `deriv_type`.
+        Default creates a cache that is only used within this call.
+    chunk_size : int, optional
+        Maximum number of points that are evaluated at once (see `gbasis.utils.chunked_points`).
+        Cannot be used together with `deriv_cache`.
+        Default evaluates all points at once.
+    n_workers : int, optional
+        Number of threads that evaluate blocks of points concurrently (see
+        `gbasis.utils.chunked_points`).
+        Cannot be used together with `deriv_cache`.
+        Default evaluates all blocks in the calling thread.
 
     Returns
     -------
@@ -687,15 +839,22 @@ def evaluate_general_kinetic_energy_density(
     if not isinstance(alpha, (int, float)):
         raise TypeError("`alpha` must be an int or float.")
 
+    deriv_cache = _get_deriv_cache(basis, points, transform, deriv_type, deriv_cache)
     general_kinetic_energy_density = evaluate_posdef_kinetic_energy_density(
         one_density_matrix,
         basis,
         points,
         transform=transform,
         deriv_type=deriv_type,
+        deriv_cache=deriv_cache,
     )
     if alpha != 0:
         general_kinetic_energy_density += alpha * evaluate_density_laplacian(
-            one_density_matrix, basis, points, transform=transform, deriv_type=deriv_type
+            one_density_matrix,
+            basis,
+            points,
+            transform=transform,
+            deriv_type=deriv_type,
+            deriv_cache=deriv_cache,
         )
     return general_kinetic_energy_density
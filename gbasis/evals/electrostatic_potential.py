@@ -1,6 +1,18 @@
 """Module for computing electrostatic potential integrals."""
-from gbasis.integrals.point_charge import point_charge_integral
+from gbasis.integrals.moment import Moment
+from gbasis.integrals.point_charge import PointChargeIntegral
+from gbasis.spherical import generate_transformation
+from gbasis.utils import evaluate_by_chunks
 import numpy as np
+from scipy.special import factorial
+
+FAR_FIELD_EXTRA_ORDER = 4
+"""int: Number of orders added to the multipole expansion of the shell pairs on different centers.
+
+The multipole expansion of a shell pair whose primitive products all share the same center is
+exact, up to the penetration of the charge distribution, at the order of the sum of the angular
+momenta of the two shells. Otherwise, higher orders are needed to account for the spread of the
+centers of the primitive products."""
 
 
 def electrostatic_potential(
@@ -11,9 +23,19 @@ def electrostatic_potential(
     nuclear_charges,
     transform=None,
     threshold_dist=0.0,
+    chunk_size=None,
+    n_workers=None,
+    screen_tol=None,
+    far_field_tol=None,
 ):
     r"""Return the electrostatic potentials of the basis set in the Cartesian form.
 
+    The Hartree potential of the electrons is built one shell pair at a time: the point charge
+    integrals of each shell pair are contracted with the corresponding block of the density matrix
+    as soon as they are evaluated. Only the integrals of one shell pair are kept in memory at a
+    time, so the memory scales as :math:`\mathcal{O}(N + K^2)` rather than
+    :math:`\mathcal{O}(N K^2)`.
+
     Parameters
     ----------
     basis : list/tuple of GeneralizedContractionShell
@@ -44,6 +66,28 @@ def electrostatic_potential(
         value. i.e. nuclei that are closer to the point than the threshold are discarded when
         computing the electrostatic potential of the point.
         Default value is 0.0, i.e. no nuclei are discarded.
+    chunk_size : int, optional
+        Maximum number of points that are evaluated at once. The points are processed in blocks of
+        this size, which bounds the size of the point charge integrals of a shell pair kept in
+        memory.
+        Default evaluates all points at once.
+    n_workers : int, optional
+        Number of threads that evaluate blocks of points concurrently. If `chunk_size` is not
+        given, the points are split evenly between the threads.
+        Default evaluates all blocks in the calling thread.
+    screen_tol : float, optional
+        Tolerance for skipping the shell pairs whose block of the density matrix is negligible.
+        The integrals of a shell pair are not computed if none of the elements of its block of
+        the density matrix (in terms of the contractions) is larger than `screen_tol` in magnitude.
+        Default does not skip any shell pair.
+    far_field_tol : float, optional
+        Tolerance for the relative error of the electronic potential at the points that are far
+        from the shell pairs. The potential of a shell pair is evaluated from its multipole moments
+        (see `_shell_pair_multipoles`) at the points that are farther from the center of the shell
+        pair than a radius chosen such that the estimated errors of all shell pairs add up to less
+        than `far_field_tol` times the potential of the total electronic charge. The exact integrals
+        are only evaluated at the points within this radius.
+        Default evaluates the exact integrals at all points.
 
     Returns
     -------
@@ -62,6 +106,7 @@ def electrostatic_potential(
         If number of rows in `nuclear_coords` is not equal to the number of elements in
         `nuclear_charges`.
         If `threshold_dist` is less than 0.
+        If `far_field_tol` is not between 0 and 1.
 
     """
     # pylint: disable=R0912
@@ -92,6 +137,8 @@ def electrostatic_potential(
         raise TypeError("`threshold_dist` must be an integer or float.")
     if threshold_dist < 0:
         raise ValueError("`threshold_dist` must be greater than or equal to zero.")
+    if far_field_tol is not None and not 0 < far_field_tol < 1:
+        raise ValueError("`far_field_tol` must be greater than zero and less than one.")
 
     coord_type = [ct for ct in [shell.coord_type for shell in basis]]
 
@@ -125,11 +172,278 @@ def electrostatic_potential(
         raise TypeError(
             "`coord_type` must be a list/tuple of the strings 'spherical' or 'cartesian'."
         )
-    hartree_potential = point_charge_integral(
-        basis, points, -np.ones(points.shape[0]), transform=transform
+
+    if transform is not None:
+        one_density_matrix = transform.T.dot(one_density_matrix).dot(transform)
+    pair_densities = _shell_pair_densities(basis, coord_type, one_density_matrix, screen_tol)
+    if far_field_tol is not None:
+        pair_multipoles = _shell_pair_multipoles(basis, pair_densities, far_field_tol)
+    else:
+        pair_multipoles = None
+    return evaluate_by_chunks(
+        lambda pts: _electrostatic_potential(
+            basis,
+            pair_densities,
+            pair_multipoles,
+            pts,
+            nuclear_coords,
+            nuclear_charges,
+            threshold_dist,
+        ),
+        points,
+        chunk_size,
+        n_workers=n_workers,
     )
-    hartree_potential *= one_density_matrix[:, :, None]
-    hartree_potential = np.sum(hartree_potential, axis=(0, 1))
+
+
+def _shell_pair_densities(basis, coord_types, one_density_matrix, screen_tol=None):
+    """Return the blocks of the density matrix of each shell pair in terms of Cartesian Gaussians.
+
+    The blocks are expressed in terms of the normalized Cartesian contractions, i.e. in the same
+    basis as the output of `PointChargeIntegral.construct_array_contraction`, such that they can be
+    contracted with the integrals of the shell pair directly.
+
+    Parameters
+    ----------
+    basis : list/tuple of GeneralizedContractionShell
+        Shells of generalized contractions.
+    coord_types : list/tuple of str
+        Coordinate system ("cartesian" or "spherical") of each shell.
+    one_density_matrix : np.ndarray(K_cont, K_cont)
+        Symmetric one-electron density matrix in terms of the contractions.
+    screen_tol : float, optional
+        Tolerance for skipping the shell pairs whose block of the density matrix is negligible.
+        Default does not skip any shell pair.
+
+    Returns
+    -------
+    pair_densities : list of 3-tuple of (int, int, np.ndarray(M_1, L_cart_1, M_2, L_cart_2))
+        Indices of the two shells, with the first index smaller than or equal to the second, and
+        the block of the density matrix of the shell pair. The blocks of the off-diagonal shell
+        pairs are multiplied by two to account for the symmetric pair.
+
+    """
+    # transformations from the normalized Cartesian contractions to the contractions of each shell
+    shell_transforms = []
+    for shell, coord_type in zip(basis, coord_types):
+        if coord_type == "spherical":
+            transform = generate_transformation(
+                shell.angmom, shell.angmom_components_cart, shell.angmom_components_sph, "left"
+            )
+        else:
+            transform = np.identity(shell.num_cart)
+        shell_transforms.append(transform[None, :, :] * shell.norm_cont[:, None, :])
+    sizes = [transform.shape[0] * transform.shape[1] for transform in shell_transforms]
+    starts = np.cumsum([0] + sizes)
+
+    pair_densities = []
+    for i, transform_one in enumerate(shell_transforms):
+        for j, transform_two in enumerate(shell_transforms[i:], i):
+            density = one_density_matrix[starts[i] : starts[i + 1], starts[j] : starts[j + 1]]
+            if screen_tol is not None and np.all(np.abs(density) <= screen_tol):
+                continue
+            density = density.reshape(*transform_one.shape[:2], *transform_two.shape[:2])
+            density = np.einsum("mpa,mpnq,nqb->manb", transform_one, density, transform_two)
+            pair_densities.append((i, j, density if i == j else 2 * density))
+    return pair_densities
+
+
+def _shell_pair_multipoles(basis, pair_densities, far_field_tol):
+    r"""Return the multipole expansions of the charge distributions of the shell pairs.
+
+    The charge distribution of a shell pair, :math:`\rho_{ij}(\mathbf{r}) = \sum_{a \in i}
+    \sum_{b \in j} D_{ab} \phi_a(\mathbf{r}) \phi_b(\mathbf{r})`, is expanded about the
+    center of the product of its most diffuse primitives, :math:`\mathbf{P}`, such that its
+    potential at a point :math:`\mathbf{C}` far from the distribution is
+
+    .. math::
+
+        \int \frac{\rho_{ij}(\mathbf{r})}{|\mathbf{r} - \mathbf{C}|} d\mathbf{r}
+        \approx \sum_{\alpha} \frac{(-1)^{|\alpha|}}{\alpha!} M_\alpha
+        \partial^\alpha \frac{1}{|\mathbf{R}|}
+
+    where :math:`\mathbf{R} = \mathbf{C} - \mathbf{P}` and :math:`M_\alpha` are the Cartesian
+    moments of :math:`\rho_{ij}` about :math:`\mathbf{P}`, obtained from the moment integrals.
+
+    The expansion is used at the points farther than a radius from :math:`\mathbf{P}`. The error
+    budget, `far_field_tol` times the total charge, is shared between the shell pairs in proportion
+    to an upper bound of their absolute charge, :math:`\sum_{ab} |D_{ab}|`, such that the errors of
+    all shell pairs add up to less than `far_field_tol` relative to the total potential. The radius
+    of each shell pair is the larger of two estimates for its share, :math:`\epsilon`. The first
+    bounds the penetration of the distribution, which decays as
+    :math:`(2 p R^2)^{L / 2} e^{-p R^2}` for the smallest exponent sum of the primitive products,
+    :math:`p`, and the sum of the angular momenta, :math:`L`, beyond the spread of the centers of
+    the primitive products, :math:`d`. The second bounds the truncation of the expansion, which
+    decays as :math:`(d / R)^{n + 1}` for `FAR_FIELD_EXTRA_ORDER` orders, :math:`n`, beyond
+    :math:`L`.
+
+    Parameters
+    ----------
+    basis : list/tuple of GeneralizedContractionShell
+        Shells of generalized contractions.
+    pair_densities : list of 3-tuple of (int, int, np.ndarray(M_1, L_cart_1, M_2, L_cart_2))
+        Blocks of the density matrix of the shell pairs, as returned by `_shell_pair_densities`.
+    far_field_tol : float
+        Tolerance for the error of the multipole expansions relative to the total potential.
+
+    Returns
+    -------
+    pair_multipoles : list of 4-tuple of (np.ndarray(3,), float, np.ndarray(D, 3), np.ndarray(D,))
+        Center of the expansion, radius beyond which the expansion is used, orders of the
+        derivatives of :math:`1 / |\mathbf{R}|`, and their coefficients in the expansion of each
+        shell pair in `pair_densities`.
+
+    """
+    expansions = []
+    extents = []
+    abs_charge = 0
+    for i, j, density in pair_densities:
+        cont_one, cont_two = basis[i], basis[j]
+        exps_sum = cont_one.exps[:, None] + cont_two.exps[None, :]
+        centers = (
+            cont_one.exps[:, None, None] * cont_one.coord
+            + cont_two.exps[None, :, None] * cont_two.coord
+        ) / exps_sum[:, :, None]
+        center = centers[np.unravel_index(np.argmin(exps_sum), exps_sum.shape)]
+        spread = np.max(np.linalg.norm(centers - center, axis=2))
+
+        angmom = cont_one.angmom + cont_two.angmom
+        order = angmom + FAR_FIELD_EXTRA_ORDER if spread > 0 else angmom
+        orders = np.array(
+            [
+                (order_x, order_y, total - order_x - order_y)
+                for total in range(order + 1)
+                for order_x in range(total, -1, -1)
+                for order_y in range(total - order_x, -1, -1)
+            ],
+            dtype=int,
+        )
+        moments = np.tensordot(
+            density, Moment.construct_array_contraction(cont_one, cont_two, center, orders), 4
+        )
+        coeffs = moments * (-1) ** np.sum(orders, axis=1) / np.prod(factorial(orders), axis=1)
+        expansions.append((center, orders, coeffs))
+        extents.append((spread, np.min(exps_sum), angmom))
+        # the contractions are normalized, so the magnitude of the product of two contractions
+        # integrates to at most one
+        abs_charge += np.sum(np.abs(density))
+
+    # the tolerance of each shell pair is relative to its absolute charge, such that the errors of
+    # all shell pairs add up to less than `far_field_tol` relative to the total charge
+    charge = sum(coeffs[0] for *_, coeffs in expansions)
+    pair_tol = far_field_tol * abs(charge) / abs_charge if abs_charge > 0 else 0.0
+
+    pair_multipoles = []
+    for (center, orders, coeffs), (spread, exp_min, angmom) in zip(expansions, extents):
+        if pair_tol == 0:
+            pair_multipoles.append((center, np.inf, orders, coeffs))
+            continue
+        # the largest root of (2 p R^2)^(L / 2) exp(-p R^2) = pair_tol is found with the
+        # fixed-point iteration p R^2 = -log(pair_tol) + L / 2 log(2 p R^2)
+        dist_sq = -np.log(pair_tol)
+        for _ in range(100):
+            new_dist_sq = -np.log(pair_tol) + angmom / 2 * np.log(2 * dist_sq)
+            if np.isclose(new_dist_sq, dist_sq, rtol=1e-12, atol=0):
+                dist_sq = new_dist_sq
+                break
+            dist_sq = new_dist_sq
+        radius = spread + np.sqrt(dist_sq / exp_min)
+        if spread > 0:
+            radius = max(radius, spread * pair_tol ** (-1 / (FAR_FIELD_EXTRA_ORDER + 1)))
+        pair_multipoles.append((center, radius, orders, coeffs))
+    return pair_multipoles
+
+
+def _coulomb_derivatives(rel_coords, orders):
+    r"""Return the derivatives of the Coulomb potential of a unit point charge.
+
+    The derivatives, :math:`\partial_x^t \partial_y^u \partial_z^v |\mathbf{R}|^{-1}`, are
+    obtained with the recursion of McMurchie and Davidson for the auxiliary integrals,
+    :math:`R^{(n)}_{tuv}`, in the limit of a point charge distribution:
+
+    .. math::
+
+        R^{(n)}_{000} &= (-1)^n (2n - 1)!! |\mathbf{R}|^{-(2n + 1)}\\
+        R^{(n)}_{t+1,u,v} &= t R^{(n + 1)}_{t-1,u,v} + X R^{(n + 1)}_{tuv}
+
+    and likewise for the :math:`y` and :math:`z` components.
+
+    Parameters
+    ----------
+    rel_coords : np.ndarray(N, 3)
+        Coordinates of the points relative to the charge.
+    orders : np.ndarray(D, 3)
+        Orders of the derivatives along each dimension (x, y, z).
+
+    Returns
+    -------
+    derivs : np.ndarray(D, N)
+        Derivatives of the Coulomb potential for each of the given orders at each point.
+
+    """
+    order_max = int(np.max(np.sum(orders, axis=1)))
+    inv_dist_sq = 1 / np.sum(rel_coords**2, axis=1)
+    # R^(n)_000 for all n
+    base = [np.sqrt(inv_dist_sq)]
+    for n in range(order_max):
+        base.append(-(2 * n + 1) * inv_dist_sq * base[-1])
+
+    # R^(n) for all (t, u, v) with t + u + v <= order_max - n, from n = order_max down to 0
+    prev = {(0, 0, 0): base[order_max]}
+    for n in range(order_max - 1, -1, -1):
+        curr = {}
+        for total in range(order_max - n + 1):
+            for t in range(total, -1, -1):
+                for u in range(total - t, -1, -1):
+                    v = total - t - u
+                    if t > 0:
+                        value = rel_coords[:, 0] * prev[(t - 1, u, v)]
+                        if t > 1:
+                            value = value + (t - 1) * prev[(t - 2, u, v)]
+                    elif u > 0:
+                        value = rel_coords[:, 1] * prev[(t, u - 1, v)]
+                        if u > 1:
+                            value = value + (u - 1) * prev[(t, u - 2, v)]
+                    elif v > 0:
+                        value = rel_coords[:, 2] * prev[(t, u, v - 1)]
+                        if v > 1:
+                            value = value + (v - 1) * prev[(t, u, v - 2)]
+                    else:
+                        value = base[n]
+                    curr[(t, u, v)] = value
+        prev = curr
+    return np.array([prev[tuple(order)] for order in orders])
+
+
+def _electrostatic_potential(
+    basis, pair_densities, pair_multipoles, points, nuclear_coords, nuclear_charges, threshold_dist
+):
+    """Return the electrostatic potential at the given points without checking the inputs.
+
+    See `electrostatic_potential` for details on the parameters, `_shell_pair_densities` for
+    details on `pair_densities`, and `_shell_pair_multipoles` for details on `pair_multipoles`.
+
+    """
+    hartree_potential = np.zeros(points.shape[0])
+    unit_charges = -np.ones(points.shape[0])
+    for pair_ind, (i, j, density) in enumerate(pair_densities):
+        if pair_multipoles is None:
+            is_near = slice(None)
+        else:
+            center, radius, orders, coeffs = pair_multipoles[pair_ind]
+            rel_coords = points - center
+            is_far = np.sum(rel_coords**2, axis=1) > radius**2
+            if np.any(is_far):
+                hartree_potential[is_far] += coeffs.dot(
+                    _coulomb_derivatives(rel_coords[is_far], orders)
+                )
+            is_near = ~is_far
+            if not np.any(is_near):
+                continue
+        block = PointChargeIntegral.construct_array_contraction(
+            basis[i], basis[j], points[is_near], unit_charges[is_near]
+        )
+        hartree_potential[is_near] += np.tensordot(density, block, 4)
 
     # silence warning for dividing by zero
     old_settings = np.seterr(divide="ignore")
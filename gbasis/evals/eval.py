@@ -2,6 +2,7 @@
 from gbasis.base_one import BaseOneIndex
 from gbasis.contractions import GeneralizedContractionShell
 from gbasis.evals._deriv import _eval_deriv_contractions
+from gbasis.utils import evaluate_by_chunks
 import numpy as np
 
 
@@ -53,7 +54,7 @@ class Eval(BaseOneIndex):
     """
 
     @staticmethod
-    def construct_array_contraction(contractions, points):
+    def construct_array_contraction(contractions, points, tol_screen=None):
         r"""Return the evaluations of the given contractions at the given coordinates.
 
         Parameters
@@ -66,6 +67,12 @@ class Eval(BaseOneIndex):
             functions are evaluated.
             Rows correspond to the points and columns correspond to the :math:`x, y, \text{and} z`
             components.
+        tol_screen : float, optional
+            Tolerance used to screen the contractions spatially. The contractions are only
+            evaluated at the points that are within the extent of the shell (see
+            `compute_shell_extent`) and are set to zero elsewhere. If none of the points are within
+            the bounding box of the points, the contractions are not evaluated at all.
+            Default does not screen the contractions.
 
         Returns
         -------
@@ -100,18 +107,109 @@ class Eval(BaseOneIndex):
                 "`points` must be given as a two-dimensional `numpy` array with 3 columns."
             )
 
+        center = contractions.coord
+        if tol_screen is not None:
+            output = np.zeros((contractions.num_seg_cont, contractions.num_cart, points.shape[0]))
+            extent = compute_shell_extent(contractions, tol_screen)
+            # distance between the center and the bounding box of the points
+            box_dist = np.maximum(
+                0, np.maximum(np.min(points, axis=0) - center, center - np.max(points, axis=0))
+            )
+            if np.linalg.norm(box_dist) > extent:
+                return output
+            mask = np.sum((points - center) ** 2, axis=1) <= extent**2
+            if not np.any(mask):
+                return output
+
         alphas = contractions.exps
         prim_coeffs = contractions.coeffs
         angmom_comps = contractions.angmom_components_cart
-        center = contractions.coord
         norm_prim_cart = contractions.norm_prim_cart
-        output = _eval_deriv_contractions(
-            points, np.zeros(3), center, angmom_comps, alphas, prim_coeffs, norm_prim_cart
+        if tol_screen is None:
+            return _eval_deriv_contractions(
+                points, np.zeros(3), center, angmom_comps, alphas, prim_coeffs, norm_prim_cart
+            )
+        output[:, :, mask] = _eval_deriv_contractions(
+            points[mask], np.zeros(3), center, angmom_comps, alphas, prim_coeffs, norm_prim_cart
         )
         return output
 
 
-def evaluate_basis(basis, points, transform=None):
+def compute_shell_extent(contractions, tol):
+    r"""Return the radius beyond which the contractions of a shell are smaller than the tolerance.
+
+    The absolute value of each normalized Cartesian contraction is bounded by
+
+    .. math::
+
+        |\phi(\mathbf{r})| \leq \sum_i c_i r^\ell e^{-\alpha_i r^2}
+
+    where :math:`c_i` is the largest magnitude of the product of the contraction coefficient and
+    the normalization constants of the :math:`i`-th primitive and :math:`r` is the distance from
+    the center. The normalization constants of the primitives are bounded from above by
+    :math:`(2\alpha_i / \pi)^{3/4} (4\alpha_i)^{\ell/2}`, which avoids evaluating the double
+    factorials of each component. The extent is the largest radius at which any of the terms of
+    the sum is equal to :math:`\epsilon / K`, where :math:`K` is the number of primitives, such
+    that all of the contractions are smaller than :math:`\epsilon` beyond it.
+
+    Parameters
+    ----------
+    contractions : GeneralizedContractionShell
+        Contracted Cartesian Gaussians (of the same shell).
+    tol : float
+        Tolerance, :math:`\epsilon`, for the value of the contractions.
+
+    Returns
+    -------
+    extent : float
+        Radius (in atomic units) of the sphere around the center of the shell outside of which the
+        magnitudes of the contractions are smaller than `tol`.
+
+    Raises
+    ------
+    TypeError
+        If `contractions` is not a `GeneralizedContractionShell` instance.
+    ValueError
+        If `tol` is not positive.
+
+    """
+    if not isinstance(contractions, GeneralizedContractionShell):
+        raise TypeError("`contractions` must be a `GeneralizedContractionShell` instance.")
+    if not tol > 0:
+        raise ValueError("`tol` must be positive.")
+
+    angmom = contractions.angmom
+    alphas = contractions.exps
+    # largest prefactor of each primitive over the segmented contractions and the components
+    coeffs = np.max(
+        np.abs(contractions.coeffs) * np.max(np.abs(contractions.norm_cont), axis=1), axis=1
+    )
+    coeffs *= (2 * alphas / np.pi) ** (3 / 4) * (4 * alphas) ** (angmom / 2)
+    log_ratio = np.log(coeffs * alphas.size / tol)
+
+    # the terms decrease monotonically beyond the radius of their maximum, sqrt(l / 2a), so the
+    # largest root of c r^l exp(-a r^2) = tol / K is found with the fixed-point iteration
+    # r = sqrt((log(c K / tol) + l log(r)) / a) starting from the maximum
+    radius = np.sqrt(angmom / (2 * alphas))
+    if angmom > 0:
+        is_included = log_ratio + angmom * np.log(radius) - alphas * radius**2 > 0
+    else:
+        is_included = log_ratio > 0
+    if not np.any(is_included):
+        return 0.0
+    log_ratio = log_ratio[is_included]
+    alphas = alphas[is_included]
+    radius = radius[is_included]
+    for _ in range(100):
+        new_radius = np.sqrt((log_ratio + angmom * np.log(np.maximum(radius, 1e-300))) / alphas)
+        if np.allclose(new_radius, radius, rtol=1e-12, atol=0):
+            radius = new_radius
+            break
+        radius = new_radius
+    return float(np.max(radius))
+
+
+def evaluate_basis(basis, points, transform=None, chunk_size=None, tol_screen=None, n_workers=None):
     r"""Evaluate the basis set in the given coordinate system at the given points.
 
     Parameters
@@ -129,6 +227,23 @@ def evaluate_basis(basis, points, transform=None):
         Transformation is applied to the left, i.e. the sum is over the index 1 of `transform`
         and index 0 of the array for contractions.
         Default is no transformation.
+    chunk_size : int, optional
+        Maximum number of points that are evaluated at once. The points are processed in blocks of
+        this size and the results are written into a preallocated output array, which bounds the
+        size of the intermediate arrays.
+        Default evaluates all points at once.
+    tol_screen : float, optional
+        Tolerance used to screen the shells spatially. Within each block of points, a shell is only
+        evaluated at the points that are within its extent, i.e. the distance from its center
+        beyond which all of its contractions are smaller than `tol_screen`, and is set to zero
+        elsewhere. Shells whose extent does not reach the bounding box of the block are skipped.
+        Using `chunk_size` with points that are ordered in space (e.g. atomic grids) makes the
+        blocks compact, such that most shells are skipped for extended systems.
+        Default does not screen the shells.
+    n_workers : int, optional
+        Number of threads that evaluate blocks of points concurrently. If `chunk_size` is not
+        given, the points are split evenly between the threads.
+        Default evaluates all blocks in the calling thread.
 
     Returns
     -------
@@ -143,9 +258,31 @@ def evaluate_basis(basis, points, transform=None):
     coord_type = [ct for ct in [shell.coord_type for shell in basis]]
 
     if transform is not None:
-        return Eval(basis).construct_array_lincomb(transform, coord_type, points=points)
+        return evaluate_by_chunks(
+            lambda pts: Eval(basis).construct_array_lincomb(
+                transform, coord_type, points=pts, tol_screen=tol_screen
+            ),
+            points,
+            chunk_size,
+            n_workers=n_workers,
+        )
     if all(ct == "cartesian" for ct in coord_type):
-        return Eval(basis).construct_array_cartesian(points=points)
+        return evaluate_by_chunks(
+            lambda pts: Eval(basis).construct_array_cartesian(points=pts, tol_screen=tol_screen),
+            points,
+            chunk_size,
+            n_workers=n_workers,
+        )
     if all(ct == "spherical" for ct in coord_type):
-        return Eval(basis).construct_array_spherical(points=points)
-    return Eval(basis).construct_array_mix(coord_type, points=points)
+        return evaluate_by_chunks(
+            lambda pts: Eval(basis).construct_array_spherical(points=pts, tol_screen=tol_screen),
+            points,
+            chunk_size,
+            n_workers=n_workers,
+        )
+    return evaluate_by_chunks(
+        lambda pts: Eval(basis).construct_array_mix(coord_type, points=pts, tol_screen=tol_screen),
+        points,
+        chunk_size,
+        n_workers=n_workers,
+    )
@@ -1,8 +1,12 @@
 """Functions for evaluating Gaussian primitives."""
+from collections import OrderedDict
+
 from gbasis.base_one import BaseOneIndex
 from gbasis.contractions import GeneralizedContractionShell
 from gbasis.evals._deriv import _eval_deriv_contractions
 from gbasis.evals._deriv import _eval_first_second_order_deriv_contractions
+from gbasis.evals._deriv import _eval_zeroth_first_second_order_deriv_contractions
+from gbasis.utils import evaluate_by_chunks
 import numpy as np
 
 
@@ -144,6 +148,8 @@ def evaluate_deriv_basis(
     orders,
     transform=None,
     deriv_type="general",
+    chunk_size=None,
+    n_workers=None,
 ):
     r"""Evaluate the derivative of the basis set in the given coordinate system at the given points.
 
@@ -172,6 +178,15 @@ def evaluate_deriv_basis(
         to general implementation of any order derivative function (_eval_deriv_contractions())
         and "direct" makes reference to specific implementation of first and second order
         derivatives for generalized contraction (_eval_first_second_order_deriv_contractions()).
+    chunk_size : int, optional
+        Maximum number of points that are evaluated at once. The points are processed in blocks of
+        this size and the results are written into a preallocated output array, which bounds the
+        size of the intermediate arrays.
+        Default evaluates all points at once.
+    n_workers : int, optional
+        Number of threads that evaluate blocks of points concurrently. If `chunk_size` is not
+        given, the points are split evenly between the threads.
+        Default evaluates all blocks in the calling thread.
 
     Returns
     -------
@@ -186,17 +201,339 @@ def evaluate_deriv_basis(
     coord_type = [ct for ct in [shell.coord_type for shell in basis]]
 
     if transform is not None:
-        return EvalDeriv(basis).construct_array_lincomb(
-            transform, coord_type, points=points, orders=orders, deriv_type=deriv_type
+        return evaluate_by_chunks(
+            lambda pts: EvalDeriv(basis).construct_array_lincomb(
+                transform, coord_type, points=pts, orders=orders, deriv_type=deriv_type
+            ),
+            points,
+            chunk_size,
+            n_workers=n_workers,
         )
     if all(ct == "cartesian" for ct in coord_type) or coord_type == "cartesian":
-        return EvalDeriv(basis).construct_array_cartesian(
-            points=points, orders=orders, deriv_type=deriv_type
+        return evaluate_by_chunks(
+            lambda pts: EvalDeriv(basis).construct_array_cartesian(
+                points=pts, orders=orders, deriv_type=deriv_type
+            ),
+            points,
+            chunk_size,
+            n_workers=n_workers,
         )
     if all(ct == "spherical" for ct in coord_type) or coord_type == "spherical":
-        return EvalDeriv(basis).construct_array_spherical(
-            points=points, orders=orders, deriv_type=deriv_type
+        return evaluate_by_chunks(
+            lambda pts: EvalDeriv(basis).construct_array_spherical(
+                points=pts, orders=orders, deriv_type=deriv_type
+            ),
+            points,
+            chunk_size,
+            n_workers=n_workers,
         )
-    return EvalDeriv(basis).construct_array_mix(
-        coord_type, points=points, orders=orders, deriv_type=deriv_type
+    return evaluate_by_chunks(
+        lambda pts: EvalDeriv(basis).construct_array_mix(
+            coord_type, points=pts, orders=orders, deriv_type=deriv_type
+        ),
+        points,
+        chunk_size,
+        n_workers=n_workers,
     )
+
+
+class EvalDerivUpToSecond(BaseOneIndex):
+    """Class for evaluating Gaussian contractions together with their first and second derivatives.
+
+    Dimension 0 of the returned array is associated with a contracted Gaussian (or
+    a linear combination of a set of Gaussians). Dimension 1 is associated with the derivative,
+    ordered as :math:`(1, x, y, z, xx, xy, xz, yy, yz, zz)`.
+
+    Attributes
+    ----------
+    _axes_contractions : tuple of tuple of GeneralizedContractionShell
+        Contractions that are associated with each index of the array.
+        Each tuple of `GeneralizedContractionShell` corresponds to an index of the array.
+    contractions : tuple of GeneralizedContractionShell
+        Contractions that are associated with the first index of the array.
+        Property of `EvalDerivUpToSecond`.
+
+    Methods
+    -------
+    __init__(self, contractions)
+        Initialize.
+    construct_array_contraction(contraction, points) : np.ndarray(M, L_cart, 10, N)
+        Return the evaluations and derivatives of the given Cartesian contractions at the given
+        coordinates.
+        `M` is the number of segmented contractions with the same exponents (and angular
+        momentum).
+        `L_cart` is the number of Cartesian contractions for the given angular momentum.
+        `N` is the number of coordinates at which the contractions are evaluated.
+    construct_array_cartesian(self, points) : np.ndarray(K_cart, 10, N)
+        Return the evaluations and derivatives of the Cartesian contractions of the instance at the
+        given coordinates.
+        `K_cart` is the total number of Cartesian contractions within the instance.
+        `N` is the number of coordinates at which the contractions are evaluated.
+    construct_array_spherical(self, points) : np.ndarray(K_sph, 10, N)
+        Return the evaluations and derivatives of the spherical contractions of the instance at the
+        given coordinates.
+        `K_sph` is the total number of spherical contractions within the instance.
+        `N` is the number of coordinates at which the contractions are evaluated.
+    construct_array_mix(self, coord_types, points) : np.ndarray(K_cont, 10, N)
+        Return the array associated with all of the contraction in the given coordinate system.
+        `K_cont` is the total number of contractions within the given basis set.
+        `N` is the number of coordinates at which the contractions are evaluated.
+    construct_array_lincomb(self, transform, coord_type, points) : np.ndarray(K_orbs, 10, N)
+        Return the evaluations and derivatives of the linear combinations of contractions in the
+        given coordinate system.
+        `K_orbs` is the number of basis functions produced after the linear combinations.
+        `N` is the number of coordinates at which the contractions are evaluated.
+
+    """
+
+    @staticmethod
+    def construct_array_contraction(contractions, points):
+        r"""Return the evaluations and derivatives of the given contractions at the given points.
+
+        Parameters
+        ----------
+        contractions : GeneralizedContractionShell
+            Contracted Cartesian Gaussians (of the same shell) that will be used to construct an
+            array.
+        points : np.ndarray(N, 3)
+            Cartesian coordinates of the points in space (in atomic units) where the basis
+            functions are evaluated.
+            Rows correspond to the points and columns correspond to the :math:`x, y, \text{and} z`
+            components.
+
+        Returns
+        -------
+        array_contraction : np.ndarray(M, L_cart, 10, N)
+            Evaluations and derivatives of the given Cartesian contractions at the given points.
+            Dimension 0 corresponds to segmented contractions within the given generalized
+            contraction (same exponents and angular momentum, but different coefficients). `M` is
+            the number of segmented contractions with the same exponents (and angular momentum).
+            Dimension 1 corresponds to angular momentum vector. `L_cart` is the number of Cartesian
+            contractions for the given angular momentum.
+            Dimension 2 corresponds to the derivative, ordered as
+            :math:`(1, x, y, z, xx, xy, xz, yy, yz, zz)`.
+            Dimension 3 corresponds to coordinates at which the contractions are evaluated. `N` is
+            the number of coordinates at which the contractions are evaluated.
+
+        Raises
+        ------
+        TypeError
+            If contractions is not a `GeneralizedContractionShell` instance.
+            If points is not a two-dimensional `numpy` array with 3 columns.
+
+        """
+        if not isinstance(contractions, GeneralizedContractionShell):
+            raise TypeError("`contractions` must be a `GeneralizedContractionShell` instance.")
+        if not (isinstance(points, np.ndarray) and points.ndim == 2 and points.shape[1] == 3):
+            raise TypeError(
+                "`points` must be given as a two-dimensional `numpy` array with 3 columns."
+            )
+
+        alphas = contractions.exps
+        prim_coeffs = contractions.coeffs
+        angmom_comps = contractions.angmom_components_cart
+        center = contractions.coord
+        norm_prim_cart = contractions.norm_prim_cart
+        return _eval_zeroth_first_second_order_deriv_contractions(
+            points, center, angmom_comps, alphas, prim_coeffs, norm_prim_cart
+        )
+
+
+def evaluate_deriv_basis_up_to_second(
+    basis, points, transform=None, chunk_size=None, n_workers=None
+):
+    r"""Evaluate the basis set and all of its first and second derivatives at the given points.
+
+    All ten quantities are computed in a single pass over the contractions, such that the Gaussian
+    exponentials and the powers of the coordinates are evaluated only once.
+
+    Parameters
+    ----------
+    basis : list/tuple of GeneralizedContractionShell
+        Shells of generalized contractions.
+    points : np.ndarray(N, 3)
+        Cartesian coordinates of the points in space (in atomic units) where the basis functions
+        are evaluated.
+        Rows correspond to the points and columns correspond to the :math:`x, y, \text{and} z`
+        components.
+    transform : np.ndarray(K, K_cont)
+        Transformation matrix from the basis set in the given coordinate system (e.g. AO) to linear
+        combinations of contractions (e.g. MO).
+        Transformation is applied to the left, i.e. the sum is over the index 1 of `transform`
+        and index 0 of the array for contractions.
+        Default is no transformation.
+    chunk_size : int, optional
+        Maximum number of points that are evaluated at once. The points are processed in blocks of
+        this size and the results are written into a preallocated output array, which bounds the
+        size of the intermediate arrays.
+        Default evaluates all points at once.
+    n_workers : int, optional
+        Number of threads that evaluate blocks of points concurrently. If `chunk_size` is not
+        given, the points are split evenly between the threads.
+        Default evaluates all blocks in the calling thread.
+
+    Returns
+    -------
+    eval_array : np.ndarray(10, K, N)
+        Evaluations of the basis functions and their derivatives at the given points.
+        Dimension 0 corresponds to the derivative, ordered as
+        :math:`(1, x, y, z, xx, xy, xz, yy, yz, zz)`, i.e. the value, the gradient, and the upper
+        triangular part of the Hessian.
+        If keyword argument `transform` is provided, then the transformed basis functions will be
+        evaluated at the given points.
+        `K` is the total number of basis functions within the given basis set.
+        `N` is the number of coordinates at which the contractions are evaluated.
+
+    """
+    coord_type = [ct for ct in [shell.coord_type for shell in basis]]
+
+    if transform is not None:
+        array = evaluate_by_chunks(
+            lambda pts: EvalDerivUpToSecond(basis).construct_array_lincomb(
+                transform, coord_type, points=pts
+            ),
+            points,
+            chunk_size,
+            n_workers=n_workers,
+        )
+    elif all(ct == "cartesian" for ct in coord_type):
+        array = evaluate_by_chunks(
+            lambda pts: EvalDerivUpToSecond(basis).construct_array_cartesian(points=pts),
+            points,
+            chunk_size,
+            n_workers=n_workers,
+        )
+    elif all(ct == "spherical" for ct in coord_type):
+        array = evaluate_by_chunks(
+            lambda pts: EvalDerivUpToSecond(basis).construct_array_spherical(points=pts),
+            points,
+            chunk_size,
+            n_workers=n_workers,
+        )
+    else:
+        array = evaluate_by_chunks(
+            lambda pts: EvalDerivUpToSecond(basis).construct_array_mix(coord_type, points=pts),
+            points,
+            chunk_size,
+            n_workers=n_workers,
+        )
+    return np.swapaxes(array, 0, 1)
+
+
+class DerivBasisCache:
+    """Cache of the derivatives of a basis set evaluated at a fixed set of points.
+
+    Derivatives of the basis functions are evaluated (with `evaluate_deriv_basis`) the first time
+    that a given set of orders is requested, and the result is stored so that other density
+    functions that need the same orders can reuse it. At most `maxsize` evaluations are stored at
+    a time; the least recently used evaluation is discarded when this limit is exceeded.
+
+    Attributes
+    ----------
+    basis : list/tuple of GeneralizedContractionShell
+        Shells of generalized contractions.
+    points : np.ndarray(N, 3)
+        Cartesian coordinates of the points in space (in atomic units) where the basis functions
+        are evaluated.
+    transform : {np.ndarray(K, K_cont), None}
+        Transformation matrix from the basis set in the given coordinate system (e.g. AO) to linear
+        combinations of contractions (e.g. MO).
+    deriv_type : "general" or "direct"
+        Specification of derivative of contraction function in _deriv.py.
+        Orders greater than 2 are always evaluated with the "general" implementation.
+    maxsize : int
+        Maximum number of evaluations that are stored at a time.
+
+    Methods
+    -------
+    __init__(self, basis, points, transform=None, deriv_type="general", maxsize=10)
+        Initialize.
+    evaluate(self, orders) : np.ndarray(K, N)
+        Return the derivative of the basis functions of the given orders.
+    clear(self)
+        Discard all stored evaluations.
+
+    """
+
+    def __init__(self, basis, points, transform=None, deriv_type="general", maxsize=10):
+        """Initialize.
+
+        Parameters
+        ----------
+        basis : list/tuple of GeneralizedContractionShell
+            Shells of generalized contractions.
+        points : np.ndarray(N, 3)
+            Cartesian coordinates of the points in space (in atomic units) where the basis
+            functions are evaluated.
+        transform : np.ndarray(K, K_cont)
+            Transformation matrix from the basis set in the given coordinate system (e.g. AO) to
+            linear combinations of contractions (e.g. MO).
+            Default is no transformation.
+        deriv_type : "general" or "direct"
+            Specification of derivative of contraction function in _deriv.py.
+            Default is "general".
+        maxsize : int
+            Maximum number of evaluations that are stored at a time.
+            Default is 10, i.e. enough for all derivatives up to second order.
+
+        Raises
+        ------
+        TypeError
+            If `maxsize` is not an integer.
+        ValueError
+            If `maxsize` is not positive.
+
+        """
+        if not isinstance(maxsize, int):
+            raise TypeError("`maxsize` must be an integer.")
+        if maxsize <= 0:
+            raise ValueError("`maxsize` must be a positive integer.")
+        self.basis = basis
+        self.points = points
+        self.transform = transform
+        self.deriv_type = deriv_type
+        self.maxsize = maxsize
+        self._cache = OrderedDict()
+
+    def __len__(self):
+        """Return the number of stored evaluations."""
+        return len(self._cache)
+
+    def evaluate(self, orders):
+        """Return the derivative of the basis functions of the given orders.
+
+        Parameters
+        ----------
+        orders : np.ndarray(3,)
+            Orders of the derivative.
+
+        Returns
+        -------
+        eval_array : np.ndarray(K, N)
+            Evaluations of the derivative of the basis functions at the points of the cache.
+            Array is read-only since it is shared between all users of the cache.
+
+        """
+        key = tuple(int(order) for order in orders)
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key]
+
+        deriv_type = self.deriv_type if max(key) <= 2 else "general"
+        output = evaluate_deriv_basis(
+            self.basis,
+            self.points,
+            np.array(key, dtype=int),
+            transform=self.transform,
+            deriv_type=deriv_type,
+        )
+        output.flags.writeable = False
+
+        self._cache[key] = output
+        if len(self._cache) > self.maxsize:
+            self._cache.popitem(last=False)
+        return output
+
+    def clear(self):
+        """Discard all stored evaluations."""
+        self._cache.clear()
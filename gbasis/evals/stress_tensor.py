@@ -4,11 +4,24 @@ from gbasis.evals.density import (
     evaluate_deriv_density,
     evaluate_deriv_reduced_density_matrix,
 )
+from gbasis.evals.eval_deriv import DerivBasisCache
+from gbasis.utils import chunked_points
 import numpy as np
 
 
 # TODO: need to be tested against reference
-def evaluate_stress_tensor(one_density_matrix, basis, points, alpha=1, beta=0, transform=None):
+@chunked_points(axis=0)
+def evaluate_stress_tensor(
+    one_density_matrix,
+    basis,
+    points,
+    alpha=1,
+    beta=0,
+    transform=None,
+    deriv_cache=None,
+    chunk_size=None,
+    n_workers=None,
+):
     r"""Return the stress tensor evaluated at the given coordinates.
 
     Stress tensor is defined here as:
@@ -71,6 +84,20 @@ def evaluate_stress_tensor(one_density_matrix, basis, points, alpha=1, beta=0, t
     beta : {int, float}
         Second parameter of the stress tensor.
         Default value is 0.
+    deriv_cache : DerivBasisCache, optional
+        Cache of the derivatives of the basis functions that can be shared between several density
+        functions evaluated on the same points. It must have been created with the same `basis`,
+        `points`, and `transform`.
+        Default creates a cache that is only used within this call.
+    chunk_size : int, optional
+        Maximum number of points that are evaluated at once (see `gbasis.utils.chunked_points`).
+        Cannot be used together with `deriv_cache`.
+        Default evaluates all points at once.
+    n_workers : int, optional
+        Number of threads that evaluate blocks of points concurrently (see
+        `gbasis.utils.chunked_points`).
+        Cannot be used together with `deriv_cache`.
+        Default evaluates all blocks in the calling thread.
 
     Returns
     -------
@@ -88,6 +115,8 @@ def evaluate_stress_tensor(one_density_matrix, basis, points, alpha=1, beta=0, t
         raise TypeError("`alpha` must be an integer or a float.")
     if not isinstance(beta, (int, float)):
         raise TypeError("`beta` must be an integer or a float.")
+    if deriv_cache is None:
+        deriv_cache = DerivBasisCache(basis, points, transform=transform)
     output = np.zeros((3, 3, points.shape[0]))
     for i, orders_two in enumerate(np.identity(3, dtype=int)):
         for j, orders_one in enumerate(np.identity(3, dtype=int)[i:]):
@@ -100,6 +129,7 @@ def evaluate_stress_tensor(one_density_matrix, basis, points, alpha=1, beta=0, t
                     basis,
                     points,
                     transform=transform,
+                    deriv_cache=deriv_cache,
                 )
             if alpha != 1:
                 output[i, j] += (1 - alpha) * evaluate_deriv_reduced_density_matrix(
@@ -109,6 +139,7 @@ def evaluate_stress_tensor(one_density_matrix, basis, points, alpha=1, beta=0, t
                     basis,
                     points,
                     transform=transform,
+                    deriv_cache=deriv_cache,
                 )
             if i == j and beta != 0:
                 output[i, j] -= (
@@ -119,6 +150,7 @@ def evaluate_stress_tensor(one_density_matrix, basis, points, alpha=1, beta=0, t
                         basis,
                         points,
                         transform=transform,
+                        deriv_cache=deriv_cache,
                     )
                 )
             output[j, i] = output[i, j]
@@ -126,7 +158,18 @@ def evaluate_stress_tensor(one_density_matrix, basis, points, alpha=1, beta=0, t
 
 
 # TODO: need to be tested against reference
-def evaluate_ehrenfest_force(one_density_matrix, basis, points, alpha=1, beta=0, transform=None):
+@chunked_points(axis=0)
+def evaluate_ehrenfest_force(
+    one_density_matrix,
+    basis,
+    points,
+    alpha=1,
+    beta=0,
+    transform=None,
+    deriv_cache=None,
+    chunk_size=None,
+    n_workers=None,
+):
     r"""Return the Ehrenfest force.
 
     Ehrenfest force is the negative of the divergence of the stress tensor:
@@ -187,6 +230,20 @@ def evaluate_ehrenfest_force(one_density_matrix, basis, points, alpha=1, beta=0,
     beta : {int, float}
         Second parameter of the stress tensor.
         Default value is 0.
+    deriv_cache : DerivBasisCache, optional
+        Cache of the derivatives of the basis functions that can be shared between several density
+        functions evaluated on the same points. It must have been created with the same `basis`,
+        `points`, and `transform`.
+        Default creates a cache that is only used within this call.
+    chunk_size : int, optional
+        Maximum number of points that are evaluated at once (see `gbasis.utils.chunked_points`).
+        Cannot be used together with `deriv_cache`.
+        Default evaluates all points at once.
+    n_workers : int, optional
+        Number of threads that evaluate blocks of points concurrently (see
+        `gbasis.utils.chunked_points`).
+        Cannot be used together with `deriv_cache`.
+        Default evaluates all blocks in the calling thread.
 
     Returns
     -------
@@ -204,6 +261,8 @@ def evaluate_ehrenfest_force(one_density_matrix, basis, points, alpha=1, beta=0,
         raise TypeError("`alpha` must be an integer or a float.")
     if not isinstance(beta, (int, float)):
         raise TypeError("`beta` must be an integer or a float.")
+    if deriv_cache is None:
+        deriv_cache = DerivBasisCache(basis, points, transform=transform)
     output = np.zeros((3, points.shape[0]))
     for i, orders_two in enumerate(np.identity(3, dtype=int)):
         for orders_one in np.identity(3, dtype=int):
@@ -215,6 +274,7 @@ def evaluate_ehrenfest_force(one_density_matrix, basis, points, alpha=1, beta=0,
                     basis,
                     points,
                     transform=transform,
+                    deriv_cache=deriv_cache,
                 )
             if alpha != 1:
                 output[i] -= (1 - alpha) * evaluate_deriv_reduced_density_matrix(
@@ -224,6 +284,7 @@ def evaluate_ehrenfest_force(one_density_matrix, basis, points, alpha=1, beta=0,
                     basis,
                     points,
                     transform=transform,
+                    deriv_cache=deriv_cache,
                 )
             if alpha != 0.5:
                 output[i] -= (1 - 2 * alpha) * evaluate_deriv_reduced_density_matrix(
@@ -233,6 +294,7 @@ def evaluate_ehrenfest_force(one_density_matrix, basis, points, alpha=1, beta=0,
                     basis,
                     points,
                     transform=transform,
+                    deriv_cache=deriv_cache,
                 )
             if beta != 0:
                 output[i] += (
@@ -244,12 +306,14 @@ def evaluate_ehrenfest_force(one_density_matrix, basis, points, alpha=1, beta=0,
                         basis,
                         points,
                         transform=transform,
+                        deriv_cache=deriv_cache,
                     )
                 )
     return output.T
 
 
 # TODO: need to be tested against reference
+@chunked_points(axis=0)
 def evaluate_ehrenfest_hessian(
     one_density_matrix,
     basis,
@@ -258,6 +322,9 @@ def evaluate_ehrenfest_hessian(
     beta=0,
     transform=None,
     symmetric=False,
+    deriv_cache=None,
+    chunk_size=None,
+    n_workers=None,
 ):
     r"""Return the Ehrenfest Hessian.
 
@@ -333,6 +400,20 @@ def evaluate_ehrenfest_hessian(
         Flag for symmetrizing the Hessian.
         If True, then the Hessian is symmetrized by averaging it with its transpose.
         Default value is False.
+    deriv_cache : DerivBasisCache, optional
+        Cache of the derivatives of the basis functions that can be shared between several density
+        functions evaluated on the same points. It must have been created with the same `basis`,
+        `points`, and `transform`.
+        Default creates a cache that is only used within this call.
+    chunk_size : int, optional
+        Maximum number of points that are evaluated at once (see `gbasis.utils.chunked_points`).
+        Cannot be used together with `deriv_cache`.
+        Default evaluates all points at once.
+    n_workers : int, optional
+        Number of threads that evaluate blocks of points concurrently (see
+        `gbasis.utils.chunked_points`).
+        Cannot be used together with `deriv_cache`.
+        Default evaluates all blocks in the calling thread.
 
     Returns
     -------
@@ -351,6 +432,8 @@ def evaluate_ehrenfest_hessian(
         raise TypeError("`alpha` must be an integer or a float.")
     if not isinstance(beta, (int, float)):
         raise TypeError("`beta` must be an integer or a float.")
+    if deriv_cache is None:
+        deriv_cache = DerivBasisCache(basis, points, transform=transform)
     output = np.zeros((3, 3, points.shape[0]))
     for i, orders_two in enumerate(np.identity(3, dtype=int)):
         for j, orders_three in enumerate(np.identity(3, dtype=int)):
@@ -363,6 +446,7 @@ def evaluate_ehrenfest_hessian(
                         basis,
                         points,
                         transform=transform,
+                        deriv_cache=deriv_cache,
                     )
                     output[i, j] += alpha * evaluate_deriv_reduced_density_matrix(
                         2 * orders_one,
@@ -371,6 +455,7 @@ def evaluate_ehrenfest_hessian(
                         basis,
                         points,
                         transform=transform,
+                        deriv_cache=deriv_cache,
                     )
                 if alpha != 1:
                     output[i, j] -= (1 - alpha) * evaluate_deriv_reduced_density_matrix(
@@ -380,6 +465,7 @@ def evaluate_ehrenfest_hessian(
                         basis,
                         points,
                         transform=transform,
+                        deriv_cache=deriv_cache,
                     )
                     output[i, j] -= (1 - alpha) * evaluate_deriv_reduced_density_matrix(
                         2 * orders_one + orders_two,
@@ -388,6 +474,7 @@ def evaluate_ehrenfest_hessian(
                         basis,
                         points,
                         transform=transform,
+                        deriv_cache=deriv_cache,
                     )
                 if alpha != 0.5:
                     output[i, j] -= (1 - 2 * alpha) * evaluate_deriv_reduced_density_matrix(
@@ -397,6 +484,7 @@ def evaluate_ehrenfest_hessian(
                         basis,
                         points,
                         transform=transform,
+                        deriv_cache=deriv_cache,
                     )
                     output[i, j] -= (1 - 2 * alpha) * evaluate_deriv_reduced_density_matrix(
                         orders_one + orders_two,
@@ -405,6 +493,7 @@ def evaluate_ehrenfest_hessian(
                         basis,
                         points,
                         transform=transform,
+                        deriv_cache=deriv_cache,
                     )
                 if beta != 0:
                     output[i, j] += (
@@ -416,6 +505,7 @@ def evaluate_ehrenfest_hessian(
                             basis,
                             points,
                             transform=transform,
+                            deriv_cache=deriv_cache,
                         )
                     )
     if symmetric:
@@ -8,7 +8,7 @@ import numpy as np
 
 # FIXME: returns nan when exponent is zero
 def _compute_differential_operator_integrals_intermediate(
-    order_diff_max, coord_a, angmom_a_max, exps_a, coord_b, angmom_b_max, exps_b
+    order_diff_max, coord_a, angmom_a_max, exps_a, coord_b, angmom_b_max, exps_b, shell_pair=None
 ):
     r"""Return the intermediate integrals over differential operators of two contractions.
 
@@ -49,6 +49,11 @@ def _compute_differential_operator_integrals_intermediate(
         contraction (with the same exponents and angular momentum).
     norm_b : np.ndarray(L_b, K_b)
         Normalization constants for the primitives in each contraction on the right side.
+    shell_pair : ShellPair, optional
+        Precomputed quantities of the primitive pairs of the two contractions.
+        If given, `exps_a` and `exps_b` must be the exponents of the primitives kept in
+        `shell_pair`.
+        Default computes the quantities of the primitive pairs from the exponents.
 
     Returns
     -------
@@ -103,6 +108,7 @@ def _compute_differential_operator_integrals_intermediate(
         coord_b,
         angmom_b_max,
         exps_b,
+        shell_pair=shell_pair,
     )[0, :, :, :, :, :]
 
     # recurse over order of differentiation
@@ -138,6 +144,7 @@ def _compute_differential_operator_integrals(
     exps_b,
     coeffs_b,
     norm_b,
+    shell_pair=None,
 ):
     r"""Return the integrals over differential operators of two contractions.
 
@@ -180,6 +187,11 @@ def _compute_differential_operator_integrals(
         contraction (with the same exponents and angular momentum).
     norm_b : np.ndarray(L_b, K_b)
         Normalization constants for the primitives in each contraction on the right side.
+    shell_pair : ShellPair, optional
+        Precomputed quantities of the primitive pairs of the two contractions.
+        If given, the exponents, coefficients, and normalization constants must be those of the
+        primitives kept in `shell_pair`.
+        Default computes the quantities of the primitive pairs from the exponents.
 
     Returns
     -------
@@ -206,7 +218,14 @@ def _compute_differential_operator_integrals(
 
     """
     integrals = _compute_differential_operator_integrals_intermediate(
-        np.max(orders_diff), coord_a, np.max(angmoms_a), exps_a, coord_b, np.max(angmoms_b), exps_b
+        np.max(orders_diff),
+        coord_a,
+        np.max(angmoms_a),
+        exps_a,
+        coord_b,
+        np.max(angmoms_b),
+        exps_b,
+        shell_pair=shell_pair,
     )
 
     integrals = _cleanup_intermediate_integrals(
@@ -4,7 +4,15 @@ import numpy as np
 
 # FIXME: returns nan when exponent is zero
 def _compute_multipole_moment_integrals_intermediate(
-    coord_moment, order_moment_max, coord_a, angmom_a_max, exps_a, coord_b, angmom_b_max, exps_b
+    coord_moment,
+    order_moment_max,
+    coord_a,
+    angmom_a_max,
+    exps_a,
+    coord_b,
+    angmom_b_max,
+    exps_b,
+    shell_pair=None,
 ):
     r"""Return the intermediate multipole moment integrals of two contractions.
 
@@ -32,6 +40,11 @@ def _compute_multipole_moment_integrals_intermediate(
         From a set of angular momentum vectors, it should be the maximum angular momentum.
     exps_b : np.ndarray(K_b,)
         Values of the (square root of the) precisions of the primitives on the right side.
+    shell_pair : ShellPair, optional
+        Precomputed quantities of the primitive pairs of the two contractions.
+        If given, `exps_a` and `exps_b` must be the exponents of the primitives kept in
+        `shell_pair`.
+        Default computes the quantities of the primitive pairs from the exponents.
 
     Returns
     -------
@@ -64,21 +77,25 @@ def _compute_multipole_moment_integrals_intermediate(
     # NOTE: coeffs_a and coeffs_b are not flattened because tensordot will be used at the end where
     # the primitives are transformed to contractions
 
-    # sum of the exponents
-    exps_sum = exps_a + exps_b
-    # coordinate of the weighted average center
-    coord_wac = (exps_a * coord_a + exps_b * coord_b) / exps_sum
+    if shell_pair is None:
+        # sum of the exponents
+        exps_sum = exps_a + exps_b
+        # coordinate of the weighted average center
+        coord_wac = (exps_a * coord_a + exps_b * coord_b) / exps_sum
+        # harmonic mean
+        harm_mean = exps_a * exps_b / exps_sum
+        exp_coord = np.exp(-harm_mean * (coord_a - coord_b) ** 2)
+    else:
+        exps_sum = shell_pair.exps_sum[np.newaxis, np.newaxis, np.newaxis, np.newaxis, :, :]
+        coord_wac = shell_pair.coord_wac[np.newaxis, np.newaxis, np.newaxis, :, :, :]
+        exp_coord = shell_pair.exp_coord[np.newaxis, np.newaxis, np.newaxis, :, :, :]
     # relative distance from weighted average center
     rel_coord_a = coord_wac - coord_a
     rel_coord_b = coord_wac - coord_b
     rel_coord_moment = coord_wac - coord_moment
-    # harmonic mean
-    harm_mean = exps_a * exps_b / exps_sum
 
     # start of recursion
-    integrals[0, 0, 0, :, :, :] = np.sqrt(np.pi / exps_sum) * np.exp(
-        -harm_mean * (coord_a - coord_b) ** 2
-    )
+    integrals[0, 0, 0, :, :, :] = np.sqrt(np.pi / exps_sum) * exp_coord
 
     # recurse over angular momentum for a
     # NOTE: array is sliced to avoid an if statement for angmom_a_max > 0
@@ -253,6 +270,7 @@ def _compute_multipole_moment_integrals(
     exps_b,
     coeffs_b,
     norm_b,
+    shell_pair=None,
 ):
     r"""Return the multipole moment integrals of two contractions.
 
@@ -296,6 +314,11 @@ def _compute_multipole_moment_integrals(
         contraction (with the same exponents and angular momentum).
     norm_b : np.ndarray(L_b, K_b)
         Normalization constants for the primitives in each contraction on the right side.
+    shell_pair : ShellPair, optional
+        Precomputed quantities of the primitive pairs of the two contractions.
+        If given, the exponents, coefficients, and normalization constants must be those of the
+        primitives kept in `shell_pair`.
+        Default computes the quantities of the primitive pairs from the exponents.
 
     Returns
     -------
@@ -324,6 +347,7 @@ def _compute_multipole_moment_integrals(
         coord_b,
         np.max(angmoms_b),
         exps_b,
+        shell_pair=shell_pair,
     )
     integrals = _cleanup_intermediate_integrals(
         integrals, orders_moment, angmoms_a, coeffs_a, norm_a, angmoms_b, coeffs_b, norm_b
@@ -16,6 +16,8 @@ def _compute_one_elec_integrals(
     angmom_b,
     exps_b,
     coeffs_b,
+    points_charge=None,
+    shell_pair=None,
 ):
     r"""Return the one-electron integrals for a point charge interaction.
 
@@ -61,17 +63,29 @@ def _compute_one_elec_integrals(
         The coefficients always correspond to generalized contractions, i.e. two-dimensional array
         where dimension 0 corresponds to the primitive and dimension 1 corresponds to the
         contraction (with the same exponents and angular momentum).
+    points_charge : np.ndarray(N,), optional
+        Weights of the point charges.
+        If given, the integrals are summed over the point charges with these weights right after
+        the vertical recursion, such that the horizontal recursion is carried out only once and
+        the point charge axis of the returned array has size one.
+        Default does not sum over the point charges.
+    shell_pair : ShellPair, optional
+        Precomputed quantities of the primitive pairs of the two contractions.
+        If given, the exponents and coefficients must be those of the primitives kept in
+        `shell_pair`.
+        Default computes the quantities of the primitive pairs from the exponents.
 
     Returns
     -------
-    integrals : np.ndarray(L_a + 1, L_a + 1, L_a + 1, L_b + 1, L_b + 1, L_b + 1, M_a, M_b)
+    integrals : np.ndarray(L_a + 1, L_a + 1, L_a + 1, L_b + 1, L_b + 1, L_b + 1, N, M_a, M_b)
         One electron integrals for the given `GeneralizedContractionShell` instances.
         Dimensions 0, 1, and 2 correspond to the :math:`x, y, \text{and} z` components of the
         angular momentum for contraction a.
         Dimensions 3, 4, and 5 correspond to the :math:`x, y, \text{and} z` components of the
         angular momentum for contraction b.
-        Dimension 6 corresponds to the segmented contractions of contraction a.
-        Dimension 7 corresponds to the segmented contractions of contraction b.
+        Dimension 6 corresponds to the point charge. If `points_charge` is given, it has size one.
+        Dimension 7 corresponds to the segmented contractions of contraction a.
+        Dimension 8 corresponds to the segmented contractions of contraction b.
 
     """
 
@@ -102,16 +116,22 @@ def _compute_one_elec_integrals(
     exps_a = exps_a[np.newaxis, np.newaxis, np.newaxis, np.newaxis, :]
     exps_b = exps_b[np.newaxis, np.newaxis, np.newaxis, :, np.newaxis]
 
-    # sum of the exponents
-    exps_sum = exps_a + exps_b
-    # coordinate of the weighted average center
-    coord_wac = (exps_a * coord_a + exps_b * coord_b) / exps_sum
+    rel_dist = coord_a - coord_b  # R_ab
+    if shell_pair is None:
+        # sum of the exponents
+        exps_sum = exps_a + exps_b
+        # coordinate of the weighted average center
+        coord_wac = (exps_a * coord_a + exps_b * coord_b) / exps_sum
+        # harmonic mean
+        harm_mean = exps_a * exps_b / exps_sum
+        exp_dist = np.exp(-harm_mean.squeeze(axis=1) * (rel_dist**2).sum(axis=1))
+    else:
+        exps_sum = shell_pair.exps_sum[np.newaxis, np.newaxis, np.newaxis, :, :]
+        coord_wac = shell_pair.coord_wac[np.newaxis, :, np.newaxis, :, :]
+        exp_dist = shell_pair.exp_dist[np.newaxis, np.newaxis, :, :]
     # relative distance from weighted average center
     rel_coord_a = coord_wac - coord_a  # R_pa
-    rel_dist = coord_a - coord_b  # R_ab
     rel_coord_point = coord_wac - coord_point  # R_pc
-    # harmonic mean
-    harm_mean = exps_a * exps_b / exps_sum
 
     # Initialize V(m)(000|000) for all m
     integrals[:, 0, 0, 0, :, :, :] = (
@@ -120,7 +140,7 @@ def _compute_one_elec_integrals(
             np.arange(m_max)[:, None, None, None],
             (exps_sum.squeeze(axis=1) * np.sum(rel_coord_point**2, axis=1))[:, None, :, :],
         )
-        * np.exp(-harm_mean.squeeze(axis=1) * (rel_dist**2).sum(axis=1))
+        * exp_dist
     )
 
     # Vertical recursion for the first index
@@ -168,6 +188,9 @@ def _compute_one_elec_integrals(
 
     # Discard nonrelevant integrals
     integrals_cont = integrals[0, :, :, :, :, :, :]
+    # Sum over the point charges
+    if points_charge is not None:
+        integrals_cont = np.tensordot(integrals_cont, points_charge, (3, 0))[:, :, :, None]
     # Get normalization constants that correspond to the exponents (and the angular momentum)
     norm_a = (((2 * exps_a / np.pi) ** (3 / 4)) * ((4 * exps_a) ** (angmom_a / 2))).reshape(
         1, 1, 1, 1, 1, -1
@@ -197,7 +220,7 @@ def _compute_one_elec_integrals(
             m_max,
             m_max,
             m_max,
-            coords_points.shape[0],
+            integrals_cont.shape[3],
             coeffs_a.shape[1],
             coeffs_b.shape[1],
         )
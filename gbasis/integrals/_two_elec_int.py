@@ -5,6 +5,37 @@ from gbasis.utils import factorial2
 # pylint: disable=C0103,R0914,R0915
 
 
+def _norm_prim(exps, angmom):
+    r"""Return the largest normalization constants of the primitives with the given exponents.
+
+    .. math::
+
+        N(\alpha, \ell) = \left(\frac{2\alpha}{\pi}\right)^{3/4} (4\alpha)^{\ell/2}
+
+    The remaining factor, which depends on the angular momentum components, is applied after the
+    recursions.
+
+    Parameters
+    ----------
+    exps : np.ndarray
+        Exponents of the primitives.
+    angmom : int
+        Angular momentum of the primitives.
+
+    Returns
+    -------
+    norm : np.ndarray
+        Normalization constants of the primitives.
+        Primitives with an exponent of zero are constant functions, which cannot be normalized, and
+        are left unnormalized (i.e. the constant is one). This allows a constant function to be
+        paired with a contraction in place of a second contraction, e.g. for the three-center
+        integrals that are used in density fitting.
+
+    """
+    norm = (2 * exps / np.pi) ** (3 / 4) * (4 * exps) ** (angmom / 2)
+    return np.where(exps == 0, 1.0, norm)
+
+
 def _compute_two_elec_integrals_angmom_zero(
     boys_func,
     coord_a,
@@ -129,16 +160,16 @@ def _compute_two_elec_integrals_angmom_zero(
         * np.exp(-harm_mean_two * np.sum((coord_c - coord_d) ** 2, axis=0))
     )
 
-    norm_a = ((2 * exps_a / np.pi) ** (3 / 4)).reshape(1, 1, 1, -1)
+    norm_a = _norm_prim(exps_a, 0).reshape(1, 1, 1, -1)
     integrals = np.tensordot(integrals * norm_a, coeffs_a, (3, 0))
 
-    norm_c = ((2 * exps_c / np.pi) ** (3 / 4)).reshape(1, 1, -1, 1)
+    norm_c = _norm_prim(exps_c, 0).reshape(1, 1, -1, 1)
     integrals = np.tensordot(integrals * norm_c, coeffs_c, (2, 0))
 
-    norm_b = ((2 * exps_b / np.pi) ** (3 / 4)).reshape(1, -1, 1, 1)
+    norm_b = _norm_prim(exps_b, 0).reshape(1, -1, 1, 1)
     integrals = np.tensordot(integrals * norm_b, coeffs_b, (1, 0))
 
-    norm_d = ((2 * exps_d / np.pi) ** (3 / 4)).reshape(-1, 1, 1, 1)
+    norm_d = _norm_prim(exps_d, 0).reshape(-1, 1, 1, 1)
     integrals = np.tensordot(integrals * norm_d, coeffs_d, (0, 0))
 
     integrals = np.transpose(integrals, (0, 2, 1, 3))
@@ -526,24 +557,16 @@ def _compute_two_elec_integrals(
         )
 
     # Contract primitives (after normalizing)
-    norm_a = (((2 * exps_a / np.pi) ** (3 / 4)) * ((4 * exps_a) ** (angmom_a / 2))).reshape(
-        1, 1, 1, 1, 1, 1, 1, 1, 1, -1
-    )
+    norm_a = _norm_prim(exps_a, angmom_a).reshape(1, 1, 1, 1, 1, 1, 1, 1, 1, -1)
     integrals_cont = np.tensordot(integrals_etransf * norm_a, coeffs_a, (9, 0))
 
-    norm_c = (((2 * exps_c / np.pi) ** (3 / 4)) * ((4 * exps_c) ** (angmom_c / 2))).reshape(
-        1, 1, 1, 1, 1, 1, 1, 1, -1, 1
-    )
+    norm_c = _norm_prim(exps_c, angmom_c).reshape(1, 1, 1, 1, 1, 1, 1, 1, -1, 1)
     integrals_cont = np.tensordot(integrals_cont * norm_c, coeffs_c, (8, 0))
 
-    norm_b = (((2 * exps_b / np.pi) ** (3 / 4)) * ((4 * exps_b) ** (angmom_b / 2))).reshape(
-        1, 1, 1, 1, 1, 1, 1, -1, 1, 1
-    )
+    norm_b = _norm_prim(exps_b, angmom_b).reshape(1, 1, 1, 1, 1, 1, 1, -1, 1, 1)
     integrals_cont = np.tensordot(integrals_cont * norm_b, coeffs_b, (7, 0))
 
-    norm_d = (((2 * exps_d / np.pi) ** (3 / 4)) * ((4 * exps_d) ** (angmom_d / 2))).reshape(
-        1, 1, 1, 1, 1, 1, -1, 1, 1, 1
-    )
+    norm_d = _norm_prim(exps_d, angmom_d).reshape(1, 1, 1, 1, 1, 1, -1, 1, 1, 1)
     integrals_cont = np.tensordot(integrals_cont * norm_d, coeffs_d, (6, 0))
 
     # NOTE: Ordering convention for horizontal recursion of first and second indices of d
@@ -5,6 +5,7 @@ from gbasis.integrals._diff_operator_int import (
     _compute_differential_operator_integrals_intermediate,
 )
 from gbasis.integrals._moment_int import _compute_multipole_moment_integrals_intermediate
+from gbasis.integrals.shell_pair import shell_pair_primitives
 import numpy as np
 
 
@@ -24,7 +25,7 @@ class AngularMomentumIntegral(BaseTwoIndexSymmetric):
     -------
     __init__(self, contractions)
         Initialize.
-    construct_array_contraction(contractions_one, contractions_two) :
+    construct_array_contraction(contractions_one, contractions_two, shell_pairs=None) :
         **np.ndarray(M_1, L_cart_1, M_2, L_cart_2, 3)**
 
         Return the integral over the angular momentum operator associated with a
@@ -56,7 +57,7 @@ class AngularMomentumIntegral(BaseTwoIndexSymmetric):
     """
 
     @staticmethod
-    def construct_array_contraction(contractions_one, contractions_two):
+    def construct_array_contraction(contractions_one, contractions_two, shell_pairs=None):
         """Return the integrals over the angular momentum operator of the given contractions.
 
         Parameters
@@ -67,6 +68,10 @@ class AngularMomentumIntegral(BaseTwoIndexSymmetric):
         contractions_two : GeneralizedContractionShell
             Contracted Cartesian Gaussians (of the same shell) associated with the second index of
             the kinetic energy integral.
+        shell_pairs : ShellPairData, optional
+            Cache of the primitive-pair quantities that is shared with the other one-electron
+            integrals of the same basis set.
+            Default computes the primitive-pair quantities of the given contractions.
 
         Returns
         -------
@@ -99,24 +104,29 @@ class AngularMomentumIntegral(BaseTwoIndexSymmetric):
         if not isinstance(contractions_two, GeneralizedContractionShell):
             raise TypeError("`contractions_two` must be a `GeneralizedContractionShell` instance.")
 
+        exps_a, coeffs_a, norm_a, exps_b, coeffs_b, norm_b, shell_pair = shell_pair_primitives(
+            contractions_one, contractions_two, shell_pairs
+        )
         diff_integrals = _compute_differential_operator_integrals_intermediate(
             1,
             contractions_one.coord,
             np.max(contractions_one.angmom_components_cart),
-            contractions_one.exps,
+            exps_a,
             contractions_two.coord,
             np.max(contractions_two.angmom_components_cart),
-            contractions_two.exps,
+            exps_b,
+            shell_pair=shell_pair,
         )
         moment_integrals = _compute_multipole_moment_integrals_intermediate(
             np.zeros(3),
             1,
             contractions_one.coord,
             np.max(contractions_one.angmom_components_cart),
-            contractions_one.exps,
+            exps_a,
             contractions_two.coord,
             np.max(contractions_two.angmom_components_cart),
-            contractions_two.exps,
+            exps_b,
+            shell_pair=shell_pair,
         )
 
         angmoms_a = contractions_one.angmom_components_cart
@@ -148,15 +158,15 @@ class AngularMomentumIntegral(BaseTwoIndexSymmetric):
         )
 
         # normalize and contract
-        norm_a = contractions_one.norm_prim_cart[np.newaxis, np.newaxis, :, np.newaxis, :]
-        output = np.tensordot(output * norm_a, contractions_one.coeffs, (4, 0))
-        norm_b = contractions_two.norm_prim_cart[np.newaxis, :, np.newaxis, :, np.newaxis]
-        output = np.tensordot(output * norm_b, contractions_two.coeffs, (3, 0))
+        norm_a = norm_a[np.newaxis, np.newaxis, :, np.newaxis, :]
+        output = np.tensordot(output * norm_a, coeffs_a, (4, 0))
+        norm_b = norm_b[np.newaxis, :, np.newaxis, :, np.newaxis]
+        output = np.tensordot(output * norm_b, coeffs_b, (3, 0))
 
         return -1j * np.transpose(output, (3, 2, 4, 1, 0))
 
 
-def angular_momentum_integral(basis, transform=None):
+def angular_momentum_integral(basis, transform=None, shell_pairs=None):
     r"""Return the integral over :math:`hat{L}` of the given basis set.
 
     Parameters
@@ -169,6 +179,10 @@ def angular_momentum_integral(basis, transform=None):
         Transformation is applied to the left, i.e. the sum is over the index 1 of `transform`
         and index 0 of the array for contractions.
         Default is no transformation.
+    shell_pairs : ShellPairData, optional
+        Cache of the primitive-pair quantities of `basis` that is shared with the other one-electron
+        integrals of the same basis set.
+        Default computes the primitive-pair quantities from scratch.
 
     Returns
     -------
@@ -182,9 +196,11 @@ def angular_momentum_integral(basis, transform=None):
     coord_type = [ct for ct in [shell.coord_type for shell in basis]]
 
     if transform is not None:
-        return AngularMomentumIntegral(basis).construct_array_lincomb(transform, coord_type)
+        return AngularMomentumIntegral(basis).construct_array_lincomb(
+            transform, coord_type, shell_pairs=shell_pairs
+        )
     if all(ct == "cartesian" for ct in coord_type):
-        return AngularMomentumIntegral(basis).construct_array_cartesian()
+        return AngularMomentumIntegral(basis).construct_array_cartesian(shell_pairs=shell_pairs)
     if all(ct == "spherical" for ct in coord_type):
-        return AngularMomentumIntegral(basis).construct_array_spherical()
-    return AngularMomentumIntegral(basis).construct_array_mix(coord_type)
+        return AngularMomentumIntegral(basis).construct_array_spherical(shell_pairs=shell_pairs)
+    return AngularMomentumIntegral(basis).construct_array_mix(coord_type, shell_pairs=shell_pairs)
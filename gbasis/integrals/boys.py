@@ -0,0 +1,196 @@
+"""Boys function used in the Coulomb-type integrals."""
+import functools
+
+import numpy as np
+from scipy.special import erf, hyp1f1  # pylint: disable=E0611
+
+GRID_SPACING = 0.1
+r"""float: Spacing of the grid of weighted distances, :math:`T`, at which the Boys function is
+tabulated."""
+GRID_MAX = 60.0
+r"""float: Largest weighted distance, :math:`T`, of the grid.
+
+For larger weighted distances, the Boys function of order zero is evaluated with the error function
+and the higher orders are obtained with upward recursion, which is stable for :math:`T > m`."""
+NUM_TAYLOR = 10
+"""int: Number of terms in the Taylor expansion about the closest grid point."""
+
+
+@functools.lru_cache(maxsize=None)
+def _boys_grid(order):
+    r"""Return the Boys function of the orders needed for the Taylor expansion on the grid.
+
+    The Boys function of the highest order is evaluated with the series
+
+    .. math::
+
+        F_m(T) = e^{-T} \sum_{i=0}^\infty \frac{(2T)^i}{(2m + 1) (2m + 3) \dots (2m + 2i + 1)}
+
+    whose terms are all positive, and the lower orders are obtained with downward recursion.
+
+    Parameters
+    ----------
+    order : int
+        Lowest order of the Boys function that is tabulated.
+
+    Returns
+    -------
+    grid : np.ndarray(NUM_TAYLOR, N_grid)
+        Boys function of the orders `order` to `order + NUM_TAYLOR - 1` at the weighted distances
+        `GRID_SPACING * np.arange(N_grid)`.
+
+    """
+    weighted_dist = GRID_SPACING * np.arange(int(round(GRID_MAX / GRID_SPACING)) + 1)
+    top_order = order + NUM_TAYLOR - 1
+
+    term = np.full(weighted_dist.shape, 1 / (2 * top_order + 1))
+    total = term.copy()
+    i = 0
+    while np.any(term > 1e-17 * total):
+        i += 1
+        term *= 2 * weighted_dist / (2 * top_order + 2 * i + 1)
+        total += term
+
+    exp_neg = np.exp(-weighted_dist)
+    grid = np.empty((NUM_TAYLOR, weighted_dist.size))
+    grid[-1] = exp_neg * total
+    for i in range(NUM_TAYLOR - 2, -1, -1):
+        grid[i] = (2 * weighted_dist * grid[i + 1] + exp_neg) / (2 * (order + i) + 1)
+    return grid
+
+
+def boys_function_all_orders(m_max, weighted_dist):
+    r"""Return the Boys function of all orders up to the given order.
+
+    .. math::
+
+        F_m(T) = \int_0^1 t^{2m} e^{-T t^2} dt
+
+    For :math:`T` smaller than `GRID_MAX`, the Boys function of order `m_max` is evaluated with a
+    Taylor expansion about the closest point of a precomputed grid,
+
+    .. math::
+
+        F_m(T) = \sum_{k=0}^{\infty} F_{m + k}(T_0) \frac{(T_0 - T)^k}{k!}
+
+    and the lower orders are obtained with downward recursion,
+
+    .. math::
+
+        F_m(T) = \frac{2T F_{m + 1}(T) + e^{-T}}{2m + 1}
+
+    For larger :math:`T`, the order zero is evaluated with the error function and the higher orders
+    are obtained with upward recursion.
+
+    Parameters
+    ----------
+    m_max : int
+        Highest order of the Boys function.
+    weighted_dist : np.ndarray
+        Non-negative weighted distances, :math:`T`, at which the Boys function is evaluated.
+
+    Returns
+    -------
+    boys_eval : np.ndarray(m_max + 1, ...)
+        Boys function of the orders 0 to `m_max` at the given weighted distances.
+        Dimension 0 corresponds to the order and the remaining dimensions correspond to the
+        dimensions of `weighted_dist`.
+
+    """
+    m_max = int(m_max)
+    weighted_dist = np.asarray(weighted_dist, dtype=float)
+    dist = weighted_dist.ravel()
+    boys_eval = np.empty((m_max + 1, dist.size))
+    exp_neg = np.exp(-dist)
+
+    is_grid = dist < GRID_MAX
+    dist_grid = dist[is_grid]
+    exp_grid = exp_neg[is_grid]
+    grid_ind = np.rint(dist_grid / GRID_SPACING).astype(int)
+    delta = grid_ind * GRID_SPACING - dist_grid
+    grid = _boys_grid(m_max)[:, grid_ind]
+    # Horner's scheme for the Taylor expansion
+    boys_grid = grid[-1]
+    for k in range(NUM_TAYLOR - 2, -1, -1):
+        boys_grid = grid[k] + delta * boys_grid / (k + 1)
+    boys_eval[m_max, is_grid] = boys_grid
+    for m in range(m_max - 1, -1, -1):
+        boys_grid = (2 * dist_grid * boys_grid + exp_grid) / (2 * m + 1)
+        boys_eval[m, is_grid] = boys_grid
+
+    is_far = ~is_grid
+    dist_far = dist[is_far]
+    exp_far = exp_neg[is_far]
+    boys_far = np.sqrt(np.pi / dist_far) / 2 * erf(np.sqrt(dist_far))
+    boys_eval[0, is_far] = boys_far
+    for m in range(m_max):
+        boys_far = ((2 * m + 1) * boys_far - exp_far) / (2 * dist_far)
+        boys_eval[m + 1, is_far] = boys_far
+
+    return boys_eval.reshape(m_max + 1, *weighted_dist.shape)
+
+
+def boys_function_tabulated(orders, weighted_dist):
+    r"""Return the tabulated Boys function for the given orders and weighted distances.
+
+    All orders up to the largest of the given orders are evaluated at once with
+    `boys_function_all_orders`, and the requested orders are selected from them. The API is the
+    same as `PointChargeIntegral.boys_func`.
+
+    Parameters
+    ----------
+    orders : {int, np.ndarray}
+        Orders of the Boys function.
+    weighted_dist : np.ndarray
+        Non-negative weighted distances.
+        Must be broadcastable with `orders`.
+
+    Returns
+    -------
+    boys_eval : np.ndarray
+        Boys function evaluated for each order and weighted distance.
+        Shape is the broadcasted shape of `orders` and `weighted_dist`.
+
+    """
+    orders = np.asarray(orders, dtype=int)
+    weighted_dist = np.asarray(weighted_dist, dtype=float)
+    boys_eval = boys_function_all_orders(orders.max(), weighted_dist)
+    if orders.ndim == 0:
+        return boys_eval[orders]
+    shape = np.broadcast_shapes(orders.shape, weighted_dist.shape)
+    boys_eval = boys_eval.reshape(
+        boys_eval.shape[0], *(1,) * (len(shape) - weighted_dist.ndim), *weighted_dist.shape
+    )
+    return np.take_along_axis(boys_eval, np.broadcast_to(orders, shape)[None], axis=0)[0]
+
+
+def boys_function_hyp1f1(orders, weighted_dist):
+    r"""Return the Boys function evaluated with the Kummer confluent hypergeometric function.
+
+    The Coulombic Boys function can be written as a renormalized special case of the Kummer
+    confluent hypergeometric function, as derived in Helgaker (eq. 9.8.39).
+
+    Parameters
+    ----------
+    orders : {int, np.ndarray}
+        Orders of the Boys function.
+    weighted_dist : np.ndarray
+        Non-negative weighted distances.
+        Must be broadcastable with `orders`.
+
+    Returns
+    -------
+    boys_eval : np.ndarray
+        Boys function evaluated for each order and weighted distance.
+        Shape is the broadcasted shape of `orders` and `weighted_dist`.
+
+    Notes
+    -----
+    There's some documented instability for hyp1f1, mainly for large values or complex numbers.
+    In this case it seems fine, since m should be less than 10 in most cases, and except for
+    exceptional cases the input, while negative, shouldn't be very large. In scipy > 0.16, this
+    problem becomes a precision error in most cases where it was an overflow error before, so
+    the values should be close even when they are wrong.
+
+    """
+    return hyp1f1(orders + 1 / 2, orders + 3 / 2, -weighted_dist) / (2 * orders + 1)
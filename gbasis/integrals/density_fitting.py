@@ -0,0 +1,349 @@
+"""Three-center and two-center Coulomb integrals used in density fitting."""
+from gbasis.base_three import BaseThreeIndex
+from gbasis.base_two_symm import BaseTwoIndexSymmetric
+from gbasis.contractions import GeneralizedContractionShell
+from gbasis.integrals._two_elec_int import (
+    _compute_two_elec_integrals,
+    _compute_two_elec_integrals_angmom_zero,
+)
+from gbasis.integrals.point_charge import PointChargeIntegral
+import numpy as np
+
+
+def _compute_coulomb_integrals(boys_func, cont_one, cont_two, cont_three, cont_four):
+    r"""Return the Coulomb integrals between two pairs of contractions or single contractions.
+
+    A contraction that is not paired with another is paired with the constant function
+    :math:`\phi(\mathbf{r}) = 1`, i.e. a primitive with an exponent of zero, which is centered at
+    the contraction. The three-center integrals :math:`(ab|P)` and the two-center integrals
+    :math:`(P|Q)` are then obtained from the same recursion as the four-center integrals.
+
+    Parameters
+    ----------
+    boys_func : function(orders, weighted_dist)
+        Boys function used to evaluate the one-electron integral.
+        See `ElectronRepulsionIntegral.boys_func` for details.
+    cont_one : GeneralizedContractionShell
+        Contractions associated with the first index.
+    cont_two : {GeneralizedContractionShell, None}
+        Contractions associated with the second index.
+        If None, then the constant function at the center of `cont_one` is used.
+    cont_three : GeneralizedContractionShell
+        Contractions associated with the third index.
+    cont_four : {GeneralizedContractionShell, None}
+        Contractions associated with the fourth index.
+        If None, then the constant function at the center of `cont_three` is used.
+
+    Returns
+    -------
+    integrals : np.ndarray(M_1, L_cart_1, M_2, L_cart_2, M_3, L_cart_3, M_4, L_cart_4)
+        Coulomb integrals in Chemists' notation.
+        The dimensions associated with the constant functions have a size of one.
+
+    """
+    args = []
+    for cont, cont_center in [
+        (cont_one, cont_one),
+        (cont_two, cont_one),
+        (cont_three, cont_three),
+        (cont_four, cont_three),
+    ]:
+        if cont is None:
+            args.append(
+                (cont_center.coord, 0, np.zeros((1, 3), dtype=int), np.zeros(1), np.ones((1, 1)))
+            )
+        else:
+            args.append(
+                (cont.coord, cont.angmom, cont.angmom_components_cart, cont.exps, cont.coeffs)
+            )
+
+    if all(arg[1] == 0 for arg in args):
+        integrals = _compute_two_elec_integrals_angmom_zero(
+            boys_func, *[i for coord, _, _, exps, coeffs in args for i in (coord, exps, coeffs)]
+        )
+    else:
+        integrals = _compute_two_elec_integrals(boys_func, *[i for arg in args for i in arg])
+    return np.transpose(integrals, (4, 0, 5, 1, 6, 2, 7, 3))
+
+
+class ThreeCenterCoulombIntegral(BaseThreeIndex):
+    """Class for constructing the three-center Coulomb integrals used in density fitting.
+
+    The first two indices of the returned array are associated with the contractions of the basis
+    set and the third index is associated with the contractions of the auxiliary basis set.
+
+    Attributes
+    ----------
+    _axes_contractions : tuple of tuple of GeneralizedContractionShell
+        Sets of contractions associated with each axis of the array.
+    contractions_one : tuple of GeneralizedContractionShell
+        Contractions that are associated with the first index of the array.
+        Property of `ThreeCenterCoulombIntegral`.
+    contractions_two : tuple of GeneralizedContractionShell
+        Contractions that are associated with the second index of the array.
+        Property of `ThreeCenterCoulombIntegral`.
+    contractions_three : tuple of GeneralizedContractionShell
+        Contractions that are associated with the third index of the array.
+        Property of `ThreeCenterCoulombIntegral`.
+
+    Methods
+    -------
+    __init__(self, contractions_one, contractions_two, contractions_three)
+        Initialize.
+    construct_array_contraction(self, cont_one, cont_two, cont_three) :
+        **np.ndarray(M_1, L_cart_1, M_2, L_cart_2, M_3, L_cart_3)**
+
+        Return the three-center Coulomb integrals associated with `GeneralizedContractionShell`
+        instances.
+        `M_i` is the number of segmented contractions with the same exponents (and angular
+        momentum) associated with the `i`-th index.
+        `L_cart_i` is the number of Cartesian contractions for the given angular momentum
+        associated with the `i`-th index.
+    construct_array_cartesian(self) : np.ndarray(K_cart_1, K_cart_2, K_cart_3)
+        Return the three-center Coulomb integrals associated with Cartesian Gaussians.
+        `K_cart_i` is the total number of Cartesian contractions associated with the `i`-th index.
+    construct_array_spherical(self) : np.ndarray(K_sph_1, K_sph_2, K_sph_3)
+        Return the three-center Coulomb integrals associated with spherical Gaussians.
+        `K_sph_i` is the total number of spherical contractions associated with the `i`-th index.
+    construct_array_mix(self, coord_types_one, coord_types_two, coord_types_three) :
+        **np.ndarray(K_cont_1, K_cont_2, K_cont_3)**
+
+        Return the three-center Coulomb integrals associated with the contractions in the given
+        coordinate systems.
+        `K_cont_i` is the total number of contractions associated with the `i`-th index.
+    construct_array_lincomb(self, transform_one, transform_two, transform_three, coord_type_one,
+                            coord_type_two, coord_type_three) :
+        **np.ndarray(K_orbs_1, K_orbs_2, K_orbs_3)**
+
+        Return the three-center Coulomb integrals associated with the linear combinations of
+        contractions in the given coordinate systems.
+        `K_orbs_i` is the number of basis functions produced by the linear combinations associated
+        with the `i`-th index.
+
+    """
+
+    boys_func = PointChargeIntegral.boys_func
+
+    @classmethod
+    def construct_array_contraction(cls, cont_one, cont_two, cont_three):
+        r"""Return the three-center Coulomb integrals for the given contractions.
+
+        .. math::
+
+            (ab|P) = \int \int \frac{\phi_a(\mathbf{r}_1) \phi_b(\mathbf{r}_1)
+            \chi_P(\mathbf{r}_2)}{|\mathbf{r}_1 - \mathbf{r}_2|} d\mathbf{r}_1 d\mathbf{r}_2
+
+        Parameters
+        ----------
+        cont_one : GeneralizedContractionShell
+            Contracted Cartesian Gaussians (of the same shell) associated with the first index of
+            the array.
+        cont_two : GeneralizedContractionShell
+            Contracted Cartesian Gaussians (of the same shell) associated with the second index of
+            the array.
+        cont_three : GeneralizedContractionShell
+            Contracted Cartesian Gaussians (of the same shell) of the auxiliary basis set associated
+            with the third index of the array.
+
+        Returns
+        -------
+        array_cont : np.ndarray(M_1, L_cart_1, M_2, L_cart_2, M_3, L_cart_3)
+            Three-center Coulomb integrals associated with the given instances of
+            `GeneralizedContractionShell`.
+            Dimensions 0, 2, and 4 correspond to the segmented contractions within `cont_one`,
+            `cont_two`, and `cont_three`, respectively.
+            Dimensions 1, 3, and 5 correspond to the angular momentum vectors of `cont_one`,
+            `cont_two`, and `cont_three`, respectively.
+
+        Raises
+        ------
+        TypeError
+            If `cont_one` is not a `GeneralizedContractionShell` instance.
+            If `cont_two` is not a `GeneralizedContractionShell` instance.
+            If `cont_three` is not a `GeneralizedContractionShell` instance.
+
+        """
+        if not isinstance(cont_one, GeneralizedContractionShell):
+            raise TypeError("`cont_one` must be a `GeneralizedContractionShell` instance.")
+        if not isinstance(cont_two, GeneralizedContractionShell):
+            raise TypeError("`cont_two` must be a `GeneralizedContractionShell` instance.")
+        if not isinstance(cont_three, GeneralizedContractionShell):
+            raise TypeError("`cont_three` must be a `GeneralizedContractionShell` instance.")
+
+        return _compute_coulomb_integrals(cls.boys_func, cont_one, cont_two, cont_three, None)[
+            ..., 0, 0
+        ]
+
+
+class TwoCenterCoulombIntegral(BaseTwoIndexSymmetric):
+    """Class for constructing the two-center Coulomb integrals used in density fitting.
+
+    Attributes
+    ----------
+    _axes_contractions : tuple of tuple of GeneralizedContractionShell
+        Sets of contractions associated with each axis of the array.
+    contractions : tuple of GeneralizedContractionShell
+        Contractions that are associated with the first and second indices of the array.
+        Property of `TwoCenterCoulombIntegral`.
+
+    Methods
+    -------
+    __init__(self, contractions)
+        Initialize.
+    construct_array_contraction(self, cont_one, cont_two) :
+        **np.ndarray(M_1, L_cart_1, M_2, L_cart_2)**
+
+        Return the two-center Coulomb integrals associated with `GeneralizedContractionShell`
+        instances.
+        `M_i` is the number of segmented contractions with the same exponents (and angular
+        momentum) associated with the `i`-th index.
+        `L_cart_i` is the number of Cartesian contractions for the given angular momentum
+        associated with the `i`-th index.
+    construct_array_cartesian(self) : np.ndarray(K_cart, K_cart)
+        Return the two-center Coulomb integrals associated with Cartesian Gaussians.
+        `K_cart` is the total number of Cartesian contractions within the instance.
+    construct_array_spherical(self) : np.ndarray(K_sph, K_sph)
+        Return the two-center Coulomb integrals associated with spherical Gaussians.
+        `K_sph` is the total number of spherical contractions within the instance.
+    construct_array_mix(self, coord_types) : np.ndarray(K_cont, K_cont)
+        Return the two-center Coulomb integrals associated with the contractions in the given
+        coordinate system.
+        `K_cont` is the total number of contractions within the given basis set.
+    construct_array_lincomb(self, transform, coord_type) : np.ndarray(K_orbs, K_orbs)
+        Return the two-center Coulomb integrals associated with the linear combinations of
+        contractions in the given coordinate system.
+        `K_orbs` is the number of basis functions produced after the linear combinations.
+
+    """
+
+    boys_func = PointChargeIntegral.boys_func
+
+    @classmethod
+    def construct_array_contraction(cls, cont_one, cont_two):
+        r"""Return the two-center Coulomb integrals for the given contractions.
+
+        .. math::
+
+            (P|Q) = \int \int \frac{\chi_P(\mathbf{r}_1) \chi_Q(\mathbf{r}_2)}
+            {|\mathbf{r}_1 - \mathbf{r}_2|} d\mathbf{r}_1 d\mathbf{r}_2
+
+        Parameters
+        ----------
+        cont_one : GeneralizedContractionShell
+            Contracted Cartesian Gaussians (of the same shell) associated with the first index of
+            the array.
+        cont_two : GeneralizedContractionShell
+            Contracted Cartesian Gaussians (of the same shell) associated with the second index of
+            the array.
+
+        Returns
+        -------
+        array_cont : np.ndarray(M_1, L_cart_1, M_2, L_cart_2)
+            Two-center Coulomb integrals associated with the given instances of
+            `GeneralizedContractionShell`.
+            Dimensions 0 and 2 correspond to the segmented contractions within `cont_one` and
+            `cont_two`, respectively.
+            Dimensions 1 and 3 correspond to the angular momentum vectors of `cont_one` and
+            `cont_two`, respectively.
+
+        Raises
+        ------
+        TypeError
+            If `cont_one` is not a `GeneralizedContractionShell` instance.
+            If `cont_two` is not a `GeneralizedContractionShell` instance.
+
+        """
+        if not isinstance(cont_one, GeneralizedContractionShell):
+            raise TypeError("`cont_one` must be a `GeneralizedContractionShell` instance.")
+        if not isinstance(cont_two, GeneralizedContractionShell):
+            raise TypeError("`cont_two` must be a `GeneralizedContractionShell` instance.")
+
+        return _compute_coulomb_integrals(cls.boys_func, cont_one, None, cont_two, None)[
+            :, :, 0, 0, :, :, 0, 0
+        ]
+
+
+def three_center_coulomb_integral(basis, aux_basis, transform=None):
+    r"""Return the three-center Coulomb integrals of the given basis set and auxiliary basis set.
+
+    .. math::
+
+        (ab|P) = \int \int \frac{\phi_a(\mathbf{r}_1) \phi_b(\mathbf{r}_1)
+        \chi_P(\mathbf{r}_2)}{|\mathbf{r}_1 - \mathbf{r}_2|} d\mathbf{r}_1 d\mathbf{r}_2
+
+    Together with the two-center Coulomb integrals of the auxiliary basis set (see
+    `two_center_coulomb_integral`), the electron repulsion integrals are approximated as
+
+    .. math::
+
+        (ab|cd) \approx \sum_{PQ} (ab|P) [\mathbf{V}^{-1}]_{PQ} (Q|cd)
+
+    which avoids constructing the four-index array.
+
+    Parameters
+    ----------
+    basis : list/tuple of GeneralizedContractionShell
+        Shells of generalized contractions.
+    aux_basis : list/tuple of GeneralizedContractionShell
+        Shells of generalized contractions of the auxiliary basis set.
+    transform : np.ndarray(K_orbs, K_cont)
+        Transformation matrix from the basis set in the given coordinate system (e.g. AO) to linear
+        combinations of contractions (e.g. MO).
+        Transformation is applied to the first two indices of the array. The auxiliary basis set is
+        not transformed.
+        Default is no transformation.
+
+    Returns
+    -------
+    array : np.ndarray(K_orbs, K_orbs, K_aux)
+        Three-center Coulomb integrals of the given basis sets.
+        Dimensions 0 and 1 of the array correspond to the basis functions of `basis`. `K_orbs` is
+        the number of basis functions in `basis`.
+        Dimension 2 of the array corresponds to the basis functions of `aux_basis`. `K_aux` is the
+        number of basis functions in `aux_basis`.
+
+    """
+    coord_type = [ct for ct in [shell.coord_type for shell in basis]]
+    coord_type_aux = [ct for ct in [shell.coord_type for shell in aux_basis]]
+
+    return ThreeCenterCoulombIntegral(basis, basis, aux_basis).construct_array_lincomb(
+        transform, transform, None, coord_type, coord_type, coord_type_aux
+    )
+
+
+def two_center_coulomb_integral(aux_basis, transform=None):
+    r"""Return the two-center Coulomb integrals of the given auxiliary basis set.
+
+    .. math::
+
+        V_{PQ} = (P|Q) = \int \int \frac{\chi_P(\mathbf{r}_1) \chi_Q(\mathbf{r}_2)}
+        {|\mathbf{r}_1 - \mathbf{r}_2|} d\mathbf{r}_1 d\mathbf{r}_2
+
+    Parameters
+    ----------
+    aux_basis : list/tuple of GeneralizedContractionShell
+        Shells of generalized contractions of the auxiliary basis set.
+    transform : np.ndarray(K_orbs, K_cont)
+        Transformation matrix from the basis set in the given coordinate system to linear
+        combinations of contractions.
+        Transformation is applied to the left, i.e. the sum is over the index 1 of `transform`
+        and index 0 of the array for contractions.
+        Default is no transformation.
+
+    Returns
+    -------
+    array : np.ndarray(K_orbs, K_orbs)
+        Two-center Coulomb integrals of the given auxiliary basis set.
+        Dimensions 0 and 1 of the array correspond to the basis functions. `K_orbs` is the
+        number of basis functions in the auxiliary basis set.
+
+    """
+    coord_type = [ct for ct in [shell.coord_type for shell in aux_basis]]
+
+    if transform is not None:
+        return TwoCenterCoulombIntegral(aux_basis).construct_array_lincomb(transform, coord_type)
+    if all(ct == "cartesian" for ct in coord_type):
+        return TwoCenterCoulombIntegral(aux_basis).construct_array_cartesian()
+    if all(ct == "spherical" for ct in coord_type):
+        return TwoCenterCoulombIntegral(aux_basis).construct_array_spherical()
+    return TwoCenterCoulombIntegral(aux_basis).construct_array_mix(coord_type)
@@ -1,4 +1,7 @@
 """Electron-electron repulsion integral."""
+import itertools as it
+import tempfile
+
 from gbasis.base_four_symm import BaseFourIndexSymmetric
 from gbasis.contractions import GeneralizedContractionShell
 from gbasis.integrals._two_elec_int import (
@@ -6,6 +9,7 @@ from gbasis.integrals._two_elec_int import (
     _compute_two_elec_integrals_angmom_zero,
 )
 from gbasis.integrals.point_charge import PointChargeIntegral
+from gbasis.spherical import generate_transformation
 import numpy as np
 
 
@@ -203,22 +207,39 @@ class ElectronRepulsionIntegral(BaseFourIndexSymmetric):
         return integrals
 
 
-def electron_repulsion_integral(basis, transform=None, notation="physicist"):
-    """Return the electron repulsion integrals fo the given basis set.
+def electron_repulsion_integral(
+    basis, transform=None, notation="physicist", screen_tol=None, max_memory=None
+):
+    r"""Return the electron repulsion integrals fo the given basis set.
 
     Parameters
     ----------
     basis : list/tuple of GeneralizedContractionShell
         Shells of generalized contractions.
-    transform : np.ndarray(K, K_cont)
+    transform : {np.ndarray(K, K_cont), list/tuple of 4 np.ndarray(K_i, K_cont)}
         Transformation matrix from the basis set in the given coordinate system (e.g. AO) to linear
         combinations of contractions (e.g. MO).
         Transformation is applied to the left, i.e. the sum is over the index 1 of `transform`
         and index 0 of the array for contractions.
+        If four transformation matrices are given, the `i`-th matrix is applied to the `i`-th axis
+        of the returned array (in the given `notation`), e.g. the occupied and virtual orbitals for
+        the :math:`(ia|jb)` integrals.
+        The transformed integrals are built with `electron_repulsion_integral_transformed`, such
+        that the integrals of the basis set are never constructed all at once.
         Default is no transformation.
     notation : {"physicist", "chemist"}
         Convention with which the integrals are ordered.
         Default is Physicists' notation.
+    screen_tol : float, optional
+        Tolerance used in the Schwarz screening of the shell quartets. The integrals of the shell
+        quartets whose Schwarz bound, :math:`\sqrt{(ab|ab)} \sqrt{(cd|cd)}`, is smaller than
+        `screen_tol` are not computed and are set to zero.
+        Default does not screen the shell quartets.
+    max_memory : float, optional
+        Memory, in megabytes, available to the intermediates of the transformation. See
+        `electron_repulsion_integral_transformed` for details.
+        Only used if `transform` is provided.
+        Default does not limit the memory.
 
     Returns
     -------
@@ -231,6 +252,8 @@ def electron_repulsion_integral(basis, transform=None, notation="physicist"):
 
     Raises
     ------
+    TypeError
+        If `transform` is not a `numpy` array or a list/tuple of four transformation matrices.
     ValueError
         If `notation` is not one of "physicist" or "chemist".
 
@@ -241,14 +264,558 @@ def electron_repulsion_integral(basis, transform=None, notation="physicist"):
     coord_type = [ct for ct in [shell.coord_type for shell in basis]]
 
     if transform is not None:
-        array = ElectronRepulsionIntegral(basis).construct_array_lincomb(transform, coord_type)
+        if isinstance(transform, np.ndarray):
+            transform = [transform] * 4
+        elif not (isinstance(transform, (list, tuple)) and len(transform) == 4):
+            raise TypeError(
+                "`transform` must be a `numpy` array or a list/tuple of four transformation "
+                "matrices."
+            )
+        if notation == "physicist":
+            transform = [transform[i] for i in (0, 2, 1, 3)]
+        array = electron_repulsion_integral_transformed(
+            basis, *transform, screen_tol=screen_tol, max_memory=max_memory
+        )
     elif all(ct == "cartesian" for ct in coord_type):
-        array = ElectronRepulsionIntegral(basis).construct_array_cartesian()
+        array = ElectronRepulsionIntegral(basis).construct_array_cartesian(screen_tol=screen_tol)
     elif all(ct == "spherical" for ct in coord_type):
-        array = ElectronRepulsionIntegral(basis).construct_array_spherical()
+        array = ElectronRepulsionIntegral(basis).construct_array_spherical(screen_tol=screen_tol)
     else:
-        array = ElectronRepulsionIntegral(basis).construct_array_mix(coord_type)
+        array = ElectronRepulsionIntegral(basis).construct_array_mix(
+            coord_type, screen_tol=screen_tol
+        )
 
     if notation == "physicist":
         array = np.transpose(array, (0, 2, 1, 3))
     return array
+
+
+def electron_repulsion_integral_transformed(
+    basis,
+    transform_one,
+    transform_two=None,
+    transform_three=None,
+    transform_four=None,
+    screen_tol=None,
+    max_memory=None,
+):
+    r"""Return the electron repulsion integrals transformed one index at a time.
+
+    .. math::
+
+        (pq|rs) = \sum_{ab} T^{(1)}_{pa} T^{(2)}_{qb}
+                  \sum_{cd} T^{(3)}_{rc} T^{(4)}_{sd} (ab|cd)
+
+    The integrals are streamed one unique shell quartet at a time. Each block of integrals is
+    transformed over its ket indices and accumulated into the half-transformed integrals,
+    :math:`(ab|rs)`, which are stored only for the unique pairs :math:`a \geq b`. The bra indices
+    are then transformed for a batch of the :math:`rs` pairs at a time. The integrals of the basis
+    set are never constructed all at once.
+
+    Parameters
+    ----------
+    basis : list/tuple of GeneralizedContractionShell
+        Shells of generalized contractions.
+    transform_one : np.ndarray(K_1, K_cont)
+        Transformation matrix applied to the first index of the integrals.
+        Rows correspond to the linear combinations (e.g. MO) and the columns correspond to the
+        contractions (e.g. AO).
+    transform_two : np.ndarray(K_2, K_cont), optional
+        Transformation matrix applied to the second index of the integrals.
+        Default is `transform_one`.
+    transform_three : np.ndarray(K_3, K_cont), optional
+        Transformation matrix applied to the third index of the integrals.
+        Default is `transform_one`.
+    transform_four : np.ndarray(K_4, K_cont), optional
+        Transformation matrix applied to the fourth index of the integrals.
+        Default is `transform_two`.
+    screen_tol : float, optional
+        Tolerance used in the Schwarz screening of the shell quartets. The integrals of the shell
+        quartets whose Schwarz bound, :math:`\sqrt{(ab|ab)} \sqrt{(cd|cd)}`, is smaller than
+        `screen_tol` are not computed and are set to zero.
+        Default does not screen the shell quartets.
+    max_memory : float, optional
+        Memory, in megabytes, available to the intermediates of the transformation.
+        If the half-transformed integrals, :math:`K (K + 1) / 2 \times K_3 K_4` values, do not fit,
+        they are written to a temporary file on disk instead. The bra indices are transformed for
+        as many :math:`rs` pairs at once as fit in `max_memory`.
+        Default does not limit the memory.
+
+    Returns
+    -------
+    array : np.ndarray(K_1, K_2, K_3, K_4)
+        Transformed electron repulsion integrals in Chemists' notation.
+
+    Raises
+    ------
+    ValueError
+        If a transformation matrix is not two-dimensional or its number of columns is not equal to
+        the number of basis functions.
+        If `max_memory` is not positive.
+
+    """
+    # pylint: disable=R0912,R0913,R0914,R0915
+    coord_types = [shell.coord_type for shell in basis]
+    sizes = [
+        shell.num_seg_cont * (shell.num_sph if coord_type == "spherical" else shell.num_cart)
+        for shell, coord_type in zip(basis, coord_types)
+    ]
+    num_basis = sum(sizes)
+    num_pairs = num_basis * (num_basis + 1) // 2
+    indices = [np.arange(start, start + size) for start, size in zip(np.cumsum([0] + sizes), sizes)]
+
+    if transform_two is None:
+        transform_two = transform_one
+    if transform_three is None:
+        transform_three = transform_one
+    if transform_four is None:
+        transform_four = transform_two
+    transforms = [transform_one, transform_two, transform_three, transform_four]
+    for i, transform in enumerate(transforms):
+        transform = np.asarray(transform)
+        if transform.ndim != 2 or transform.shape[1] != num_basis:
+            raise ValueError(
+                "Each transformation matrix must be two-dimensional with as many columns as the "
+                "number of basis functions."
+            )
+        transforms[i] = transform
+    transform_one, transform_two, transform_three, transform_four = transforms
+    num_three, num_four = transform_three.shape[0], transform_four.shape[0]
+    num_ket = num_three * num_four
+
+    if max_memory is not None and max_memory <= 0:
+        raise ValueError("`max_memory` must be positive.")
+    max_bytes = np.inf if max_memory is None else max_memory * 1024**2
+    if screen_tol is not None:
+        bounds = ElectronRepulsionIntegral(basis).compute_schwarz_bounds(coord_types)
+
+    def half_transform(block, ind_one, ind_two, is_diag):
+        """Return the block transformed over its last two indices, including their swap."""
+        half = np.tensordot(block, transform_three[:, ind_one], (2, 1))
+        half = np.tensordot(half, transform_four[:, ind_two], (2, 1))
+        if not is_diag:
+            swapped = np.tensordot(block, transform_four[:, ind_one], (2, 1))
+            half += np.swapaxes(np.tensordot(swapped, transform_three[:, ind_two], (2, 1)), 2, 3)
+        return half.reshape(block.shape[0] * block.shape[1], num_ket)
+
+    with tempfile.TemporaryFile() as spill_file:
+        if 8 * num_pairs * num_ket > max_bytes:
+            half_eri = np.memmap(spill_file, dtype=float, mode="w+", shape=(num_pairs, num_ket))
+        else:
+            half_eri = np.zeros((num_pairs, num_ket))
+
+        # first half transformation: (ab|cd) -> (ab|rs) for a >= b
+        pairs = list(it.combinations_with_replacement(range(len(basis)), 2))
+        for pair_ind, (i, j) in enumerate(pairs):
+            index_ij = pair_index(indices[i][:, None], indices[j][None, :]).ravel()
+            for k, l in pairs[pair_ind:]:
+                if screen_tol is not None and bounds[i, j] * bounds[k, l] < screen_tol:
+                    continue
+                block = _construct_normalized_block(
+                    basis[i],
+                    basis[j],
+                    basis[k],
+                    basis[l],
+                    [coord_types[ind] for ind in (i, j, k, l)],
+                )
+                # pairs related by symmetry are written to the same row
+                half_eri[index_ij] += half_transform(block, indices[k], indices[l], k == l)
+                if (i, j) != (k, l):
+                    index_kl = pair_index(indices[k][:, None], indices[l][None, :]).ravel()
+                    half_eri[index_kl] += half_transform(
+                        np.transpose(block, (2, 3, 0, 1)), indices[i], indices[j], i == j
+                    )
+
+        # second half transformation: (ab|rs) -> (pq|rs) for a batch of rs at a time
+        num_one, num_two = transform_one.shape[0], transform_two.shape[0]
+        index_pairs = pair_index(np.arange(num_basis)[:, None], np.arange(num_basis)[None, :])
+        bytes_per_ket = 8 * (num_pairs + num_basis**2 + num_one * num_basis + num_one * num_two)
+        batch_size = int(min(num_ket, max(1, max_bytes // bytes_per_ket)))
+        array = np.empty((num_one, num_two, num_ket))
+        for start in range(0, num_ket, batch_size):
+            block = np.asarray(half_eri[:, start : start + batch_size])[index_pairs]
+            block = np.tensordot(transform_one, block, (1, 0))
+            array[:, :, start : start + batch_size] = np.swapaxes(
+                np.tensordot(transform_two, block, (1, 1)), 0, 1
+            )
+        del half_eri
+    return array.reshape(num_one, num_two, num_three, num_four)
+
+
+def _construct_normalized_block(cont_one, cont_two, cont_three, cont_four, coord_types):
+    """Return the normalized integrals of a shell quartet in the given coordinate systems.
+
+    Parameters
+    ----------
+    cont_one, cont_two, cont_three, cont_four : GeneralizedContractionShell
+        Contracted Cartesian Gaussians (of the same shell) associated with each index.
+    coord_types : 4-tuple of str
+        Coordinate system ("cartesian" or "spherical") of each of the given shells.
+
+    Returns
+    -------
+    block : np.ndarray(K_1, K_2, K_3, K_4)
+        Electron repulsion integrals of the shell quartet in Chemists' notation.
+        `K_i` is the number of contractions in the `i`-th shell.
+
+    """
+    conts = (cont_one, cont_two, cont_three, cont_four)
+    block = ElectronRepulsionIntegral.construct_array_contraction(*conts)
+    for axis, (cont, coord_type) in enumerate(zip(conts, coord_types)):
+        # normalize contractions
+        shape = [1] * 8
+        shape[2 * axis : 2 * axis + 2] = cont.norm_cont.shape
+        block *= cont.norm_cont.reshape(shape)
+        if coord_type == "spherical":
+            transform = generate_transformation(
+                cont.angmom, cont.angmom_components_cart, cont.angmom_components_sph, "left"
+            )
+            block = np.moveaxis(np.tensordot(block, transform, (2 * axis + 1, 1)), -1, 2 * axis + 1)
+    shape = block.shape
+    return block.reshape(shape[0] * shape[1], shape[2] * shape[3], shape[4] * shape[5], -1)
+
+
+def coulomb_exchange_matrices(basis, density_matrices, screen_tol=None):
+    r"""Return the Coulomb and exchange matrices of the given density matrices.
+
+    .. math::
+
+        J_{ab} &= \sum_{cd} (ab|cd) D_{cd}\\
+        K_{ac} &= \sum_{bd} (ab|cd) D_{bd}
+
+    The electron repulsion integrals are computed one unique shell quartet at a time, using the
+    8-fold permutational symmetry of the integrals, and each block is contracted with the density
+    matrices immediately, such that the four-index array of the integrals is never stored.
+
+    Parameters
+    ----------
+    basis : list/tuple of GeneralizedContractionShell
+        Shells of generalized contractions.
+    density_matrices : {np.ndarray(K, K), np.ndarray(N_dm, K, K)}
+        Density matrices in terms of the given basis set.
+        If a three-dimensional array is given, the first axis corresponds to the different density
+        matrices, e.g. the alpha and beta density matrices.
+    screen_tol : float, optional
+        Tolerance used in the Schwarz screening of the shell quartets. The shell quartets whose
+        Schwarz bound, :math:`\sqrt{(ab|ab)} \sqrt{(cd|cd)}`, is smaller than `screen_tol` are
+        skipped.
+        Default does not screen the shell quartets.
+
+    Returns
+    -------
+    coulomb : {np.ndarray(K, K), np.ndarray(N_dm, K, K)}
+        Coulomb matrices of the given density matrices.
+    exchange : {np.ndarray(K, K), np.ndarray(N_dm, K, K)}
+        Exchange matrices of the given density matrices.
+
+    Raises
+    ------
+    TypeError
+        If `density_matrices` is not a two- or three-dimensional `numpy` array.
+    ValueError
+        If the last two dimensions of `density_matrices` are not equal to the number of basis
+        functions.
+
+    """
+    # pylint: disable=R0914
+    if not (isinstance(density_matrices, np.ndarray) and density_matrices.ndim in [2, 3]):
+        raise TypeError("`density_matrices` must be a two- or three-dimensional `numpy` array.")
+
+    coord_types = [shell.coord_type for shell in basis]
+    sizes = [
+        shell.num_seg_cont * (shell.num_sph if coord_type == "spherical" else shell.num_cart)
+        for shell, coord_type in zip(basis, coord_types)
+    ]
+    num_basis = sum(sizes)
+    if density_matrices.shape[-2:] != (num_basis, num_basis):
+        raise ValueError(
+            "The last two dimensions of `density_matrices` must be equal to the number of basis "
+            "functions."
+        )
+    is_single = density_matrices.ndim == 2
+    density_matrices = np.atleast_3d(density_matrices.T).T
+    slices = [slice(start, start + size) for start, size in zip(np.cumsum([0] + sizes[:-1]), sizes)]
+    if screen_tol is not None:
+        bounds = ElectronRepulsionIntegral(basis).compute_schwarz_bounds(coord_types)
+
+    coulomb = np.zeros(density_matrices.shape)
+    exchange = np.zeros(density_matrices.shape)
+    pairs = list(it.combinations_with_replacement(range(len(basis)), 2))
+    for pair_ind, (i, j) in enumerate(pairs):
+        for k, l in pairs[pair_ind:]:
+            if screen_tol is not None and bounds[i, j] * bounds[k, l] < screen_tol:
+                continue
+            shells = (i, j, k, l)
+            block = _construct_normalized_block(
+                basis[i], basis[j], basis[k], basis[l], [coord_types[ind] for ind in shells]
+            )
+            # contract each distinct permutation of the shell quartet
+            visited = set()
+            for axes in [
+                (0, 1, 2, 3),
+                (1, 0, 2, 3),
+                (0, 1, 3, 2),
+                (1, 0, 3, 2),
+                (2, 3, 0, 1),
+                (3, 2, 0, 1),
+                (2, 3, 1, 0),
+                (3, 2, 1, 0),
+            ]:
+                perm = tuple(shells[axis] for axis in axes)
+                if perm in visited:
+                    continue
+                visited.add(perm)
+                sl_a, sl_b, sl_c, sl_d = [slices[ind] for ind in perm]
+                perm_block = np.transpose(block, axes)
+                coulomb[:, sl_a, sl_b] += np.einsum(
+                    "abcd,ncd->nab", perm_block, density_matrices[:, sl_c, sl_d]
+                )
+                exchange[:, sl_a, sl_c] += np.einsum(
+                    "abcd,nbd->nac", perm_block, density_matrices[:, sl_b, sl_d]
+                )
+
+    if is_single:
+        return coulomb[0], exchange[0]
+    return coulomb, exchange
+
+
+def pair_index(ind_one, ind_two):
+    r"""Return the index of a pair of indices in the packed lower triangle of a symmetric matrix.
+
+    .. math::
+
+        ij = \frac{i (i + 1)}{2} + j \quad \text{where } i \geq j
+
+    The indices are swapped if `ind_one` is smaller than `ind_two`.
+
+    Parameters
+    ----------
+    ind_one : {int, np.ndarray of int}
+        First index.
+    ind_two : {int, np.ndarray of int}
+        Second index.
+        If arrays are given, they must be broadcastable with `ind_one`.
+
+    Returns
+    -------
+    index : {int, np.ndarray of int}
+        Index of the pair in the packed lower triangle.
+
+    """
+    ind_max = np.maximum(ind_one, ind_two)
+    ind_min = np.minimum(ind_one, ind_two)
+    return ind_max * (ind_max + 1) // 2 + ind_min
+
+
+def packed_eri_index(ind_one, ind_two, ind_three, ind_four):
+    """Return the index of an electron repulsion integral in the packed 8-fold symmetric array.
+
+    The integral :math:`(ij|kl)` (in Chemists' notation) is stored at the index of the pair of the
+    pair indices, :math:`ij` and :math:`kl`, such that all of the integrals related by the
+    permutational symmetry share the same index.
+
+    Parameters
+    ----------
+    ind_one, ind_two, ind_three, ind_four : {int, np.ndarray of int}
+        Indices of the basis functions of the integral.
+        If arrays are given, they must be broadcastable with one another.
+
+    Returns
+    -------
+    index : {int, np.ndarray of int}
+        Index of the integral in the packed array.
+
+    """
+    return pair_index(pair_index(ind_one, ind_two), pair_index(ind_three, ind_four))
+
+
+def electron_repulsion_integral_packed(basis, screen_tol=None):
+    r"""Return the unique electron repulsion integrals of the given basis set in packed form.
+
+    Only the integrals :math:`(ij|kl)` with :math:`i \geq j`, :math:`k \geq l`, and
+    :math:`ij \geq kl` are stored, in a one-dimensional array indexed by `packed_eri_index`. The
+    integrals are written into the packed array one unique shell quartet at a time, such that the
+    array with all :math:`K^4` integrals is never constructed.
+
+    Parameters
+    ----------
+    basis : list/tuple of GeneralizedContractionShell
+        Shells of generalized contractions.
+    screen_tol : float, optional
+        Tolerance used in the Schwarz screening of the shell quartets. The integrals of the shell
+        quartets whose Schwarz bound, :math:`\sqrt{(ab|ab)} \sqrt{(cd|cd)}`, is smaller than
+        `screen_tol` are not computed and are set to zero.
+        Default does not screen the shell quartets.
+
+    Returns
+    -------
+    packed_eri : np.ndarray(K_pair * (K_pair + 1) / 2,)
+        Unique electron repulsion integrals in Chemists' notation.
+        `K_pair` is the number of unique pairs of basis functions, :math:`K (K + 1) / 2`, where
+        :math:`K` is the total number of basis functions in the basis set.
+
+    """
+    coord_types = [shell.coord_type for shell in basis]
+    sizes = [
+        shell.num_seg_cont * (shell.num_sph if coord_type == "spherical" else shell.num_cart)
+        for shell, coord_type in zip(basis, coord_types)
+    ]
+    num_basis = sum(sizes)
+    num_pairs = num_basis * (num_basis + 1) // 2
+    indices = [np.arange(start, start + size) for start, size in zip(np.cumsum([0] + sizes), sizes)]
+    if screen_tol is not None:
+        bounds = ElectronRepulsionIntegral(basis).compute_schwarz_bounds(coord_types)
+
+    packed_eri = np.zeros(num_pairs * (num_pairs + 1) // 2)
+    pairs = list(it.combinations_with_replacement(range(len(basis)), 2))
+    for pair_ind, (i, j) in enumerate(pairs):
+        index_ij = pair_index(indices[i][:, None], indices[j][None, :])
+        for k, l in pairs[pair_ind:]:
+            if screen_tol is not None and bounds[i, j] * bounds[k, l] < screen_tol:
+                continue
+            index_kl = pair_index(indices[k][:, None], indices[l][None, :])
+            block = _construct_normalized_block(
+                basis[i], basis[j], basis[k], basis[l], [coord_types[ind] for ind in (i, j, k, l)]
+            )
+            # integrals that are related by symmetry are written to the same index
+            packed_eri[pair_index(index_ij[:, :, None, None], index_kl[None, None, :, :])] = block
+    return packed_eri
+
+
+def _get_num_basis_packed(packed_eri):
+    """Return the number of basis functions of the given packed electron repulsion integrals."""
+    if not (isinstance(packed_eri, np.ndarray) and packed_eri.ndim == 1):
+        raise TypeError("`packed_eri` must be a one-dimensional `numpy` array.")
+    num_pairs = int(round((np.sqrt(8 * packed_eri.size + 1) - 1) / 2))
+    num_basis = int(round((np.sqrt(8 * num_pairs + 1) - 1) / 2))
+    if num_basis * (num_basis + 1) // 2 != num_pairs or num_pairs * (num_pairs + 1) // 2 != (
+        packed_eri.size
+    ):
+        raise ValueError(
+            "The size of `packed_eri` does not correspond to the packed integrals of a basis set."
+        )
+    return num_basis
+
+
+def unpack_electron_repulsion_integral(packed_eri, notation="physicist"):
+    """Return the electron repulsion integrals with all four indices from the packed integrals.
+
+    Parameters
+    ----------
+    packed_eri : np.ndarray(K_pair * (K_pair + 1) / 2,)
+        Unique electron repulsion integrals in Chemists' notation, as returned by
+        `electron_repulsion_integral_packed`.
+    notation : {"physicist", "chemist"}
+        Convention with which the returned integrals are ordered.
+        Default is Physicists' notation.
+
+    Returns
+    -------
+    array : np.ndarray(K, K, K, K)
+        Electron-electron repulsion integrals.
+
+    Raises
+    ------
+    TypeError
+        If `packed_eri` is not a one-dimensional `numpy` array.
+    ValueError
+        If the size of `packed_eri` does not correspond to the packed integrals of a basis set.
+        If `notation` is not one of "physicist" or "chemist".
+
+    """
+    if notation not in ["physicist", "chemist"]:
+        raise ValueError("`notation` must be one of 'physicist' or 'chemist'")
+    num_basis = _get_num_basis_packed(packed_eri)
+    indices = np.arange(num_basis)
+    index_pairs = pair_index(indices[:, None], indices[None, :]).ravel()
+    array = packed_eri[pair_index(index_pairs[:, None], index_pairs[None, :])]
+    array = array.reshape((num_basis,) * 4)
+    if notation == "physicist":
+        array = np.transpose(array, (0, 2, 1, 3))
+    return array
+
+
+def packed_coulomb_exchange_matrices(packed_eri, density_matrices, chunk_size=None):
+    r"""Return the Coulomb and exchange matrices of the given density matrices.
+
+    .. math::
+
+        J_{ab} &= \sum_{cd} (ab|cd) D_{cd}\\
+        K_{ac} &= \sum_{bd} (ab|cd) D_{bd}
+
+    The packed integrals are expanded for a block of pairs, :math:`ab`, with :math:`a \geq b`, at a
+    time, such that at most `chunk_size` rows of :math:`K^2` integrals are unpacked at once.
+
+    Parameters
+    ----------
+    packed_eri : np.ndarray(K_pair * (K_pair + 1) / 2,)
+        Unique electron repulsion integrals in Chemists' notation, as returned by
+        `electron_repulsion_integral_packed`.
+    density_matrices : {np.ndarray(K, K), np.ndarray(N_dm, K, K)}
+        Density matrices in terms of the basis set of the integrals.
+        If a three-dimensional array is given, the first axis corresponds to the different density
+        matrices.
+    chunk_size : int, optional
+        Maximum number of pairs, :math:`ab`, whose integrals are unpacked at once.
+        Default unpacks the integrals of :math:`K` pairs at once.
+
+    Returns
+    -------
+    coulomb : {np.ndarray(K, K), np.ndarray(N_dm, K, K)}
+        Coulomb matrices of the given density matrices.
+    exchange : {np.ndarray(K, K), np.ndarray(N_dm, K, K)}
+        Exchange matrices of the given density matrices.
+
+    Raises
+    ------
+    TypeError
+        If `packed_eri` is not a one-dimensional `numpy` array.
+        If `density_matrices` is not a two- or three-dimensional `numpy` array.
+    ValueError
+        If the size of `packed_eri` does not correspond to the packed integrals of a basis set.
+        If the last two dimensions of `density_matrices` are not equal to the number of basis
+        functions.
+
+    """
+    num_basis = _get_num_basis_packed(packed_eri)
+    if not (isinstance(density_matrices, np.ndarray) and density_matrices.ndim in [2, 3]):
+        raise TypeError("`density_matrices` must be a two- or three-dimensional `numpy` array.")
+    if density_matrices.shape[-2:] != (num_basis, num_basis):
+        raise ValueError(
+            "The last two dimensions of `density_matrices` must be equal to the number of basis "
+            "functions."
+        )
+    if chunk_size is None:
+        chunk_size = num_basis
+    is_single = density_matrices.ndim == 2
+    density_matrices = np.atleast_3d(density_matrices.T).T
+
+    indices = np.arange(num_basis)
+    index_pairs = pair_index(indices[:, None], indices[None, :])
+    ind_a, ind_b = np.tril_indices(num_basis)
+    coulomb = np.zeros(density_matrices.shape)
+    exchange = np.zeros(density_matrices.shape)
+    for start in range(0, ind_a.size, chunk_size):
+        rows_a = ind_a[start : start + chunk_size]
+        rows_b = ind_b[start : start + chunk_size]
+        # (ab|cd) for the pairs ab in the block and all c and d
+        block = packed_eri[pair_index(pair_index(rows_a, rows_b)[:, None, None], index_pairs)]
+        # pairs with a > b also contribute as (ba|cd)
+        is_offdiag = rows_a != rows_b
+        coulomb_rows = np.einsum("rcd,ncd->nr", block, density_matrices)
+        coulomb[:, rows_a, rows_b] = coulomb_rows
+        coulomb[:, rows_b, rows_a] = coulomb_rows
+        np.add.at(
+            exchange,
+            (slice(None), rows_a),
+            np.einsum("rcd,nrd->nrc", block, density_matrices[:, rows_b]),
+        )
+        np.add.at(
+            exchange,
+            (slice(None), rows_b[is_offdiag]),
+            np.einsum("rcd,nrd->nrc", block[is_offdiag], density_matrices[:, rows_a[is_offdiag]]),
+        )
+
+    if is_single:
+        return coulomb[0], exchange[0]
+    return coulomb, exchange
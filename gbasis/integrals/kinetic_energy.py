@@ -2,6 +2,7 @@
 from gbasis.base_two_symm import BaseTwoIndexSymmetric
 from gbasis.contractions import GeneralizedContractionShell
 from gbasis.integrals._diff_operator_int import _compute_differential_operator_integrals
+from gbasis.integrals.shell_pair import shell_pair_primitives
 import numpy as np
 
 
@@ -20,7 +21,7 @@ class KineticEnergyIntegral(BaseTwoIndexSymmetric):
     -------
     __init__(self, contractions)
         Initialize.
-    construct_array_contraction(contractions_one, contractions_two) :
+    construct_array_contraction(contractions_one, contractions_two, shell_pairs=None) :
         **np.ndarray(M_1, L_cart_1, M_2, L_cart_2)**
 
         Return the kinetic energy integral associated with a `GeneralizedContractionShell`
@@ -51,7 +52,7 @@ class KineticEnergyIntegral(BaseTwoIndexSymmetric):
     """
 
     @staticmethod
-    def construct_array_contraction(contractions_one, contractions_two):
+    def construct_array_contraction(contractions_one, contractions_two, shell_pairs=None):
         """Return the evaluations of the given contractions at the given coordinates.
 
         Parameters
@@ -62,6 +63,10 @@ class KineticEnergyIntegral(BaseTwoIndexSymmetric):
         contractions_two : GeneralizedContractionShell
             Contracted Cartesian Gaussians (of the same shell) associated with the second index of
             the kinetic energy integral.
+        shell_pairs : ShellPairData, optional
+            Cache of the primitive-pair quantities that is shared with the other one-electron
+            integrals of the same basis set.
+            Default computes the primitive-pair quantities of the given contractions.
 
         Returns
         -------
@@ -95,14 +100,17 @@ class KineticEnergyIntegral(BaseTwoIndexSymmetric):
 
         coord_a = contractions_one.coord
         angmoms_a = contractions_one.angmom_components_cart
-        alphas_a = contractions_one.exps
-        coeffs_a = contractions_one.coeffs
-        norm_a_prim = contractions_one.norm_prim_cart
         coord_b = contractions_two.coord
         angmoms_b = contractions_two.angmom_components_cart
-        alphas_b = contractions_two.exps
-        coeffs_b = contractions_two.coeffs
-        norm_b_prim = contractions_two.norm_prim_cart
+        (
+            alphas_a,
+            coeffs_a,
+            norm_a_prim,
+            alphas_b,
+            coeffs_b,
+            norm_b_prim,
+            shell_pair,
+        ) = shell_pair_primitives(contractions_one, contractions_two, shell_pairs)
         output = _compute_differential_operator_integrals(
             np.array([[2, 0, 0], [0, 2, 0], [0, 0, 2]]),
             coord_a,
@@ -115,11 +123,12 @@ class KineticEnergyIntegral(BaseTwoIndexSymmetric):
             alphas_b,
             coeffs_b,
             norm_b_prim,
+            shell_pair=shell_pair,
         )
         return -0.5 * np.sum(output, axis=0)
 
 
-def kinetic_energy_integral(basis, transform=None):
+def kinetic_energy_integral(basis, transform=None, shell_pairs=None):
     """Return kinetic energy integral of the given basis set.
 
     Parameters
@@ -132,6 +141,10 @@ def kinetic_energy_integral(basis, transform=None):
         Transformation is applied to the left, i.e. the sum is over the index 1 of `transform`
         and index 0 of the array for contractions.
         Default is no transformation.
+    shell_pairs : ShellPairData, optional
+        Cache of the primitive-pair quantities of `basis` that is shared with the other one-electron
+        integrals of the same basis set.
+        Default computes the primitive-pair quantities from scratch.
 
     Returns
     -------
@@ -146,9 +159,11 @@ def kinetic_energy_integral(basis, transform=None):
     coord_type = [ct for ct in [shell.coord_type for shell in basis]]
 
     if transform is not None:
-        return KineticEnergyIntegral(basis).construct_array_lincomb(transform, coord_type)
+        return KineticEnergyIntegral(basis).construct_array_lincomb(
+            transform, coord_type, shell_pairs=shell_pairs
+        )
     if all(ct == "cartesian" for ct in coord_type):
-        return KineticEnergyIntegral(basis).construct_array_cartesian()
+        return KineticEnergyIntegral(basis).construct_array_cartesian(shell_pairs=shell_pairs)
     if all(ct == "spherical" for ct in coord_type):
-        return KineticEnergyIntegral(basis).construct_array_spherical()
-    return KineticEnergyIntegral(basis).construct_array_mix(coord_type)
+        return KineticEnergyIntegral(basis).construct_array_spherical(shell_pairs=shell_pairs)
+    return KineticEnergyIntegral(basis).construct_array_mix(coord_type, shell_pairs=shell_pairs)
@@ -3,6 +3,8 @@ Python C-API bindings for ``libcint`` GTO integrals library.
 
 """
 
+from concurrent.futures import ThreadPoolExecutor
+
 from contextlib import contextmanager
 
 from ctypes import CDLL, POINTER, Structure, cdll, byref, c_int, c_double, c_void_p
@@ -172,6 +174,58 @@ Regex for matching ``libcint`` optimizer functions.
 """
 
 
+ERI_PERMUTATIONS = (
+    (0, 1, 2, 3),
+    (0, 1, 3, 2),
+    (1, 0, 2, 3),
+    (1, 0, 3, 2),
+    (2, 3, 0, 1),
+    (2, 3, 1, 0),
+    (3, 2, 0, 1),
+    (3, 2, 1, 0),
+)
+r"""
+Permutations of the indices of the electron repulsion integrals (in Chemists' notation) that
+leave the integrals unchanged.
+
+"""
+
+
+INTEGRALS = {
+    "_ovlp": ("make_int1e", "int1e_ovlp", {}),
+    "_kin": ("make_int1e", "int1e_kin", {}),
+    "_nuc": ("make_int1e", "int1e_nuc", {}),
+    "_eri": ("make_int2e", "int2e", {}),
+    "_rinv": ("make_int1e", "int1e_rinv", {"inv_origin": True}),
+    "_mom": (
+        "make_int1e",
+        "int1e_p",
+        {"components": (3,), "constant": -1j, "is_complex": True, "origin": True},
+    ),
+    "_amom": (
+        "make_int1e",
+        "int1e_rxp",
+        {"components": (3,), "constant": -1j, "is_complex": True, "origin": True},
+    ),
+    "_d_ovlp": ("make_int1e", "int1e_ipovlp", {"components": (3,), "hermitian": False}),
+    "_d_kin": ("make_int1e", "int1e_ipkin", {"components": (3,), "hermitian": False}),
+    "_d_nuc": ("make_int1e", "int1e_ipnuc", {"components": (3,), "hermitian": False}),
+    "_d_eri": ("make_int2e", "int2e_ip1", {"components": (3,), "hermitian": False}),
+    "_d_rinv": (
+        "make_int1e",
+        "int1e_iprinv",
+        {"components": (3,), "inv_origin": True, "hermitian": False},
+    ),
+}
+r"""
+Integral methods of ``CBasis``, which are made on first use.
+
+Each attribute name maps to the name of the ``CBasis`` method that makes the integral method,
+the ``libcint`` function name, and the keyword arguments of the maker.
+
+"""
+
+
 def ndptr(enable_null=False, **kwargs):
     r"""
     Wrapped ``numpy.ctypeslib.ndpointer`` that accepts null pointers.
@@ -383,12 +437,16 @@ class CBasis:
         Array of atomic numbers.
     atcoords : np.ndarray(Natm, 3, dtype=float)
         Array of atomic coordinates.
+    n_threads : int
+        Number of threads over which the shell pairs are split when computing integrals.
 
     Methods
     -------
-    make_int1e(self, func_name, components=tuple(), constant=None, is_complex=False, origin=False, inv_origin=False)
+    make_int1e(self, func_name, components=tuple(), constant=None, is_complex=False,
+               origin=False, inv_origin=False, hermitian=True)
         Make an instance-bound 1-electron integral method from a ``libcint`` function.
-    make_int2e(self, func_name, components=tuple(), constant=None, is_complex=False, origin=False, inv_origin=False)
+    make_int2e(self, func_name, components=tuple(), constant=None, is_complex=False,
+               origin=False, inv_origin=False, hermitian=True)
         Make an instance-bound 2-electron integral method from a ``libcint`` function.
     overlap(self)
         Compute the overlap integrals.
@@ -396,22 +454,41 @@ class CBasis:
         Compute the kinetic energy integrals.
     nuclear_attraction(self)
         Compute the nuclear attraction integrals.
-    electron_repulsion(self)
+    electron_repulsion(self, screen_tol=None)
         Compute the electron repulsion integrals.
+    schwarz_bounds(self)
+        Return the Schwarz bounds of the unique shell pairs.
+    jk(self, dm, screen_tol=None)
+        Compute the Coulomb and exchange matrices of density matrices.
     r_inv(self, origin=None)
         Compute the :math:`1/\left|\mathbf{r} - \mathbf{R}_\text{inv}\right|` integrals.
     momentum(self, origin=None)
         Compute the momentum integrals.
     angular_momentum(self, origin=None)
         Compute the angular momentum integrals.
-    point_charge(self, point_coords, point_charges)
+    point_charge(self, point_coords, point_charges, sum_charges=False)
         Compute the point charge integrals.
     moment(self, orders, origin=None)
         Compute the moment integrals.
+    update_coordinates(self, atcoords)
+        Update the atomic coordinates in place.
+    overlap_deriv_integral(self), kinetic_energy_deriv_integral(self)
+        Compute the derivatives of the overlap or kinetic energy integrals for each atom.
+    nuclear_attraction_deriv_integral(self), electron_repulsion_deriv_integral(self)
+        Compute the derivatives of the nuclear attraction or electron repulsion integrals for
+        each atom.
+    overlap_gradient(self, dm), kinetic_energy_gradient(self, dm)
+        Compute the gradient of the overlap or kinetic energy integrals contracted with ``dm``.
+    nuclear_attraction_gradient(self, dm)
+        Compute the gradient of the nuclear attraction integrals contracted with ``dm``.
+    electron_repulsion_gradient(self, dm, exchange_dm=None, exchange_factor=0.5)
+        Compute the gradient of the electron repulsion energy of density matrices.
+    close(self)
+        Free the cached ``libcint`` optimizers and scratch buffers.
 
     """
 
-    def __init__(self, basis, atnums, atcoords, coord_type="spherical"):
+    def __init__(self, basis, atnums, atcoords, coord_type="spherical", n_threads=1):
         r"""
         Initialize a ``CBasis`` instance.
 
@@ -425,8 +502,18 @@ class CBasis:
             X, Y, and Z coordinates for each atomic center.
         coord_type : ('spherical'|'cartesian')
             Type of coordinates.
+        n_threads : int, default=1
+            Number of threads over which the shell pairs are split when computing integrals.
+            Each thread calls ``libcint`` with its own buffers and writes disjoint blocks of the
+            output array; ``ctypes`` releases the GIL during the calls.
 
         """
+        # Check number of threads
+        if isinstance(n_threads, bool) or not isinstance(n_threads, (int, np.integer)):
+            raise TypeError("``n_threads`` must be an integer")
+        if n_threads < 1:
+            raise ValueError("``n_threads`` must be a positive integer")
+
         # Set coord type
         coord_type = coord_type.lower()
         if coord_type == "spherical":
@@ -542,50 +629,108 @@ class CBasis:
         self.bas = bas
         self.env = env
 
+        # Save number of threads
+        self.n_threads = n_threads
+
+        # Make the caches of ``libcint`` optimizers and scratch buffers, which are kept for the
+        # lifetime of the instance (or until ``close`` is called)
+        self._optimizers = {}
+        self._buffers = {}
+
         # Save atom coordinates and atom shell offsets
         self.atnums = atnums.copy()
         self.atcoords = atcoords.copy()
         self._atm_offs = atm_offs
+        self._bfn_atoms = np.concatenate(
+            [[shell.icenter] * (num_angmom(shell) * shell.num_seg_cont) for shell in basis]
+        ).astype(int)
 
-        # Save basis function offsets and ordering permutation
+        # Save basis function offsets, positions of the shells, and ordering permutation
         self._offs = offs
+        self._pos = np.concatenate(([0], np.cumsum(offs)[:-1]))
+        self._shell_pairs = [(ishl, jshl) for ishl in range(nbas) for jshl in range(ishl + 1)]
         self._max_off = max(offs)
         self._permutations = permutations
+        self._identity_permutation = permutations == list(range(nbfn))
 
-        # Set inverse sqrt of overlap integral (temporarily, for __init__)
-        self._ovlp_minhalf = np.ones(nbfn)
-
-        # Integrals
-        self._ovlp = self.make_int1e("int1e_ovlp")
-        self._kin = self.make_int1e("int1e_kin")
-        self._nuc = self.make_int1e("int1e_nuc")
-        self._eri = self.make_int2e("int2e")
-        self._rinv = self.make_int1e("int1e_rinv", inv_origin=True)
-        self._mom = self.make_int1e(
-            "int1e_p", components=(3,), constant=-1j, is_complex=True, origin=True
-        )
-        self._amom = self.make_int1e(
-            "int1e_rxp", components=(3,), constant=-1j, is_complex=True, origin=True
-        )
-        self._d_ovlp = self.make_int1e("int1e_ipovlp", components=(3,))
-        self._d_kin = self.make_int1e("int1e_ipkin", components=(3,))
-        self._d_nuc = self.make_int1e("int1e_ipnuc", components=(3,))
-        self._d_eri = self.make_int2e("int2e_ip1", components=(3,))
-        self._d_rinv = self.make_int1e("int1e_iprinv", components=(3,), inv_origin=True)
+        # Integral methods (see ``INTEGRALS``) and the inverse sqrt of the overlap integral for
+        # cartesian basis sets are made on first use by ``__getattr__``
         self._moments = {}
-        for nx in range(5):
-            for ny in range(5):
-                for nz in range(5):
-                    if 0 < nx + ny + nz < 5:
-                        self._moments[(nx, ny, nz)] = self.make_int1e(
-                            "int1e_" + nx * "x" + ny * "y" + nz * "z",
-                            origin=True,
-                        )
 
-        # Set proper value for inverse sqrt of overlap integral
-        # for cartesian basis sets
-        if coord_type == "cartesian":
-            self._ovlp_minhalf = 1 / np.sqrt(np.diag(self._ovlp()))
+        # Schwarz bounds of the shell pairs are computed on first use
+        self._schwarz_bounds = None
+
+    def __getattr__(self, attr):
+        r"""
+        Make an integral method or the Cartesian normalization of the instance on first use.
+
+        The result is stored as an instance attribute, so this is only called once per attribute.
+
+        Parameters
+        ----------
+        attr : str
+            Name of the attribute.
+
+        Returns
+        -------
+        value : (callable | np.ndarray(Nbasis, dtype=float))
+            Integral method, or inverse sqrt of the diagonal of the overlap integral.
+
+        Raises
+        ------
+        AttributeError
+            If the attribute is not one that is made on first use.
+
+        """
+        if attr in INTEGRALS:
+            maker, func_name, kwargs = INTEGRALS[attr]
+            value = getattr(self, maker)(func_name, **kwargs)
+        elif attr == "_ovlp_minhalf":
+            # The diagonal of the overlap integral is computed with unit normalization first
+            self._ovlp_minhalf = np.ones(self.nbfn)
+            if self.coord_type != "cartesian":
+                return self._ovlp_minhalf
+            try:
+                value = 1 / np.sqrt(np.diag(self._ovlp()))
+            except BaseException:
+                del self._ovlp_minhalf
+                raise
+        else:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{attr}'")
+        setattr(self, attr, value)
+        return value
+
+    def _moment(self, order):
+        r"""
+        Return the moment integral method of an order, making it on first use.
+
+        Parameters
+        ----------
+        order : tuple of int
+            Moment order :math:`\left(x, y, z\right)`.
+
+        Returns
+        -------
+        int1e : callable
+            Moment integral method.
+
+        Raises
+        ------
+        KeyError
+            If there is no ``libcint`` function for the order.
+
+        """
+        order = tuple(int(n) for n in order)
+        try:
+            return self._moments[order]
+        except KeyError:
+            if len(order) != 3 or min(order) < 0 or not 0 < sum(order) < 5:
+                raise
+        nx, ny, nz = order
+        self._moments[order] = self.make_int1e(
+            "int1e_" + nx * "x" + ny * "y" + nz * "z", origin=True
+        )
+        return self._moments[order]
 
     @contextmanager
     def optimizer(self, opt_func):
@@ -611,6 +756,252 @@ class CBasis:
         # Free optimizer from memory (always called)
         LIBCINT.CINTdel_optimizer(byref(opt))
 
+    def _cached_optimizer(self, opt_name):
+        r"""
+        Return the optimizer of a ``libcint`` optimizer function, creating it on first use.
+
+        The optimizer is kept until ``close`` is called, so that repeated integral calls do not
+        rebuild it.
+
+        Parameters
+        ----------
+        opt_name : str
+            Name of a ``libcint`` optimizer C function.
+
+        Returns
+        -------
+        opt : pointer(CINTOpt)
+            An initialized optimizer pointer.
+
+        """
+        try:
+            opt = self._optimizers[opt_name]
+        except KeyError:
+            opt = POINTER(CINTOpt)()
+            LIBCINT[opt_name](byref(opt), self.atm, self.natm, self.bas, self.nbas, self.env)
+            self._optimizers[opt_name] = opt
+        return opt
+
+    def _buffer(self, key, size):
+        r"""
+        Return a zeroed scratch buffer of the instance, allocating it on first use.
+
+        The buffer is reallocated only if a larger one is requested. Callers must zero the part of
+        the buffer that they used before returning.
+
+        Parameters
+        ----------
+        key : hashable
+            Key of the buffer, e.g. the name of the integral and the index of the thread.
+        size : int
+            Number of elements of the buffer.
+
+        Returns
+        -------
+        buf : np.ndarray(size, dtype=float)
+            Scratch buffer.
+
+        """
+        buf = self._buffers.get(key)
+        if buf is None or buf.size < size:
+            buf = np.zeros(size, dtype=c_double)
+            self._buffers[key] = buf
+        return buf[:size]
+
+    def _free_optimizers(self):
+        r"""
+        Free the cached ``libcint`` optimizers.
+
+        """
+        for opt in self._optimizers.values():
+            LIBCINT.CINTdel_optimizer(byref(opt))
+        self._optimizers.clear()
+
+    def update_coordinates(self, atcoords):
+        r"""
+        Update the atomic coordinates in place.
+
+        The coordinates are written into their slots of ``env``; the shells, their ordering, and
+        the scratch buffers are kept. Only the cached optimizers, whose shell pair data depend on
+        the geometry, are freed, and the Schwarz bounds of the shell pairs are reset. The
+        normalization of Cartesian functions does not depend on the geometry and is kept as well.
+
+        Parameters
+        ----------
+        atcoords : np.ndarray(Natm, 3, dtype=float)
+            New X, Y, and Z coordinates for each atomic center.
+
+        Raises
+        ------
+        ValueError
+            If ``atcoords`` does not have the shape (Natm, 3).
+
+        """
+        atcoords = np.asarray(atcoords, dtype=c_double)
+        if atcoords.shape != (self.natm, 3):
+            raise ValueError("``atcoords`` must have the shape (Natm, 3)")
+        # Overwrite the xyz coordinates at the `env` offsets stored in `atm`
+        self.env[self.atm[:, 1, np.newaxis] + np.arange(3)] = atcoords
+        self.atcoords = atcoords.copy()
+        self._free_optimizers()
+        self._schwarz_bounds = None
+
+    def close(self):
+        r"""
+        Free the cached ``libcint`` optimizers and scratch buffers.
+
+        The instance can still be used afterwards; the caches are then rebuilt on demand.
+
+        """
+        self._free_optimizers()
+        self._buffers.clear()
+
+    def __enter__(self):
+        r"""
+        Return the instance for use as a context manager that calls ``close`` on exit.
+
+        """
+        return self
+
+    def __exit__(self, *exc_info):
+        r"""
+        Free the cached ``libcint`` optimizers and scratch buffers on exiting the context.
+
+        """
+        self.close()
+
+    def __del__(self):
+        r"""
+        Free the cached ``libcint`` optimizers when the instance is garbage collected.
+
+        """
+        # The instance may be only partially initialized if ``__init__`` raised, and the module
+        # globals may already be cleared at interpreter shutdown
+        if self.__dict__.get("_optimizers") and LIBCINT is not None:
+            self.close()
+
+    def _map_threads(self, func, items):
+        r"""
+        Apply a function to the items split evenly over the threads of the instance.
+
+        Parameters
+        ----------
+        func : callable
+            Function that takes the index of the thread and a list of items. It is called once per
+            thread with every ``n_threads``-th item, which balances the work when the cost of the
+            items grows along the list.
+        items : list
+            Items (e.g. shell pairs) to process.
+
+        """
+        if self.n_threads == 1:
+            func(0, items)
+            return
+        with ThreadPoolExecutor(max_workers=self.n_threads) as executor:
+            # Consume the iterator so that any exception is raised here
+            list(
+                executor.map(
+                    func,
+                    range(self.n_threads),
+                    [items[i :: self.n_threads] for i in range(self.n_threads)],
+                )
+            )
+
+    def _normalize(self, out, n_axes):
+        r"""
+        Normalize the Cartesian integrals in place along the leading axes of an array.
+
+        Parameters
+        ----------
+        out : np.ndarray
+            Integral array whose first ``n_axes`` axes are basis function axes.
+        n_axes : int
+            Number of basis function axes.
+
+        """
+        for axis in range(n_axes):
+            shape = [1] * out.ndim
+            shape[axis] = -1
+            out *= self._ovlp_minhalf.reshape(shape)
+
+    def schwarz_bounds(self):
+        r"""
+        Return the Schwarz bounds of the unique shell pairs.
+
+        The bound of the shell pair :math:`(i, j)` is :math:`\max_{ab} \sqrt{(ab|ab)}` over its
+        basis functions :math:`a \in i, b \in j`, computed from the diagonal blocks of the
+        ``libcint`` electron repulsion integrals. The bounds are cached until the coordinates are
+        updated.
+
+        Returns
+        -------
+        bounds : np.ndarray(Npair, dtype=float)
+            Schwarz bounds of the unique shell pairs :math:`(i, j)` with :math:`j \leq i`, in the
+            order ``(0, 0), (1, 0), (1, 1), (2, 0), ...``.
+
+        """
+        if self._schwarz_bounds is not None:
+            return self._schwarz_bounds
+
+        # Get C function
+        func = LIBCINT["int2e" + ("_cart" if self.coord_type == "cartesian" else "_sph")]
+        opt = self._cached_optimizer("int2e_optimizer")
+
+        # Normalization of the basis functions in the ``libcint`` ordering
+        norm = np.empty(self.nbfn, dtype=np.float64)
+        norm[np.asarray(self._permutations)] = self._ovlp_minhalf
+
+        buf = self._buffer(("int2e", 0), self._max_off**4)
+        shls = np.zeros(4, dtype=c_int)
+        bounds = np.zeros(len(self._shell_pairs), dtype=np.float64)
+        for ij, (ishl, jshl) in enumerate(self._shell_pairs):
+            shls[:] = ishl, jshl, ishl, jshl
+            func(buf, None, shls, self.atm, self.natm, self.bas, self.nbas, self.env, opt, None)
+            # Get the (ab|ab) integrals, with `a` running fastest
+            p_off, q_off = self._offs[ishl], self._offs[jshl]
+            diag = np.diagonal(buf[: (p_off * q_off) ** 2].reshape(p_off * q_off, -1, order="F"))
+            pair_norm = np.outer(
+                norm[self._pos[ishl] : self._pos[ishl] + p_off],
+                norm[self._pos[jshl] : self._pos[jshl] + q_off],
+            ).ravel(order="F")
+            bounds[ij] = np.sqrt(np.max(np.abs(diag) * pair_norm**2))
+            # Reset `buf`
+            buf[:] = 0
+
+        self._schwarz_bounds = bounds
+        return bounds
+
+    def _screened_quartets(self, screen_tol):
+        r"""
+        Return the unique shell quartets whose Schwarz bound is not smaller than a tolerance.
+
+        The shell pairs are sorted by decreasing bound, so that the significant ket shell pairs of
+        each bra shell pair are a contiguous run of the sorted pairs.
+
+        Parameters
+        ----------
+        screen_tol : float
+            Tolerance of the Schwarz bound :math:`\sqrt{(ij|ij)} \sqrt{(kl|kl)}`.
+
+        Returns
+        -------
+        quartets : list of tuple
+            Pairs of a bra shell pair and the indices of its ket shell pairs in the list of unique
+            shell pairs. Each unique, significant shell quartet appears once.
+
+        """
+        bounds = self.schwarz_bounds()
+        order = np.argsort(-bounds, kind="stable")
+        sorted_bounds = bounds[order]
+        quartets = []
+        for p, ij in enumerate(order):
+            # Pairs further down the sorted list have smaller bounds
+            if sorted_bounds[p] ** 2 < screen_tol:
+                break
+            stop = p + np.count_nonzero(sorted_bounds[p] * sorted_bounds[p:] >= screen_tol)
+            quartets.append((self._shell_pairs[ij], order[p:stop]))
+        return quartets
+
     def make_int1e(
         self,
         func_name,
@@ -619,6 +1010,7 @@ class CBasis:
         is_complex=False,
         origin=False,
         inv_origin=False,
+        hermitian=True,
     ):
         r"""
         Make an instance-bound 1-electron integral method from a ``libcint`` function.
@@ -640,14 +1032,25 @@ class CBasis:
             Whether you must specify an origin ``R`` for the integral computation.
         inv_origin : bool, default=False
             Whether you must specify an origin ``1 / |r - R|`` for the integral computation.
+        hermitian : bool, default=True
+            Whether the integrals are symmetric in the two basis functions, so that only the
+            unique shell pairs are computed. Must be False for e.g. the ``ip`` integrals, where
+            only the first basis function is differentiated.
 
         """
         # Get C functions
         func = LIBCINT[func_name + ("_cart" if self.coord_type == "cartesian" else "_sph")]
-        opt_func = LIBCINT[func_name + "_optimizer"]
+        opt_name = func_name + "_optimizer"
+
+        # Get the shell pairs to compute
+        if hermitian:
+            shell_pairs = self._shell_pairs
+        else:
+            shell_pairs = [(ishl, jshl) for ishl in range(self.nbas) for jshl in range(self.nbas)]
 
         # Handle multi-component integral values
         n_components = len(components)
+        result_components = tuple(components)
         if n_components == 0:
             components = (1,)
             no_comp = True
@@ -663,14 +1066,8 @@ class CBasis:
         has_origin_arg = bool(origin)
         has_inv_origin_arg = bool(inv_origin)
 
-        # Make einsum string for normalization
-        norm_einsum = (
-            f"a,b,ab{'cdefghijklmnopqrstuvwxyz'[:n_components]}->"
-            + f"ab{'cdefghijklmnopqrstuvwxyz'[:n_components]}"
-        )
-
         # Make instance-bound integral method
-        def int1e(notation="physicist", transform=None, origin=None, inv_origin=None):
+        def int1e(notation="physicist", transform=None, origin=None, inv_origin=None, out=None):
             # Handle ``notation`` argument
             if notation not in ("physicist", "chemist"):
                 raise ValueError("``notation`` must be one of 'physicist' or 'chemist'")
@@ -693,78 +1090,93 @@ class CBasis:
             elif inv_origin is not None:
                 raise ValueError("``inv_origin`` must not be specified")
 
-            # Make output array
-            out = np.zeros(out_shape, dtype=c_double, order="F")
-
-            # Make temporary arrays
-            buf = np.zeros(buf_shape, dtype=c_double)
-            shls = np.zeros(2, dtype=c_int)
-
-            # Evaluate the integral function over all shells
-            with self.optimizer(opt_func) as opt:
-                ipos = 0
-                for ishl in range(self.nbas):
-                    shls[0] = ishl
-                    p_off = self._offs[ishl]
-                    jpos = 0
-                    for jshl in range(ishl + 1):
-                        shls[1] = jshl
-                        q_off = self._offs[jshl]
-                        # Call the C function to fill `buf`
-                        func(
-                            buf,
-                            None,
-                            shls,
-                            self.atm,
-                            self.natm,
-                            self.bas,
-                            self.nbas,
-                            self.env,
-                            opt,
-                            None,
-                        )
-                        # Fill `out` array
-                        buf_array = buf[: p_off * q_off * prod_comp].reshape(
-                            p_off, q_off, *components, order="F"
-                        )
-                        for p in range(p_off):
-                            i_off = p + ipos
-                            for q in range(q_off):
-                                j_off = q + jpos
-                                out[i_off, j_off] = buf_array[p, q]
-                                out[j_off, i_off] = buf_array[p, q]
-                        # Reset `buf`
-                        buf[:] = 0
-                        # Iterate `jpos`
-                        jpos += q_off
-                    # Iterate `ipos`
-                    ipos += p_off
-
-            # Cast `out` to complex if `is_complex` is set
+            # Handle out argument
+            if out is not None:
+                nrow = self.nbfn if transform is None else transform.shape[0]
+                if out.shape != (nrow, nrow) + result_components:
+                    raise ValueError("``out`` must have the shape of the integral array")
+
+            # Make integral array, or fill ``out`` directly if it needs no further processing
+            direct = (
+                out is not None
+                and transform is None
+                and not is_complex
+                and self._identity_permutation
+                and out.dtype == np.float64
+            )
+            if direct:
+                ints = out[..., np.newaxis] if no_comp else out
+            else:
+                ints = np.zeros(out_shape, dtype=c_double, order="F")
+
+            # Evaluate the integral function over the given unique shell pairs
+            def compute(ithread, shell_pairs):
+                # Get the scratch buffer of the thread and make temporary arrays
+                buf = self._buffer((func_name, ithread), buf_shape)
+                shls = np.zeros(2, dtype=c_int)
+                for ishl, jshl in shell_pairs:
+                    shls[:] = ishl, jshl
+                    ipos, jpos = self._pos[ishl], self._pos[jshl]
+                    p_off, q_off = self._offs[ishl], self._offs[jshl]
+                    # Call the C function to fill `buf`
+                    func(
+                        buf,
+                        None,
+                        shls,
+                        self.atm,
+                        self.natm,
+                        self.bas,
+                        self.nbas,
+                        self.env,
+                        opt,
+                        None,
+                    )
+                    # Fill the lower triangular block of integral array
+                    ints[ipos : ipos + p_off, jpos : jpos + q_off] = buf[
+                        : p_off * q_off * prod_comp
+                    ].reshape(p_off, q_off, *components, order="F")
+                    # Reset `buf`
+                    buf[:] = 0
+
+            opt = self._cached_optimizer(opt_name)
+            self._map_threads(compute, shell_pairs)
+
+            # Symmetrize integral array from its lower triangle
+            if hermitian:
+                upper = np.triu_indices(self.nbfn, k=1)
+                ints[upper] = ints[upper[::-1]]
+
+            # Cast integral array to complex if `is_complex` is set
             if is_complex:
-                out = out.reshape(*out.shape[:-2], -1).view(np.complex_)
+                ints = ints.reshape(*ints.shape[:-2], -1).view(np.complex128)
 
-            # Remove useless axis in `out` if no `components` was given
+            # Remove useless axis in integral array if no `components` was given
             if no_comp:
-                out = out.squeeze(axis=-1)
+                ints = ints.squeeze(axis=-1)
 
             # Multiply by constant
             if constant is not None:
-                out *= constant
+                ints *= constant
 
             # Apply permutation
-            out = out[self._permutations, :][:, self._permutations]
+            if not self._identity_permutation:
+                ints = ints[self._permutations, :][:, self._permutations]
 
             # Normalize integrals
             if self.coord_type == "cartesian":
-                out = np.einsum(norm_einsum, self._ovlp_minhalf, self._ovlp_minhalf, out)
+                self._normalize(ints, 2)
 
             # Apply transformation
             if transform is not None:
-                out = np.tensordot(transform, out, (1, 0))
-                out = np.tensordot(transform, out, (1, 1))
-                out = np.swapaxes(out, 0, 1)
-
+                ints = np.tensordot(transform, ints, (1, 0))
+                ints = np.tensordot(transform, ints, (1, 1))
+                ints = np.swapaxes(ints, 0, 1)
+
+            # Copy integrals to ``out`` if they were not computed in it
+            if out is None:
+                return ints
+            if not direct:
+                out[...] = ints
             return out
 
         # Return instance-bound integral method
@@ -778,6 +1190,7 @@ class CBasis:
         is_complex=False,
         origin=False,
         inv_origin=False,
+        hermitian=True,
     ):
         r"""
         Make an instance-bound 2-electron integral method from a ``libcint`` function.
@@ -799,14 +1212,27 @@ class CBasis:
             Whether you must specify an origin ``R`` for the integral computation.
         inv_origin : bool, default=False
             Whether you must specify an origin ``1 / |r - R|`` for the integral computation.
+        hermitian : bool, default=True
+            Whether the integrals have the full eight-fold permutational symmetry, so that only the
+            unique shell quartets are computed. If False, the integrals are only assumed to be
+            symmetric in the last two basis functions, as e.g. the ``ip1`` integrals.
 
         """
         # Get C functions
         func = LIBCINT[func_name + ("_cart" if self.coord_type == "cartesian" else "_sph")]
-        opt_func = LIBCINT[func_name + "_optimizer"]
+        opt_name = func_name + "_optimizer"
+
+        # Get the shell pairs of the first two indices and the symmetric permutations of indices
+        if hermitian:
+            bra_pairs = self._shell_pairs
+            permutations = ERI_PERMUTATIONS
+        else:
+            bra_pairs = [(ishl, jshl) for ishl in range(self.nbas) for jshl in range(self.nbas)]
+            permutations = ERI_PERMUTATIONS[:2]
 
         # Handle multi-component integral values
         n_components = len(components)
+        result_components = tuple(components)
         if n_components == 0:
             components = (1,)
             no_comp = True
@@ -816,20 +1242,22 @@ class CBasis:
             components += (2,)
         prod_comp = np.prod(components, dtype=int)
         out_shape = (self.nbfn, self.nbfn, self.nbfn, self.nbfn) + components
+        comp_axes = tuple(range(4, 4 + len(components)))
         buf_shape = prod_comp * self._max_off**4
 
         # Handle [inv_]origin argument (prevent shadowing)
         has_origin_arg = bool(origin)
         has_inv_origin_arg = bool(inv_origin)
 
-        # Make einsum string for normalization
-        norm_einsum = (
-            f"a,b,c,d,abcd{'efghijklmnopqrstuvwxyz'[:n_components]}->"
-            + f"abcd{'efghijklmnopqrstuvwxyz'[:n_components]}"
-        )
-
         # Make instance-bound integral method
-        def int2e(notation="physicist", transform=None, origin=None, inv_origin=None):
+        def int2e(
+            notation="physicist",
+            transform=None,
+            origin=None,
+            inv_origin=None,
+            out=None,
+            screen_tol=None,
+        ):
             # Handle ``notation`` argument
             if notation == "physicist":
                 physicist = True
@@ -856,143 +1284,133 @@ class CBasis:
             elif inv_origin is not None:
                 raise ValueError("``inv_origin`` must not be specified")
 
-            # Make output array
-            out = np.zeros(out_shape, dtype=c_double, order="F")
+            # Handle out argument
+            if out is not None:
+                nrow = self.nbfn if transform is None else transform.shape[0]
+                if out.shape != (nrow, nrow, nrow, nrow) + result_components:
+                    raise ValueError("``out`` must have the shape of the integral array")
+
+            # Make integral array (in Chemists' notation), or fill ``out`` directly if it needs no
+            # further processing
+            direct = (
+                out is not None
+                and transform is None
+                and not is_complex
+                and self._identity_permutation
+                and out.dtype == np.float64
+            )
+            if direct:
+                ints = np.swapaxes(out, 1, 2) if physicist else out
+                if no_comp:
+                    ints = ints[..., np.newaxis]
+                # Screened shell quartets are not written
+                if screen_tol is not None:
+                    ints[...] = 0
+            else:
+                ints = np.zeros(out_shape, dtype=c_double, order="F")
+
+            # Get the shell quartets to compute, as pairs of a bra shell pair and the indices of
+            # its ket shell pairs in ``self._shell_pairs``; without screening, these are the unique
+            # shell quartets (ij, kl) with kl <= ij (or any kl if not `hermitian`)
+            if screen_tol is None:
+                if hermitian:
+                    quartets = [(pair, range(ij + 1)) for ij, pair in enumerate(bra_pairs)]
+                else:
+                    quartets = [(pair, range(len(self._shell_pairs))) for pair in bra_pairs]
+            elif hermitian:
+                quartets = self._screened_quartets(screen_tol)
+            else:
+                raise ValueError(
+                    "``screen_tol`` is only supported for integrals with eight-fold symmetry"
+                )
 
-            # Make temporary arrays
-            buf = np.zeros(buf_shape, dtype=c_double)
-            shls = np.zeros(4, dtype=c_int)
+            # Evaluate the integral function over the given shell quartets
+            def compute(ithread, quartets):
+                # Get the scratch buffer of the thread and make temporary arrays
+                buf = self._buffer((func_name, ithread), buf_shape)
+                shls = np.zeros(4, dtype=c_int)
+                for bra_pair, kls in quartets:
+                    shls[:2] = bra_pair
+                    for kl in kls:
+                        shls[2:] = self._shell_pairs[kl]
+                        # Call the C function to fill `buf`
+                        func(
+                            buf,
+                            None,
+                            shls,
+                            self.atm,
+                            self.natm,
+                            self.bas,
+                            self.nbas,
+                            self.env,
+                            opt,
+                            None,
+                        )
+                        # Fill the symmetric blocks of integral array
+                        offs = [self._offs[shl] for shl in shls]
+                        buf_array = buf[: np.prod(offs) * prod_comp].reshape(
+                            *offs, *components, order="F"
+                        )
+                        slices = [
+                            slice(self._pos[shl], self._pos[shl] + off)
+                            for shl, off in zip(shls, offs)
+                        ]
+                        for perm in permutations:
+                            ints[tuple(slices[axis] for axis in perm)] = buf_array.transpose(
+                                *perm, *comp_axes
+                            )
+                        # Reset `buf`
+                        buf[:] = 0
 
-            # Evaluate the integral function over all shells
-            with self.optimizer(opt_func) as opt:
-                ipos = 0
-                for ishl in range(self.nbas):
-                    shls[0] = ishl
-                    p_off = self._offs[ishl]
-                    jpos = 0
-                    for jshl in range(ishl + 1):
-                        ij = ((ishl + 1) * ishl) // 2 + jshl
-                        shls[1] = jshl
-                        q_off = self._offs[jshl]
-                        kpos = 0
-                        for kshl in range(self.nbas):
-                            shls[2] = kshl
-                            r_off = self._offs[kshl]
-                            lpos = 0
-                            for lshl in range(kshl + 1):
-                                kl = ((kshl + 1) * kshl) // 2 + lshl
-                                shls[3] = lshl
-                                s_off = self._offs[lshl]
-                                if ij < kl:
-                                    lpos += s_off
-                                    continue
-                                # Call the C function to fill `buf`
-                                func(
-                                    buf,
-                                    None,
-                                    shls,
-                                    self.atm,
-                                    self.natm,
-                                    self.bas,
-                                    self.nbas,
-                                    self.env,
-                                    opt,
-                                    None,
-                                )
-                                # Fill `out` array
-                                buf_array = buf[
-                                    : p_off * q_off * r_off * s_off * prod_comp
-                                ].reshape(p_off, q_off, r_off, s_off, *components, order="F")
-                                for p in range(p_off):
-                                    i_off = p + ipos
-                                    for q in range(q_off):
-                                        j_off = q + jpos
-                                        for r in range(r_off):
-                                            k_off = r + kpos
-                                            for s in range(s_off):
-                                                l_off = s + lpos
-                                                out[i_off, j_off, k_off, l_off] = buf_array[
-                                                    p, q, r, s
-                                                ]
-                                                out[i_off, j_off, l_off, k_off] = buf_array[
-                                                    p, q, r, s
-                                                ]
-                                                out[j_off, i_off, k_off, l_off] = buf_array[
-                                                    p, q, r, s
-                                                ]
-                                                out[j_off, i_off, l_off, k_off] = buf_array[
-                                                    p, q, r, s
-                                                ]
-                                                out[k_off, l_off, i_off, j_off] = buf_array[
-                                                    p, q, r, s
-                                                ]
-                                                out[k_off, l_off, j_off, i_off] = buf_array[
-                                                    p, q, r, s
-                                                ]
-                                                out[l_off, k_off, i_off, j_off] = buf_array[
-                                                    p, q, r, s
-                                                ]
-                                                out[l_off, k_off, j_off, i_off] = buf_array[
-                                                    p, q, r, s
-                                                ]
-                                # Reset `buf`
-                                buf[:] = 0
-                                # Iterate `lpos`
-                                lpos += s_off
-                            # Iterate `kpos`
-                            kpos += r_off
-                        # Iterate `jpos`
-                        jpos += q_off
-                    # Iterate `ipos`
-                    ipos += p_off
-
-            # Cast `out` to complex if `is_complex` is set
+            opt = self._cached_optimizer(opt_name)
+            self._map_threads(compute, quartets)
+
+            # Cast integral array to complex if `is_complex` is set
             if is_complex:
-                out = out.reshape(*out.shape[:-2], out.shape[-2] * 2).view(np.complex_)
+                ints = ints.reshape(*ints.shape[:-2], ints.shape[-2] * 2).view(np.complex128)
 
-            # Remove useless axis in `out` if no `components` was given
+            # Remove useless axis in integral array if no `components` was given
             if no_comp:
-                out = out.squeeze(axis=-1)
+                ints = ints.squeeze(axis=-1)
 
             # Multiply by constant
             if constant is not None:
-                out *= constant
+                ints *= constant
 
             # Apply permutation
-            out = out[self._permutations]
-            out = out[:, self._permutations]
-            out = out[:, :, self._permutations]
-            out = out[:, :, :, self._permutations]
+            if not self._identity_permutation:
+                ints = ints[self._permutations]
+                ints = ints[:, self._permutations]
+                ints = ints[:, :, self._permutations]
+                ints = ints[:, :, :, self._permutations]
 
             # Normalize integrals
             if self.coord_type == "cartesian":
-                out = np.einsum(
-                    norm_einsum,
-                    self._ovlp_minhalf,
-                    self._ovlp_minhalf,
-                    self._ovlp_minhalf,
-                    self._ovlp_minhalf,
-                    out,
-                )
+                self._normalize(ints, 4)
 
-            # Transpose integrals in `out` array to proper notation
+            # Transpose integrals to proper notation
             if physicist:
-                out = out.transpose(0, 2, 1, 3)
+                ints = np.swapaxes(ints, 1, 2)
 
             # Apply transformation
             if transform is not None:
-                out = np.tensordot(transform, out, (1, 0))
-                out = np.tensordot(transform, out, (1, 1))
-                out = np.tensordot(transform, out, (1, 2))
-                out = np.tensordot(transform, out, (1, 3))
-                out = np.swapaxes(np.swapaxes(out, 0, 3), 1, 2)
-
+                ints = np.tensordot(transform, ints, (1, 0))
+                ints = np.tensordot(transform, ints, (1, 1))
+                ints = np.tensordot(transform, ints, (1, 2))
+                ints = np.tensordot(transform, ints, (1, 3))
+                ints = np.swapaxes(np.swapaxes(ints, 0, 3), 1, 2)
+
+            # Copy integrals to ``out`` if they were not computed in it
+            if out is None:
+                return ints
+            if not direct:
+                out[...] = ints
             return out
 
         # Return instance-bound integral method
         return int2e
 
-    def overlap_integral(self, notation="physicist", transform=None):
+    def overlap_integral(self, notation="physicist", transform=None, out=None):
         r"""
         Compute the overlap integrals.
 
@@ -1006,6 +1424,8 @@ class CBasis:
             Transformation is applied to the left, i.e. the sum is over the index 1 of `transform`
             and index 0 of the array for contractions.
             Default is no transformation.
+        out : np.ndarray(Nbasis, Nbasis, dtype=float), optional
+            Array in which to store the integrals.
 
         Returns
         -------
@@ -1013,9 +1433,9 @@ class CBasis:
             Integral array.
 
         """
-        return self._ovlp(notation=notation, transform=transform)
+        return self._ovlp(notation=notation, transform=transform, out=out)
 
-    def kinetic_energy_integral(self, notation="physicist", transform=None):
+    def kinetic_energy_integral(self, notation="physicist", transform=None, out=None):
         r"""
         Compute the kinetic energy integrals.
 
@@ -1029,6 +1449,8 @@ class CBasis:
             Transformation is applied to the left, i.e. the sum is over the index 1 of `transform`
             and index 0 of the array for contractions.
             Default is no transformation.
+        out : np.ndarray(Nbasis, Nbasis, dtype=float), optional
+            Array in which to store the integrals.
 
         Returns
         -------
@@ -1036,9 +1458,9 @@ class CBasis:
             Integral array.
 
         """
-        return self._kin(notation=notation, transform=transform)
+        return self._kin(notation=notation, transform=transform, out=out)
 
-    def nuclear_attraction_integral(self, notation="physicist", transform=None):
+    def nuclear_attraction_integral(self, notation="physicist", transform=None, out=None):
         r"""
         Compute the nuclear attraction integrals.
 
@@ -1052,6 +1474,8 @@ class CBasis:
             Transformation is applied to the left, i.e. the sum is over the index 1 of `transform`
             and index 0 of the array for contractions.
             Default is no transformation.
+        out : np.ndarray(Nbasis, Nbasis, dtype=float), optional
+            Array in which to store the integrals.
 
         Returns
         -------
@@ -1059,9 +1483,11 @@ class CBasis:
             Integral array.
 
         """
-        return self._nuc(notation=notation, transform=transform)
+        return self._nuc(notation=notation, transform=transform, out=out)
 
-    def electron_repulsion_integral(self, notation="physicist", transform=None):
+    def electron_repulsion_integral(
+        self, notation="physicist", transform=None, out=None, screen_tol=None
+    ):
         r"""
         Compute the electron repulsion integrals.
 
@@ -1075,6 +1501,13 @@ class CBasis:
             Transformation is applied to the left, i.e. the sum is over the index 1 of `transform`
             and index 0 of the array for contractions.
             Default is no transformation.
+        out : np.ndarray(Nbasis, Nbasis, Nbasis, Nbasis, dtype=float), optional
+            Array in which to store the integrals.
+        screen_tol : float, optional
+            Tolerance for the Schwarz screening of the shell quartets. Only the shell quartets
+            whose Schwarz bound (see ``schwarz_bounds``) is not smaller than ``screen_tol`` are
+            computed; the others are set to zero.
+            Default is no screening.
 
         Returns
         -------
@@ -1082,9 +1515,118 @@ class CBasis:
             Integral array.
 
         """
-        return self._eri(notation=notation, transform=transform)
+        return self._eri(notation=notation, transform=transform, out=out, screen_tol=screen_tol)
+
+    def jk(self, dm, screen_tol=None):
+        r"""
+        Compute the Coulomb and exchange matrices of density matrices.
+
+        .. math::
+
+            J_{ab} &= \sum_{cd} (ab|cd) D_{cd}\\
+            K_{ac} &= \sum_{bd} (ab|cd) D_{bd}
+
+        The ``libcint`` buffer of each unique shell quartet is contracted with the density
+        matrices as soon as it is computed, so the four-index array of the integrals is never
+        stored.
+
+        Parameters
+        ----------
+        dm : np.ndarray(Nbasis, Nbasis, dtype=float) or np.ndarray(N, Nbasis, Nbasis, dtype=float)
+            Density matrices.
+            If a three-dimensional array is given, the first axis corresponds to the different
+            density matrices, e.g. the alpha and beta density matrices.
+        screen_tol : float, optional
+            Tolerance for the Schwarz screening of the shell quartets. Only the shell quartets
+            whose Schwarz bound (see ``schwarz_bounds``) is not smaller than ``screen_tol`` are
+            computed.
+            Default is no screening.
+
+        Returns
+        -------
+        coulomb : np.ndarray(Nbasis, Nbasis, dtype=float) or np.ndarray(N, Nbasis, Nbasis)
+            Coulomb matrices of the density matrices.
+        exchange : np.ndarray(Nbasis, Nbasis, dtype=float) or np.ndarray(N, Nbasis, Nbasis)
+            Exchange matrices of the density matrices.
+
+        Raises
+        ------
+        TypeError
+            If ``dm`` is not a two- or three-dimensional array.
+        ValueError
+            If the last two dimensions of ``dm`` are not equal to the number of basis functions.
+
+        """
+        # Check density matrices and convert them to the ``libcint`` ordering
+        if not (isinstance(dm, np.ndarray) and dm.ndim in (2, 3)):
+            raise TypeError("``dm`` must be a two- or three-dimensional array")
+        dm = self._check_density_matrix(dm)
+        is_single = dm.ndim == 2
+        dm = self._to_libcint_order(dm.reshape(-1, self.nbfn, self.nbfn))
+
+        # Get C function and the shell quartets to compute
+        func = LIBCINT["int2e" + ("_cart" if self.coord_type == "cartesian" else "_sph")]
+        if screen_tol is None:
+            quartets = [(pair, range(ij + 1)) for ij, pair in enumerate(self._shell_pairs)]
+        else:
+            quartets = self._screened_quartets(screen_tol)
+        slices = [slice(pos, pos + off) for pos, off in zip(self._pos, self._offs)]
+        coulomb = np.zeros((self.n_threads,) + dm.shape, dtype=np.float64)
+        exchange = np.zeros((self.n_threads,) + dm.shape, dtype=np.float64)
+
+        # Contract each distinct permutation of the given shell quartets
+        def compute(ithread, quartets):
+            # Get the scratch buffer of the thread and make temporary arrays
+            buf = self._buffer(("int2e", ithread), self._max_off**4)
+            shls = np.zeros(4, dtype=c_int)
+            for bra_pair, kls in quartets:
+                shls[:2] = bra_pair
+                for kl in kls:
+                    shls[2:] = self._shell_pairs[kl]
+                    # Call the C function to fill `buf`
+                    func(
+                        buf,
+                        None,
+                        shls,
+                        self.atm,
+                        self.natm,
+                        self.bas,
+                        self.nbas,
+                        self.env,
+                        opt,
+                        None,
+                    )
+                    shells = tuple(int(shl) for shl in shls)
+                    offs = [self._offs[shl] for shl in shells]
+                    block = buf[: np.prod(offs)].reshape(*offs, order="F")
+                    visited = set()
+                    for perm in ERI_PERMUTATIONS:
+                        perm_shells = tuple(shells[axis] for axis in perm)
+                        if perm_shells in visited:
+                            continue
+                        visited.add(perm_shells)
+                        a, b, c, d = [slices[shl] for shl in perm_shells]
+                        perm_block = block.transpose(perm)
+                        coulomb[ithread, :, a, b] += np.einsum(
+                            "abcd,ncd->nab", perm_block, dm[:, c, d]
+                        )
+                        exchange[ithread, :, a, c] += np.einsum(
+                            "abcd,nbd->nac", perm_block, dm[:, b, d]
+                        )
+                    # Reset `buf`
+                    buf[:] = 0
+
+        opt = self._cached_optimizer("int2e_optimizer")
+        self._map_threads(compute, quartets)
+
+        # Convert the matrices to the ordering of this instance
+        coulomb = self._from_libcint_order(coulomb.sum(axis=0))
+        exchange = self._from_libcint_order(exchange.sum(axis=0))
+        if is_single:
+            return coulomb[0], exchange[0]
+        return coulomb, exchange
 
-    def r_inv_integral(self, origin=None, notation="physicist", transform=None):
+    def r_inv_integral(self, origin=None, notation="physicist", transform=None, out=None):
         r"""
         Compute the :math:`1/\left|\mathbf{r} - \mathbf{R}_\text{inv}\right|` integrals.
 
@@ -1100,6 +1642,8 @@ class CBasis:
             Transformation is applied to the left, i.e. the sum is over the index 1 of `transform`
             and index 0 of the array for contractions.
             Default is no transformation.
+        out : np.ndarray(Nbasis, Nbasis, dtype=float), optional
+            Array in which to store the integrals.
 
         Returns
         -------
@@ -1107,9 +1651,9 @@ class CBasis:
             Integral array.
 
         """
-        return self._rinv(inv_origin=origin, notation=notation, transform=transform)
+        return self._rinv(inv_origin=origin, notation=notation, transform=transform, out=out)
 
-    def momentum_integral(self, origin=None, notation="physicist", transform=None):
+    def momentum_integral(self, origin=None, notation="physicist", transform=None, out=None):
         r"""
         Compute the momentum integrals.
 
@@ -1125,6 +1669,8 @@ class CBasis:
             Transformation is applied to the left, i.e. the sum is over the index 1 of `transform`
             and index 0 of the array for contractions.
             Default is no transformation.
+        out : np.ndarray(Nbasis, Nbasis, 3, dtype=complex), optional
+            Array in which to store the integrals.
 
         Returns
         -------
@@ -1132,9 +1678,11 @@ class CBasis:
             Integral array.
 
         """
-        return self._mom(origin=origin, notation=notation, transform=transform)
+        return self._mom(origin=origin, notation=notation, transform=transform, out=out)
 
-    def angular_momentum_integral(self, origin=None, notation="physicist", transform=None):
+    def angular_momentum_integral(
+        self, origin=None, notation="physicist", transform=None, out=None
+    ):
         r"""
         Compute the angular momentum integrals.
 
@@ -1150,6 +1698,8 @@ class CBasis:
             Transformation is applied to the left, i.e. the sum is over the index 1 of `transform`
             and index 0 of the array for contractions.
             Default is no transformation.
+        out : np.ndarray(Nbasis, Nbasis, 3, dtype=complex), optional
+            Array in which to store the integrals.
 
         Returns
         -------
@@ -1158,14 +1708,25 @@ class CBasis:
 
         """
         raise NotImplementedError("Angular momentum integral doesn't work; see Issue #149")
-        # return self._amom(origin=origin, notation=notation, transform=transform)
+        # return self._amom(origin=origin, notation=notation, transform=transform, out=out)
 
     def point_charge_integral(
-        self, point_coords, point_charges, notation="physicist", transform=None
+        self,
+        point_coords,
+        point_charges,
+        notation="physicist",
+        transform=None,
+        sum_charges=False,
+        out=None,
     ):
         r"""
         Compute the point charge integrals.
 
+        All of the point charges are evaluated in a single pass over the shell pairs using the
+        ``libcint`` function ``int1e_grids``, which computes the
+        :math:`1/\left|\mathbf{r} - \mathbf{R}_C\right|` integrals of a shell pair for all of the
+        point charges :math:`C` at once.
+
         Parameters
         ----------
         point_coords : np.ndarray(N, 3, dtype=float)
@@ -1180,24 +1741,111 @@ class CBasis:
             Transformation is applied to the left, i.e. the sum is over the index 1 of `transform`
             and index 0 of the array for contractions.
             Default is no transformation.
+        sum_charges : bool, default=False
+            Whether to return the sum of the integrals over the point charges (e.g. the interaction
+            of the electrons with the point charges of a QM/MM environment) instead of the integrals
+            of each point charge. The integrals of each point charge are then never stored.
+        out : np.ndarray(Nbasis, Nbasis, N, dtype=float), optional
+            Array in which to store the integrals.
+            If ``sum_charges`` is True, its shape must be (Nbasis, Nbasis).
 
         Returns
         -------
         out : np.ndarray(Nbasis, Nbasis, N, dtype=float)
             Integral array.
+            If ``sum_charges`` is True, the array of shape (Nbasis, Nbasis) is returned instead.
+
+        Raises
+        ------
+        ValueError
+            If ``out`` does not have the shape of the integral array.
 
         """
-        # Make output array
-        out = np.zeros((self.nbfn, self.nbfn, len(point_charges)), dtype=c_double, order="F")
-        # Compute 1/|r - r_{inv}| for each charge
-        for icharge, (coord, charge) in enumerate(zip(point_coords, point_charges)):
-            val = self._rinv(inv_origin=coord, notation=notation, transform=transform)
-            val *= -charge
-            out[:, :, icharge] = val
-        # Return integrals in `out` array
+        # Handle ``notation`` argument
+        if notation not in ("physicist", "chemist"):
+            raise ValueError("``notation`` must be one of 'physicist' or 'chemist'")
+
+        # Get C functions
+        func = LIBCINT["int1e_grids" + ("_cart" if self.coord_type == "cartesian" else "_sph")]
+
+        # Store the coordinates of the point charges at the end of a copy of `env`
+        point_coords = np.asarray(point_coords, dtype=c_double).reshape(-1, 3)
+        point_charges = np.asarray(point_charges, dtype=c_double)
+        ngrids = point_charges.size
+        env = np.concatenate((self.env, point_coords.ravel()))
+        # Number of grids and `env` offset of the grid coordinates
+        env[11] = ngrids
+        env[12] = self.env.size
+
+        # Handle out argument
+        nrow = self.nbfn if transform is None else transform.shape[0]
+        shape = (nrow, nrow) if sum_charges else (nrow, nrow, ngrids)
+        if out is not None and out.shape != shape:
+            raise ValueError("``out`` must have the shape of the integral array")
+
+        # Make integral array, or fill ``out`` directly if it needs no further processing
+        direct = (
+            out is not None
+            and transform is None
+            and self._identity_permutation
+            and out.dtype == np.float64
+        )
+        if direct:
+            ints = out
+        else:
+            ints = np.zeros((self.nbfn,) + shape[1:], dtype=c_double, order="F")
+
+        # Evaluate the integral function over the given unique shell pairs
+        def compute(ithread, shell_pairs):
+            # Get the scratch buffer of the thread and make temporary arrays
+            buf = self._buffer(("int1e_grids", ithread), ngrids * self._max_off**2)
+            # ``int1e_grids`` reads the range of grid points from ``shls[2:4]``
+            shls = np.zeros(4, dtype=c_int)
+            for ishl, jshl in shell_pairs:
+                shls[:] = ishl, jshl, 0, ngrids
+                ipos, jpos = self._pos[ishl], self._pos[jshl]
+                p_off, q_off = self._offs[ishl], self._offs[jshl]
+                # Call the C function to fill `buf`
+                func(buf, None, shls, self.atm, self.natm, self.bas, self.nbas, env, opt, None)
+                # Fill the lower triangular block of integral array, weighted by -charge
+                buf_array = buf[: ngrids * p_off * q_off].reshape(ngrids, p_off, q_off, order="F")
+                if sum_charges:
+                    block = -np.tensordot(point_charges, buf_array, (0, 0))
+                else:
+                    block = np.moveaxis(buf_array, 0, 2) * -point_charges
+                ints[ipos : ipos + p_off, jpos : jpos + q_off] = block
+                # Reset `buf`
+                buf[:] = 0
+
+        opt = self._cached_optimizer("int1e_grids_optimizer")
+        self._map_threads(compute, self._shell_pairs)
+
+        # Symmetrize integral array from its lower triangle
+        upper = np.triu_indices(self.nbfn, k=1)
+        ints[upper] = ints[upper[::-1]]
+
+        # Apply permutation
+        if not self._identity_permutation:
+            ints = ints[self._permutations, :][:, self._permutations]
+
+        # Normalize integrals
+        if self.coord_type == "cartesian":
+            self._normalize(ints, 2)
+
+        # Apply transformation
+        if transform is not None:
+            ints = np.tensordot(transform, ints, (1, 0))
+            ints = np.tensordot(transform, ints, (1, 1))
+            ints = np.swapaxes(ints, 0, 1)
+
+        # Copy integrals to ``out`` if they were not computed in it
+        if out is None:
+            return ints
+        if not direct:
+            out[...] = ints
         return out
 
-    def moment_integral(self, orders, origin=None, notation="physicist", transform=None):
+    def moment_integral(self, orders, origin=None, notation="physicist", transform=None, out=None):
         r"""
         Compute the moment integrals.
 
@@ -1215,6 +1863,8 @@ class CBasis:
             Transformation is applied to the left, i.e. the sum is over the index 1 of `transform`
             and index 0 of the array for contractions.
             Default is no transformation.
+        out : np.ndarray(Nbasis, Nbasis, N, dtype=float), optional
+            Array in which to store the integrals.
 
         Returns
         -------
@@ -1229,15 +1879,19 @@ class CBasis:
 
         """
         # Make output array
-        out = np.zeros((self.nbfn, self.nbfn, len(orders)), dtype=np.float64)
-        # Compute moment integral for each {X,Y,Z} order
+        nrow = self.nbfn if transform is None else transform.shape[0]
+        if out is None:
+            out = np.zeros((nrow, nrow, len(orders)), dtype=np.float64)
+        elif out.shape != (nrow, nrow, len(orders)):
+            raise ValueError("``out`` must have the shape of the integral array")
+        # Compute moment integral for each {X,Y,Z} order directly in its slice of `out`
         try:
             for i, order in enumerate(orders):
                 if sum(order) == 0:
-                    out[:, :, i] = self._ovlp(notation=notation, transform=transform)
+                    self._ovlp(notation=notation, transform=transform, out=out[:, :, i])
                 else:
-                    out[:, :, i] = self._moments[tuple(order)](
-                        origin=origin, notation=notation, transform=transform
+                    self._moment(order)(
+                        origin=origin, notation=notation, transform=transform, out=out[:, :, i]
                     )
         except KeyError:
             raise ValueError(
@@ -1247,6 +1901,453 @@ class CBasis:
         # Return integrals in `out` array
         return out
 
+    def _deriv_per_atom(self, d_ints):
+        r"""
+        Distribute the derivative integrals of the first basis function over the atoms.
+
+        Parameters
+        ----------
+        d_ints : np.ndarray(Nbasis, Nbasis, 3, dtype=float)
+            Integrals :math:`\left< \nabla \phi_a \middle| \hat{O} \middle| \phi_b \right>` of a
+            hermitian operator :math:`\hat{O}` that does not depend on the atomic coordinates.
+
+        Returns
+        -------
+        out : np.ndarray(Nbasis, Nbasis, Natm, 3, dtype=float)
+            Derivatives of the integrals :math:`\left< \phi_a \middle| \hat{O} \middle| \phi_b
+            \right>` with respect to the X, Y, and Z coordinates of each atom.
+
+        """
+        on_atom = self._bfn_atoms[:, np.newaxis] == np.arange(self.natm)
+        out = -np.einsum("abx,an->abnx", d_ints, on_atom)
+        return out + np.swapaxes(out, 0, 1)
+
+    def _gradient_per_atom(self, d_ints, dm):
+        r"""
+        Contract the derivative integrals of the first basis function with a density matrix.
+
+        Parameters
+        ----------
+        d_ints : np.ndarray(Nbasis, Nbasis, 3, dtype=float)
+            Integrals :math:`\left< \nabla \phi_a \middle| \hat{O} \middle| \phi_b \right>` of a
+            hermitian operator :math:`\hat{O}` that does not depend on the atomic coordinates.
+        dm : np.ndarray(Nbasis, Nbasis, dtype=float)
+            Density matrix.
+
+        Returns
+        -------
+        out : np.ndarray(Natm, 3, dtype=float)
+            Derivatives of :math:`\sum_{ab} D_{ab} \left< \phi_a \middle| \hat{O} \middle| \phi_b
+            \right>` with respect to the X, Y, and Z coordinates of each atom.
+
+        """
+        grad_bfn = -np.einsum("ab,abx->ax", dm + dm.T, d_ints)
+        out = np.zeros((self.natm, 3), dtype=np.float64)
+        np.add.at(out, self._bfn_atoms, grad_bfn)
+        return out
+
+    def _check_density_matrix(self, dm, name="dm"):
+        r"""
+        Check the shape of a density matrix.
+
+        Parameters
+        ----------
+        dm : np.ndarray(Nbasis, Nbasis, dtype=float)
+            Density matrix.
+        name : str, default="dm"
+            Name of the argument, for the error message.
+
+        Returns
+        -------
+        dm : np.ndarray(Nbasis, Nbasis, dtype=float)
+            Density matrix as a float array.
+
+        Raises
+        ------
+        ValueError
+            If the density matrix does not have the shape (Nbasis, Nbasis).
+
+        """
+        dm = np.asarray(dm, dtype=np.float64)
+        if dm.shape[-2:] != (self.nbfn, self.nbfn):
+            raise ValueError(f"``{name}`` must have the shape (Nbasis, Nbasis)")
+        return dm
+
+    def _to_libcint_order(self, dm):
+        r"""
+        Convert density matrices to the ordering and normalization of the ``libcint`` functions.
+
+        Parameters
+        ----------
+        dm : np.ndarray(..., Nbasis, Nbasis, dtype=float)
+            Density matrices.
+
+        Returns
+        -------
+        out : np.ndarray(..., Nbasis, Nbasis, dtype=float)
+            Density matrices such that contracting them with the raw ``libcint`` integrals is the
+            same as contracting the given ones with the integrals of this instance.
+
+        """
+        if self.coord_type == "cartesian":
+            dm = dm * self._ovlp_minhalf[:, np.newaxis] * self._ovlp_minhalf
+        permutations = np.asarray(self._permutations)
+        out = np.empty_like(dm)
+        out[..., permutations[:, np.newaxis], permutations] = dm
+        return out
+
+    def _from_libcint_order(self, matrix):
+        r"""
+        Convert matrices of the raw ``libcint`` integrals to the ordering of this instance.
+
+        Parameters
+        ----------
+        matrix : np.ndarray(..., Nbasis, Nbasis, dtype=float)
+            Matrices in the ordering and normalization of the ``libcint`` functions.
+
+        Returns
+        -------
+        out : np.ndarray(..., Nbasis, Nbasis, dtype=float)
+            Matrices in the ordering and normalization of this instance.
+
+        """
+        permutations = np.asarray(self._permutations)
+        out = matrix[..., permutations[:, np.newaxis], permutations]
+        if self.coord_type == "cartesian":
+            out *= self._ovlp_minhalf[:, np.newaxis] * self._ovlp_minhalf
+        return out
+
+    def _nuclear_potential_deriv(self, iatm):
+        r"""
+        Compute the derivative of the nuclear potential of an atom with respect to its coordinates.
+
+        Parameters
+        ----------
+        iatm : int
+            Index of the atom.
+
+        Returns
+        -------
+        out : np.ndarray(Nbasis, Nbasis, 3, dtype=float)
+            Derivatives of the integrals :math:`\left< \phi_a \middle| -Z_A / \left|\mathbf{r} -
+            \mathbf{R}_A\right| \middle| \phi_b \right>` with respect to the operator's center
+            :math:`\mathbf{R}_A` only.
+
+        """
+        d_rinv = self._d_rinv(inv_origin=self.env[self.atm[iatm, 1] : self.atm[iatm, 1] + 3])
+        return -self.atm[iatm, 0] * (d_rinv + np.swapaxes(d_rinv, 0, 1))
+
+    def overlap_deriv_integral(self, notation="physicist", transform=None):
+        r"""
+        Compute the overlap integral derivatives with respect to the atomic coordinates.
+
+        Parameters
+        ----------
+        notation : ("physicist" | "chemist"), default="physicist"
+            Axis order convention.
+        transform : np.ndarray(K, K_cont)
+            Transformation matrix from the basis set in the given coordinate system (e.g. AO) to
+            linear combinations of contractions (e.g. MO).
+            Transformation is applied to the left, i.e. the sum is over the index 1 of `transform`
+            and index 0 of the array for contractions.
+            Default is no transformation.
+
+        Returns
+        -------
+        out : np.ndarray(Nbasis, Nbasis, Natm, 3, dtype=float)
+            Derivatives of the integrals with respect to the X, Y, and Z coordinates of each atom.
+
+        """
+        out = self._deriv_per_atom(self._d_ovlp(notation=notation))
+        if transform is not None:
+            out = np.tensordot(transform, out, (1, 0))
+            out = np.swapaxes(np.tensordot(transform, out, (1, 1)), 0, 1)
+        return out
+
+    def kinetic_energy_deriv_integral(self, notation="physicist", transform=None):
+        r"""
+        Compute the kinetic energy integral derivatives with respect to the atomic coordinates.
+
+        Parameters
+        ----------
+        notation : ("physicist" | "chemist"), default="physicist"
+            Axis order convention.
+        transform : np.ndarray(K, K_cont)
+            Transformation matrix from the basis set in the given coordinate system (e.g. AO) to
+            linear combinations of contractions (e.g. MO).
+            Transformation is applied to the left, i.e. the sum is over the index 1 of `transform`
+            and index 0 of the array for contractions.
+            Default is no transformation.
+
+        Returns
+        -------
+        out : np.ndarray(Nbasis, Nbasis, Natm, 3, dtype=float)
+            Derivatives of the integrals with respect to the X, Y, and Z coordinates of each atom.
+
+        """
+        out = self._deriv_per_atom(self._d_kin(notation=notation))
+        if transform is not None:
+            out = np.tensordot(transform, out, (1, 0))
+            out = np.swapaxes(np.tensordot(transform, out, (1, 1)), 0, 1)
+        return out
+
+    def nuclear_attraction_deriv_integral(self, notation="physicist", transform=None):
+        r"""
+        Compute the nuclear attraction integral derivatives with respect to the atomic coordinates.
+
+        Both the derivatives of the basis functions and of the nuclear potentials are included.
+
+        Parameters
+        ----------
+        notation : ("physicist" | "chemist"), default="physicist"
+            Axis order convention.
+        transform : np.ndarray(K, K_cont)
+            Transformation matrix from the basis set in the given coordinate system (e.g. AO) to
+            linear combinations of contractions (e.g. MO).
+            Transformation is applied to the left, i.e. the sum is over the index 1 of `transform`
+            and index 0 of the array for contractions.
+            Default is no transformation.
+
+        Returns
+        -------
+        out : np.ndarray(Nbasis, Nbasis, Natm, 3, dtype=float)
+            Derivatives of the integrals with respect to the X, Y, and Z coordinates of each atom.
+
+        """
+        out = self._deriv_per_atom(self._d_nuc(notation=notation))
+        for iatm in range(self.natm):
+            out[:, :, iatm] += self._nuclear_potential_deriv(iatm)
+        if transform is not None:
+            out = np.tensordot(transform, out, (1, 0))
+            out = np.swapaxes(np.tensordot(transform, out, (1, 1)), 0, 1)
+        return out
+
+    def electron_repulsion_deriv_integral(self, notation="physicist", transform=None):
+        r"""
+        Compute the electron repulsion integral derivatives with respect to the atomic coordinates.
+
+        The array has :math:`6 N_{atm}` times as many elements as the electron repulsion integrals;
+        use ``electron_repulsion_gradient`` to contract the derivatives with density matrices
+        without storing them.
+
+        Parameters
+        ----------
+        notation : ("physicist" | "chemist"), default="physicist"
+            Axis order convention.
+        transform : np.ndarray(K, K_cont)
+            Transformation matrix from the basis set in the given coordinate system (e.g. AO) to
+            linear combinations of contractions (e.g. MO).
+            Transformation is applied to the left, i.e. the sum is over the index 1 of `transform`
+            and index 0 of the array for contractions.
+            Default is no transformation.
+
+        Returns
+        -------
+        out : np.ndarray(Nbasis, Nbasis, Nbasis, Nbasis, Natm, 3, dtype=float)
+            Derivatives of the integrals with respect to the X, Y, and Z coordinates of each atom.
+
+        """
+        if notation not in ("physicist", "chemist"):
+            raise ValueError("``notation`` must be one of 'physicist' or 'chemist'")
+        # Derivatives of (ij|kl) from (d/dx i j|kl) and its permutations
+        on_atom = self._bfn_atoms[:, np.newaxis] == np.arange(self.natm)
+        out = -np.einsum("abcdx,an->abcdnx", self._d_eri(notation="chemist"), on_atom)
+        out = (
+            out
+            + out.transpose(1, 0, 2, 3, 4, 5)
+            + out.transpose(2, 3, 0, 1, 4, 5)
+            + out.transpose(2, 3, 1, 0, 4, 5)
+        )
+        if notation == "physicist":
+            out = np.swapaxes(out, 1, 2)
+        if transform is not None:
+            for _ in range(4):
+                out = np.moveaxis(np.tensordot(transform, out, (1, 0)), 0, 3)
+        return out
+
+    def overlap_gradient(self, dm):
+        r"""
+        Compute the gradient of the overlap integrals contracted with a density matrix.
+
+        With the energy-weighted density matrix, this is the Pulay term of the SCF gradient.
+
+        Parameters
+        ----------
+        dm : np.ndarray(Nbasis, Nbasis, dtype=float)
+            Density matrix :math:`D`.
+
+        Returns
+        -------
+        out : np.ndarray(Natm, 3, dtype=float)
+            Derivatives of :math:`\sum_{ab} D_{ab} S_{ab}` with respect to the X, Y, and Z
+            coordinates of each atom.
+
+        Raises
+        ------
+        ValueError
+            If ``dm`` does not have the shape (Nbasis, Nbasis).
+
+        """
+        return self._gradient_per_atom(self._d_ovlp(), self._check_density_matrix(dm))
+
+    def kinetic_energy_gradient(self, dm):
+        r"""
+        Compute the gradient of the kinetic energy integrals contracted with a density matrix.
+
+        Parameters
+        ----------
+        dm : np.ndarray(Nbasis, Nbasis, dtype=float)
+            Density matrix :math:`D`.
+
+        Returns
+        -------
+        out : np.ndarray(Natm, 3, dtype=float)
+            Derivatives of :math:`\sum_{ab} D_{ab} T_{ab}` with respect to the X, Y, and Z
+            coordinates of each atom.
+
+        Raises
+        ------
+        ValueError
+            If ``dm`` does not have the shape (Nbasis, Nbasis).
+
+        """
+        return self._gradient_per_atom(self._d_kin(), self._check_density_matrix(dm))
+
+    def nuclear_attraction_gradient(self, dm):
+        r"""
+        Compute the gradient of the nuclear attraction integrals contracted with a density matrix.
+
+        Both the derivatives of the basis functions and of the nuclear potentials are included.
+
+        Parameters
+        ----------
+        dm : np.ndarray(Nbasis, Nbasis, dtype=float)
+            Density matrix :math:`D`.
+
+        Returns
+        -------
+        out : np.ndarray(Natm, 3, dtype=float)
+            Derivatives of :math:`\sum_{ab} D_{ab} V_{ab}` with respect to the X, Y, and Z
+            coordinates of each atom.
+
+        Raises
+        ------
+        ValueError
+            If ``dm`` does not have the shape (Nbasis, Nbasis).
+
+        """
+        dm = self._check_density_matrix(dm)
+        out = self._gradient_per_atom(self._d_nuc(), dm)
+        for iatm in range(self.natm):
+            out[iatm] += np.einsum("ab,abx->x", dm, self._nuclear_potential_deriv(iatm))
+        return out
+
+    def electron_repulsion_gradient(self, dm, exchange_dm=None, exchange_factor=0.5):
+        r"""
+        Compute the gradient of the electron repulsion energy of density matrices.
+
+        The energy is
+
+        .. math::
+
+            E = \frac{1}{2} \sum_{ijkl} (ij|kl)
+            \left(D_{ij} D_{kl} - c \sum_\sigma X^\sigma_{ik} X^\sigma_{jl}\right)
+
+        where :math:`D` is the total density matrix, :math:`X^\sigma` are the exchange density
+        matrices and :math:`c` is the exchange factor; e.g. :math:`X = D` and :math:`c = 1/2` for
+        a restricted Hartree-Fock wavefunction, and :math:`X^\sigma = D^\alpha, D^\beta` and
+        :math:`c = 1` for an unrestricted one. The derivative integrals of each shell quartet are
+        contracted as soon as they are computed, so they are never stored.
+
+        Parameters
+        ----------
+        dm : np.ndarray(Nbasis, Nbasis, dtype=float)
+            Symmetric total density matrix :math:`D`.
+        exchange_dm : np.ndarray(Nbasis, Nbasis, dtype=float) or np.ndarray(N, Nbasis, Nbasis)
+            Symmetric exchange density matrices :math:`X^\sigma`.
+            Default is ``dm``.
+        exchange_factor : float, default=0.5
+            Exchange factor :math:`c`. Use zero for the Coulomb energy only.
+
+        Returns
+        -------
+        out : np.ndarray(Natm, 3, dtype=float)
+            Derivatives of :math:`E` with respect to the X, Y, and Z coordinates of each atom.
+
+        Raises
+        ------
+        ValueError
+            If the density matrices do not have the shape (Nbasis, Nbasis) or are not symmetric.
+
+        """
+        # Check density matrices and convert them to the ``libcint`` ordering
+        dm = self._check_density_matrix(dm)
+        exchange_dm = dm if exchange_dm is None else exchange_dm
+        exchange_dm = self._check_density_matrix(exchange_dm, name="exchange_dm")
+        exchange_dm = exchange_dm.reshape(-1, self.nbfn, self.nbfn)
+        if not (np.allclose(dm, dm.T) and np.allclose(exchange_dm, exchange_dm.swapaxes(1, 2))):
+            raise ValueError("The density matrices must be symmetric")
+        dm = self._to_libcint_order(dm)
+        exchange_dm = self._to_libcint_order(exchange_dm)
+
+        # Get C function
+        func = LIBCINT["int2e_ip1" + ("_cart" if self.coord_type == "cartesian" else "_sph")]
+        slices = [slice(pos, pos + off) for pos, off in zip(self._pos, self._offs)]
+        bra_pairs = [(ishl, jshl) for ishl in range(self.nbas) for jshl in range(self.nbas)]
+        grads = np.zeros((self.n_threads, self.natm, 3), dtype=np.float64)
+
+        # Contract (d/dx i j|kl) with the symmetrized density matrix products over the shell
+        # quartets with any ij and unique kl; the other derivatives follow from symmetry
+        def compute(ithread, ij_pairs):
+            # Get the scratch buffer of the thread and make temporary arrays
+            buf = self._buffer(("int2e_ip1", ithread), 3 * self._max_off**4)
+            shls = np.zeros(4, dtype=c_int)
+            for ishl, jshl in ij_pairs:
+                shls[:2] = ishl, jshl
+                i_sl, j_sl = slices[ishl], slices[jshl]
+                for kshl, lshl in self._shell_pairs:
+                    shls[2:] = kshl, lshl
+                    k_sl, l_sl = slices[kshl], slices[lshl]
+                    # Call the C function to fill `buf`
+                    func(
+                        buf,
+                        None,
+                        shls,
+                        self.atm,
+                        self.natm,
+                        self.bas,
+                        self.nbas,
+                        self.env,
+                        opt,
+                        None,
+                    )
+                    offs = [self._offs[shl] for shl in shls]
+                    d_eri = buf[: np.prod(offs) * 3].reshape(*offs, 3, order="F")
+                    gamma = np.multiply.outer(dm[i_sl, j_sl], dm[k_sl, l_sl])
+                    if exchange_factor:
+                        gamma -= (0.5 * exchange_factor) * (
+                            np.einsum(
+                                "sik,sjl->ijkl",
+                                exchange_dm[:, i_sl, k_sl],
+                                exchange_dm[:, j_sl, l_sl],
+                            )
+                            + np.einsum(
+                                "sil,sjk->ijkl",
+                                exchange_dm[:, i_sl, l_sl],
+                                exchange_dm[:, j_sl, k_sl],
+                            )
+                        )
+                    grad = np.tensordot(gamma, d_eri, 4)
+                    grads[ithread, self.bas[ishl, 0]] -= grad if kshl == lshl else 2 * grad
+                    # Reset `buf`
+                    buf[:] = 0
+
+        opt = self._cached_optimizer("int2e_ip1_optimizer")
+        self._map_threads(compute, bra_pairs)
+
+        # Each derivative of (ij|kl) contributes 1/2 of the energy, and there are four of them
+        return 2 * grads.sum(axis=0)
+
 
 def normalized_coeffs(shell):
     r"""
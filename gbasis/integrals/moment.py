@@ -2,6 +2,7 @@
 from gbasis.base_two_symm import BaseTwoIndexSymmetric
 from gbasis.contractions import GeneralizedContractionShell
 from gbasis.integrals._moment_int import _compute_multipole_moment_integrals
+from gbasis.integrals.shell_pair import shell_pair_primitives
 import numpy as np
 
 
@@ -49,7 +50,7 @@ class Moment(BaseTwoIndexSymmetric):
 
     @staticmethod
     def construct_array_contraction(
-        contractions_one, contractions_two, moment_coord, moment_orders
+        contractions_one, contractions_two, moment_coord, moment_orders, shell_pairs=None
     ):
         """Return the evaluations of the given contractions at the given coordinates.
 
@@ -67,6 +68,10 @@ class Moment(BaseTwoIndexSymmetric):
             Orders of the moment for each dimension (x, y, z).
             Note that a two dimensional array must be given, even if there is only one set of orders
             of the moment.
+        shell_pairs : ShellPairData, optional
+            Cache of the primitive-pair quantities that is shared with the other one-electron
+            integrals of the same basis set.
+            Default computes the primitive-pair quantities of the given contractions.
 
         Returns
         -------
@@ -132,14 +137,17 @@ class Moment(BaseTwoIndexSymmetric):
 
         coord_a = contractions_one.coord
         angmoms_a = contractions_one.angmom_components_cart
-        exps_a = contractions_one.exps
-        coeffs_a = contractions_one.coeffs
-        norm_a_prim = contractions_one.norm_prim_cart
         coord_b = contractions_two.coord
         angmoms_b = contractions_two.angmom_components_cart
-        exps_b = contractions_two.exps
-        coeffs_b = contractions_two.coeffs
-        norm_b_prim = contractions_two.norm_prim_cart
+        (
+            exps_a,
+            coeffs_a,
+            norm_a_prim,
+            exps_b,
+            coeffs_b,
+            norm_b_prim,
+            shell_pair,
+        ) = shell_pair_primitives(contractions_one, contractions_two, shell_pairs)
         output = _compute_multipole_moment_integrals(
             moment_coord,
             moment_orders,
@@ -153,11 +161,12 @@ class Moment(BaseTwoIndexSymmetric):
             exps_b,
             coeffs_b,
             norm_b_prim,
+            shell_pair=shell_pair,
         )
         return np.transpose(output, (1, 2, 3, 4, 0))
 
 
-def moment_integral(basis, moment_coord, moment_orders, transform=None):
+def moment_integral(basis, moment_coord, moment_orders, transform=None, shell_pairs=None):
     """Return moment integral of the given basis set.
 
     Parameters
@@ -176,6 +185,10 @@ def moment_integral(basis, moment_coord, moment_orders, transform=None):
         Transformation is applied to the left, i.e. the sum is over the index 1 of `transform`
         and index 0 of the array for contractions.
         Default is no transformation.
+    shell_pairs : ShellPairData, optional
+        Cache of the primitive-pair quantities of `basis` that is shared with the other one-electron
+        integrals of the same basis set.
+        Default computes the primitive-pair quantities from scratch.
 
     Returns
     -------
@@ -195,19 +208,16 @@ def moment_integral(basis, moment_coord, moment_orders, transform=None):
 
     """
     coord_type = [ct for ct in [shell.coord_type for shell in basis]]
+    kwargs = {
+        "moment_coord": moment_coord,
+        "moment_orders": moment_orders,
+        "shell_pairs": shell_pairs,
+    }
 
     if transform is not None:
-        return Moment(basis).construct_array_lincomb(
-            transform, coord_type, moment_coord=moment_coord, moment_orders=moment_orders
-        )
+        return Moment(basis).construct_array_lincomb(transform, coord_type, **kwargs)
     if all(ct == "cartesian" for ct in coord_type):
-        return Moment(basis).construct_array_cartesian(
-            moment_coord=moment_coord, moment_orders=moment_orders
-        )
+        return Moment(basis).construct_array_cartesian(**kwargs)
     if all(ct == "spherical" for ct in coord_type):
-        return Moment(basis).construct_array_spherical(
-            moment_coord=moment_coord, moment_orders=moment_orders
-        )
-    return Moment(basis).construct_array_mix(
-        coord_type, moment_coord=moment_coord, moment_orders=moment_orders
-    )
+        return Moment(basis).construct_array_spherical(**kwargs)
+    return Moment(basis).construct_array_mix(coord_type, **kwargs)
@@ -2,6 +2,7 @@
 from gbasis.base_two_symm import BaseTwoIndexSymmetric
 from gbasis.contractions import GeneralizedContractionShell
 from gbasis.integrals._diff_operator_int import _compute_differential_operator_integrals
+from gbasis.integrals.shell_pair import shell_pair_primitives
 import numpy as np
 
 
@@ -21,7 +22,7 @@ class MomentumIntegral(BaseTwoIndexSymmetric):
     -------
     __init__(self, contractions)
         Initialize.
-    construct_array_contraction(contractions_one, contractions_two) :
+    construct_array_contraction(contractions_one, contractions_two, shell_pairs=None) :
         **np.ndarray(M_1, L_cart_1, M_2, L_cart_2, 3)**
 
         Return the integral over the momentum operator associated with a
@@ -53,7 +54,7 @@ class MomentumIntegral(BaseTwoIndexSymmetric):
     """
 
     @staticmethod
-    def construct_array_contraction(contractions_one, contractions_two):
+    def construct_array_contraction(contractions_one, contractions_two, shell_pairs=None):
         """Return the integrals over the momentum operator of the given contractions.
 
         Parameters
@@ -64,6 +65,10 @@ class MomentumIntegral(BaseTwoIndexSymmetric):
         contractions_two : GeneralizedContractionShell
             Contracted Cartesian Gaussians (of the same shell) associated with the second index of
             the kinetic energy integral.
+        shell_pairs : ShellPairData, optional
+            Cache of the primitive-pair quantities that is shared with the other one-electron
+            integrals of the same basis set.
+            Default computes the primitive-pair quantities of the given contractions.
 
         Returns
         -------
@@ -96,23 +101,27 @@ class MomentumIntegral(BaseTwoIndexSymmetric):
         if not isinstance(contractions_two, GeneralizedContractionShell):
             raise TypeError("`contractions_two` must be a `GeneralizedContractionShell` instance.")
 
+        exps_a, coeffs_a, norm_a, exps_b, coeffs_b, norm_b, shell_pair = shell_pair_primitives(
+            contractions_one, contractions_two, shell_pairs
+        )
         output = _compute_differential_operator_integrals(
             np.array([[1, 0, 0], [0, 1, 0], [0, 0, 1]]),
             contractions_one.coord,
             contractions_one.angmom_components_cart,
-            contractions_one.exps,
-            contractions_one.coeffs,
-            contractions_one.norm_prim_cart,
+            exps_a,
+            coeffs_a,
+            norm_a,
             contractions_two.coord,
             contractions_two.angmom_components_cart,
-            contractions_two.exps,
-            contractions_two.coeffs,
-            contractions_two.norm_prim_cart,
+            exps_b,
+            coeffs_b,
+            norm_b,
+            shell_pair=shell_pair,
         )
         return -1j * np.transpose(output, (1, 2, 3, 4, 0))
 
 
-def momentum_integral(basis, transform=None):
+def momentum_integral(basis, transform=None, shell_pairs=None):
     """Return integral over momentum operator of the given basis set.
 
     Parameters
@@ -125,6 +134,10 @@ def momentum_integral(basis, transform=None):
         Transformation is applied to the left, i.e. the sum is over the index 1 of `transform`
         and index 0 of the array for contractions.
         Default is no transformation.
+    shell_pairs : ShellPairData, optional
+        Cache of the primitive-pair quantities of `basis` that is shared with the other one-electron
+        integrals of the same basis set.
+        Default computes the primitive-pair quantities from scratch.
 
     Returns
     -------
@@ -137,9 +150,11 @@ def momentum_integral(basis, transform=None):
     coord_type = [ct for ct in [shell.coord_type for shell in basis]]
 
     if transform is not None:
-        return MomentumIntegral(basis).construct_array_lincomb(transform, coord_type)
+        return MomentumIntegral(basis).construct_array_lincomb(
+            transform, coord_type, shell_pairs=shell_pairs
+        )
     if all(ct == "cartesian" for ct in coord_type):
-        return MomentumIntegral(basis).construct_array_cartesian()
+        return MomentumIntegral(basis).construct_array_cartesian(shell_pairs=shell_pairs)
     if all(ct == "spherical" for ct in coord_type):
-        return MomentumIntegral(basis).construct_array_spherical()
-    return MomentumIntegral(basis).construct_array_mix(coord_type)
+        return MomentumIntegral(basis).construct_array_spherical(shell_pairs=shell_pairs)
+    return MomentumIntegral(basis).construct_array_mix(coord_type, shell_pairs=shell_pairs)
@@ -1,9 +1,10 @@
 """Module for computing the nuclear electron attraction."""
 from gbasis.integrals.point_charge import point_charge_integral
-import numpy as np
 
 
-def nuclear_electron_attraction_integral(basis, nuclear_coords, nuclear_charges, transform=None):
+def nuclear_electron_attraction_integral(
+    basis, nuclear_coords, nuclear_charges, transform=None, shell_pairs=None
+):
     """Return the nuclear electron attraction integrals of the basis set in the Cartesian form.
 
     Parameters
@@ -20,6 +21,10 @@ def nuclear_electron_attraction_integral(basis, nuclear_coords, nuclear_charges,
         Transformation is applied to the left, i.e. the sum is over the index 1 of `transform`
         and index 0 of the array for contractions.
         Default is no transformation.
+    shell_pairs : ShellPairData, optional
+        Cache of the primitive-pair quantities of `basis` that is shared with the other one-electron
+        integrals of the same basis set.
+        Default computes the primitive-pair quantities from scratch.
 
     Returns
     -------
@@ -29,7 +34,11 @@ def nuclear_electron_attraction_integral(basis, nuclear_coords, nuclear_charges,
         Gaussians. `K_cart` is the total number of Cartesian contractions within the instance.
 
     """
-    return np.sum(
-        point_charge_integral(basis, nuclear_coords, nuclear_charges, transform=transform),
-        axis=2,
+    return point_charge_integral(
+        basis,
+        nuclear_coords,
+        nuclear_charges,
+        transform=transform,
+        sum_charges=True,
+        shell_pairs=shell_pairs,
     )
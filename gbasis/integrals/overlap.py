@@ -2,6 +2,7 @@
 from gbasis.base_two_symm import BaseTwoIndexSymmetric
 from gbasis.contractions import GeneralizedContractionShell
 from gbasis.integrals._moment_int import _compute_multipole_moment_integrals
+from gbasis.integrals.shell_pair import shell_pair_primitives
 import numpy as np
 
 
@@ -20,7 +21,7 @@ class Overlap(BaseTwoIndexSymmetric):
     -------
     __init__(self, contractions)
         Initialize.
-    construct_array_contraction(contractions_one, contractions_two) :
+    construct_array_contraction(contractions_one, contractions_two, shell_pairs=None) :
         **np.ndarray(M_1, L_cart_1, M_2, L_cart_2)**
 
         Return the overlap associated with a `GeneralizedContractionShell` instance.
@@ -49,7 +50,7 @@ class Overlap(BaseTwoIndexSymmetric):
     """
 
     @staticmethod
-    def construct_array_contraction(contractions_one, contractions_two):
+    def construct_array_contraction(contractions_one, contractions_two, shell_pairs=None):
         """Return the evaluations of the given contractions at the given coordinates.
 
         Parameters
@@ -60,6 +61,11 @@ class Overlap(BaseTwoIndexSymmetric):
         contractions_two : GeneralizedContractionShell
             Contracted Cartesian Gaussians (of the same shell) associated with the second index of
             the overlap.
+        shell_pairs : ShellPairData, optional
+            Cache of the primitive-pair quantities that is shared with the other one-electron
+            integrals of the same basis set.
+            The primitive pairs are screened with its `screen_tol`, if any.
+            Default computes the primitive-pair quantities of the given contractions.
 
         Returns
         -------
@@ -92,6 +98,9 @@ class Overlap(BaseTwoIndexSymmetric):
 
         # screen these contractions to see if overlap calculation is required or can be set to zero
         if is_overlap_included(contractions_one, contractions_two):
+            exps_a, coeffs_a, norm_a, exps_b, coeffs_b, norm_b, shell_pair = shell_pair_primitives(
+                contractions_one, contractions_two, shell_pairs, screen=True
+            )
             # calculate overlaps
             return _compute_multipole_moment_integrals(
                 np.zeros(3),
@@ -99,15 +108,16 @@ class Overlap(BaseTwoIndexSymmetric):
                 # contraction on the left hand side
                 contractions_one.coord,
                 contractions_one.angmom_components_cart,
-                contractions_one.exps,
-                contractions_one.coeffs,
-                contractions_one.norm_prim_cart,
+                exps_a,
+                coeffs_a,
+                norm_a,
                 # contraction on the right hand side
                 contractions_two.coord,
                 contractions_two.angmom_components_cart,
-                contractions_two.exps,
-                contractions_two.coeffs,
-                contractions_two.norm_prim_cart,
+                exps_b,
+                coeffs_b,
+                norm_b,
+                shell_pair=shell_pair,
             )[0]
         # return zeros for these overlaps
         return np.zeros(
@@ -120,7 +130,7 @@ class Overlap(BaseTwoIndexSymmetric):
         )
 
 
-def overlap_integral(basis, transform=None):
+def overlap_integral(basis, transform=None, shell_pairs=None):
     """Return overlap integral of the given basis set.
 
     Parameters
@@ -133,6 +143,11 @@ def overlap_integral(basis, transform=None):
         Transformation is applied to the left, i.e. the sum is over the index 1 of `transform`
         and index 0 of the array for contractions.
         Default is no transformation.
+    shell_pairs : ShellPairData, optional
+        Cache of the primitive-pair quantities of `basis` that is shared with the other one-electron
+        integrals of the same basis set.
+        The primitive pairs are screened with its `screen_tol`, if any.
+        Default computes the primitive-pair quantities from scratch.
 
     Returns
     -------
@@ -145,12 +160,14 @@ def overlap_integral(basis, transform=None):
     coord_type = [ct for ct in [shell.coord_type for shell in basis]]
 
     if transform is not None:
-        return Overlap(basis).construct_array_lincomb(transform, coord_type)
+        return Overlap(basis).construct_array_lincomb(
+            transform, coord_type, shell_pairs=shell_pairs
+        )
     if all(ct == "cartesian" for ct in coord_type):
-        return Overlap(basis).construct_array_cartesian()
+        return Overlap(basis).construct_array_cartesian(shell_pairs=shell_pairs)
     if all(ct == "spherical" for ct in coord_type):
-        return Overlap(basis).construct_array_spherical()
-    return Overlap(basis).construct_array_mix(coord_type)
+        return Overlap(basis).construct_array_spherical(shell_pairs=shell_pairs)
+    return Overlap(basis).construct_array_mix(coord_type, shell_pairs=shell_pairs)
 
 
 def is_overlap_included(contractions_one, contractions_two):
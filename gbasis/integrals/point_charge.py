@@ -2,8 +2,9 @@
 from gbasis.base_two_symm import BaseTwoIndexSymmetric
 from gbasis.contractions import GeneralizedContractionShell
 from gbasis.integrals._one_elec_int import _compute_one_elec_integrals
+from gbasis.integrals.boys import boys_function_tabulated
+from gbasis.integrals.shell_pair import shell_pair_primitives
 import numpy as np
-from scipy.special import hyp1f1  # pylint: disable=E0611
 
 
 class PointChargeIntegral(BaseTwoIndexSymmetric):
@@ -68,8 +69,8 @@ class PointChargeIntegral(BaseTwoIndexSymmetric):
     def boys_func(orders, weighted_dist):
         r"""Return the value of Boys function for the given orders and weighted distances.
 
-        The Coulombic Boys function can be written as a renormalized special case of the Kummer
-        confluent hypergeometric function, as derived in Helgaker (eq. 9.8.39).
+        The Boys function is evaluated with `gbasis.integrals.boys.boys_function_tabulated`, which
+        evaluates all of the orders at once from a precomputed grid and downward recursion.
 
         Parameters
         ----------
@@ -100,24 +101,34 @@ class PointChargeIntegral(BaseTwoIndexSymmetric):
 
         Notes
         -----
-        There's some documented instability for hyp1f1, mainly for large values or complex numbers.
-        In this case it seems fine, since m should be less than 10 in most cases, and except for
-        exceptional cases the input, while negative, shouldn't be very large. In scipy > 0.16, this
-        problem becomes a precision error in most cases where it was an overflow error before, so
-        the values should be close even when they are wrong.
-
         To use another `boys_func`, simply overwrite this function (via monkeypatching or
         inheritance) with the desired boys function. Make sure to follow the same API, i.e. *have
         the same inputs including their shapes and types*. Note that the index `2` corresponds to
         the primitive on the right side and the index `3` corresponds to the primitive on the left
-        side.
+        side. For example, the Boys function can be evaluated with the Kummer confluent
+        hypergeometric function instead with
+
+        .. code-block:: python
+
+            from gbasis.integrals.boys import boys_function_hyp1f1
+            PointChargeIntegral.boys_func = staticmethod(boys_function_hyp1f1)
+
+        Since `ElectronRepulsionIntegral` and the density fitting integrals copy this function when
+        they are defined, their `boys_func` must be overwritten separately.
 
         """
-        return hyp1f1(orders + 1 / 2, orders + 3 / 2, -weighted_dist) / (2 * orders + 1)
+        return boys_function_tabulated(orders, weighted_dist)
 
     @classmethod
     def construct_array_contraction(
-        cls, contractions_one, contractions_two, points_coords, points_charge
+        cls,
+        contractions_one,
+        contractions_two,
+        points_coords,
+        points_charge,
+        sum_charges=False,
+        charge_batch_size=1000,
+        shell_pairs=None,
     ):
         r"""Return point charge interaction integral for the given contractions and point charges.
 
@@ -135,6 +146,20 @@ class PointChargeIntegral(BaseTwoIndexSymmetric):
             :math:`x, y, \text{and} z` components.
         points_charge : np.ndarray(N)
             Charge of each point charge.
+        sum_charges : bool
+            Flag for summing the integrals over the point charges.
+            If True, the sum is accumulated for `charge_batch_size` point charges at a time right
+            after the vertical recursion, such that the memory does not grow with the number of
+            point charges, and the last axis of the returned array is removed.
+            Default is False.
+        charge_batch_size : int
+            Maximum number of point charges whose integrals are evaluated at once when
+            `sum_charges` is True.
+            Default is 1000.
+        shell_pairs : ShellPairData, optional
+            Cache of the primitive-pair quantities that is shared with the other one-electron
+            integrals of the same basis set.
+            Default computes the primitive-pair quantities of the given contractions.
 
         Returns
         -------
@@ -154,6 +179,7 @@ class PointChargeIntegral(BaseTwoIndexSymmetric):
             `L_cart_2` is the number of Cartesian contractions for the given angular momentum
             associated with the second index.
             Dimension 4 corresponds to the point charge. `N` is the number of point charges.
+            If `sum_charges` is True, this dimension is summed over.
 
         Raises
         ------
@@ -163,9 +189,11 @@ class PointChargeIntegral(BaseTwoIndexSymmetric):
             If `points_coords` is not a two-dimensional `numpy` array of `dtype` int/float with 3
             columns.
             If `points_charge` is not a one-dimensional `numpy` array of int/float.
+            If `charge_batch_size` is not an integer.
         ValueError
             If `points_coords` does not have the same number of rows as the size of
             `points_charge`.
+            If `charge_batch_size` is not positive.
 
         """
         # pylint: disable=R0914
@@ -197,42 +225,64 @@ class PointChargeIntegral(BaseTwoIndexSymmetric):
                 "`points_coords` must have the same number of rows as there are elements in "
                 "`points_charge`."
             )
+        if not isinstance(charge_batch_size, (int, np.integer)) or isinstance(
+            charge_batch_size, bool
+        ):
+            raise TypeError("`charge_batch_size` must be an integer.")
+        if charge_batch_size <= 0:
+            raise ValueError("`charge_batch_size` must be a positive integer.")
 
         # TODO: Overlap screening
 
+        # Enforce L_a >= L_b
+        ab_swapped = contractions_one.angmom < contractions_two.angmom
+        if ab_swapped:
+            contractions_one, contractions_two = contractions_two, contractions_one
+
         coord_a = contractions_one.coord
         angmom_a = contractions_one.angmom
         angmoms_a = contractions_one.angmom_components_cart
-        exps_a = contractions_one.exps
-        coeffs_a = contractions_one.coeffs
         coord_b = contractions_two.coord
         angmom_b = contractions_two.angmom
         angmoms_b = contractions_two.angmom_components_cart
-        exps_b = contractions_two.exps
-        coeffs_b = contractions_two.coeffs
-
-        # Enforce L_a >= L_b
-        ab_swapped = False
-        if angmom_a < angmom_b:
-            coord_a, coord_b = coord_b, coord_a
-            angmom_a, angmom_b = angmom_b, angmom_a
-            angmoms_a, angmoms_b = angmoms_b, angmoms_a
-            exps_a, exps_b = exps_b, exps_a
-            coeffs_a, coeffs_b = coeffs_b, coeffs_a
-            ab_swapped = True
-
-        integrals = _compute_one_elec_integrals(
-            points_coords,
-            cls.boys_func,
-            coord_a,
-            angmom_a,
-            exps_a,
-            coeffs_a,
-            coord_b,
-            angmom_b,
-            exps_b,
-            coeffs_b,
+        exps_a, coeffs_a, _, exps_b, coeffs_b, _, shell_pair = shell_pair_primitives(
+            contractions_one, contractions_two, shell_pairs
         )
+
+        if sum_charges:
+            # accumulate the charge-weighted sum over batches of point charges
+            integrals = 0
+            for start in range(0, max(points_charge.size, 1), charge_batch_size):
+                integrals = integrals + _compute_one_elec_integrals(
+                    points_coords[start : start + charge_batch_size],
+                    cls.boys_func,
+                    coord_a,
+                    angmom_a,
+                    exps_a,
+                    coeffs_a,
+                    coord_b,
+                    angmom_b,
+                    exps_b,
+                    coeffs_b,
+                    points_charge=-points_charge[start : start + charge_batch_size],
+                    shell_pair=shell_pair,
+                )
+            charges = np.ones(1)
+        else:
+            integrals = _compute_one_elec_integrals(
+                points_coords,
+                cls.boys_func,
+                coord_a,
+                angmom_a,
+                exps_a,
+                coeffs_a,
+                coord_b,
+                angmom_b,
+                exps_b,
+                coeffs_b,
+                shell_pair=shell_pair,
+            )
+            charges = -points_charge
         integrals = np.transpose(integrals, (7, 0, 1, 2, 8, 3, 4, 5, 6))
 
         angmoms_a_x, angmoms_a_y, angmoms_a_z = angmoms_a.T
@@ -246,7 +296,7 @@ class PointChargeIntegral(BaseTwoIndexSymmetric):
         # axis 3 : angular momentum vector of contraction two (in the same order as angmoms_b)
         # axis 4 : point charge
         output = (
-            -points_charge
+            charges
             * integrals[
                 np.arange(coeffs_a.shape[1])[:, None, None, None, None],
                 angmoms_a_x[None, :, None, None, None],
@@ -256,17 +306,27 @@ class PointChargeIntegral(BaseTwoIndexSymmetric):
                 angmoms_b_x[None, None, None, :, None],
                 angmoms_b_y[None, None, None, :, None],
                 angmoms_b_z[None, None, None, :, None],
-                np.arange(points_coords.shape[0])[None, None, None, None, :],
+                np.arange(charges.size)[None, None, None, None, :],
             ]
         )
+        if sum_charges:
+            output = output[..., 0]
 
         if ab_swapped:
-            return np.transpose(output, (2, 3, 0, 1, 4))
+            return np.transpose(output, (2, 3, 0, 1, *range(4, output.ndim)))
 
         return output
 
 
-def point_charge_integral(basis, points_coords, points_charge, transform=None):
+def point_charge_integral(
+    basis,
+    points_coords,
+    points_charge,
+    transform=None,
+    sum_charges=False,
+    charge_batch_size=1000,
+    shell_pairs=None,
+):
     r"""Return the point-charge interaction integrals of basis set in the given coordinate systems.
 
     Parameters
@@ -285,31 +345,44 @@ def point_charge_integral(basis, points_coords, points_charge, transform=None):
         Transformation is applied to the left, i.e. the sum is over the index 1 of `transform`
         and index 0 of the array for contractions.
         Default is no transformation.
+    sum_charges : bool
+        Flag for summing the integrals over the point charges.
+        If True, the sum is accumulated for `charge_batch_size` point charges at a time, such that
+        the memory does not grow with the number of point charges.
+        Default is False.
+    charge_batch_size : int
+        Maximum number of point charges whose integrals are evaluated at once when `sum_charges` is
+        True.
+        Default is 1000.
+    shell_pairs : ShellPairData, optional
+        Cache of the primitive-pair quantities of `basis` that is shared with the other one-electron
+        integrals of the same basis set.
+        Default computes the primitive-pair quantities from scratch.
 
     Returns
     -------
-    eval_array : np.ndarray(K, N)
-        Evaluations of the basis functions at the given coordinates.
-        If keyword argument `transform` is provided, then the transformed basis functions will be
-        evaluted at the given points.
+    eval_array : np.ndarray(K, K, N)
+        Point charge interaction integrals of the basis set.
+        If keyword argument `transform` is provided, then the integrals will be transformed
+        accordingly.
         `K` is the total number of basis functions within the given basis set.
-        `N` is the number of coordinates at which the contractions are evaluated.
+        `N` is the number of point charges. If `sum_charges` is True, this dimension is summed
+        over.
 
     """
     coord_type = [ct for ct in [shell.coord_type for shell in basis]]
+    kwargs = {
+        "points_coords": points_coords,
+        "points_charge": points_charge,
+        "sum_charges": sum_charges,
+        "charge_batch_size": charge_batch_size,
+        "shell_pairs": shell_pairs,
+    }
 
     if transform is not None:
-        return PointChargeIntegral(basis).construct_array_lincomb(
-            transform, coord_type, points_coords=points_coords, points_charge=points_charge
-        )
+        return PointChargeIntegral(basis).construct_array_lincomb(transform, coord_type, **kwargs)
     if all(ct == "cartesian" for ct in coord_type):
-        return PointChargeIntegral(basis).construct_array_cartesian(
-            points_coords=points_coords, points_charge=points_charge
-        )
+        return PointChargeIntegral(basis).construct_array_cartesian(**kwargs)
     if all(ct == "spherical" for ct in coord_type):
-        return PointChargeIntegral(basis).construct_array_spherical(
-            points_coords=points_coords, points_charge=points_charge
-        )
-    return PointChargeIntegral(basis).construct_array_mix(
-        coord_type, points_coords=points_coords, points_charge=points_charge
-    )
+        return PointChargeIntegral(basis).construct_array_spherical(**kwargs)
+    return PointChargeIntegral(basis).construct_array_mix(coord_type, **kwargs)
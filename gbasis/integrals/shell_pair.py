@@ -0,0 +1,400 @@
+"""Quantities of the primitive pairs that are shared by the one-electron integrals."""
+import copy
+
+from gbasis.contractions import GeneralizedContractionShell
+import numpy as np
+
+
+class ShellPair:
+    r"""Primitive-pair quantities of two contractions.
+
+    For each pair of primitives with exponents :math:`\alpha_i` and :math:`\beta_j` centered at
+    :math:`\mathbf{A}` and :math:`\mathbf{B}`, the sum of the exponents, :math:`p = \alpha_i +
+    \beta_j`, the Gaussian product center, :math:`\mathbf{P} = (\alpha_i \mathbf{A} + \beta_j
+    \mathbf{B}) / p`, the harmonic mean, :math:`\mu = \alpha_i \beta_j / p`, and the prefactor
+    :math:`e^{-\mu |\mathbf{A} - \mathbf{B}|^2}` are evaluated once and reused by the multipole
+    moment, differential operator, and point charge integrals.
+
+    If a screening tolerance is given, a primitive pair is screened out if the estimate of the
+    overlap of the normalized primitives,
+
+    .. math::
+
+        \left(\frac{\pi}{p}\right)^{3/2} e^{-\mu |\mathbf{A} - \mathbf{B}|^2}
+        \max_m |d_{im}| \max_{\vec{a}} N(\alpha_i, \vec{a})
+        \max_n |d_{jn}| \max_{\vec{b}} N(\beta_j, \vec{b})
+
+    is smaller than the screening tolerance. The prefactors of the screened out pairs are set to
+    zero and the primitives that are not part of any remaining pair are removed. The screened pair
+    is obtained from the unscreened pair with `screened`. This estimate is
+    a heuristic for the overlap only, and since the contractions sum over many primitive pairs, the
+    error of a contracted overlap can exceed the tolerance. The kinetic energy, moment, and point
+    charge integrals can be much larger than the overlap of the same primitives, so they must be
+    given a pair built without a screening tolerance.
+
+    Attributes
+    ----------
+    coord_one : np.ndarray(3,)
+        Center of the first contraction when the pair was built.
+    coord_two : np.ndarray(3,)
+        Center of the second contraction when the pair was built.
+    prims_one : np.ndarray(K_a,)
+        Indices of the primitives of the first contraction that are kept after screening.
+    prims_two : np.ndarray(K_b,)
+        Indices of the primitives of the second contraction that are kept after screening.
+    exps_one : np.ndarray(K_a,)
+        Exponents of the kept primitives of the first contraction.
+    coeffs_one : np.ndarray(K_a, M_a)
+        Contraction coefficients of the kept primitives of the first contraction.
+    norm_prim_cart_one : np.ndarray(L_a, K_a)
+        Normalization constants of the kept primitives of the first contraction.
+    exps_two : np.ndarray(K_b,)
+        Exponents of the kept primitives of the second contraction.
+    coeffs_two : np.ndarray(K_b, M_b)
+        Contraction coefficients of the kept primitives of the second contraction.
+    norm_prim_cart_two : np.ndarray(L_b, K_b)
+        Normalization constants of the kept primitives of the second contraction.
+    mask : np.ndarray(K_b, K_a)
+        Flags for the primitive pairs that are not screened out.
+    exps_sum : np.ndarray(K_b, K_a)
+        Sums of the exponents of the primitive pairs.
+    harm_mean : np.ndarray(K_b, K_a)
+        Harmonic means of the exponents of the primitive pairs.
+    coord_wac : np.ndarray(3, K_b, K_a)
+        Gaussian product centers of the primitive pairs.
+    exp_coord : np.ndarray(3, K_b, K_a)
+        Prefactors :math:`e^{-\mu (A_x - B_x)^2}` along each coordinate, set to zero for the
+        screened out pairs.
+    exp_dist : np.ndarray(K_b, K_a)
+        Prefactors :math:`e^{-\mu |\mathbf{A} - \mathbf{B}|^2}`, set to zero for the screened out
+        pairs.
+
+    Methods
+    -------
+    __init__(self, contractions_one, contractions_two, screen_tol=None)
+        Initialize.
+    screened(self, screen_tol) : ShellPair
+        Return a copy of the pair whose primitive pairs are screened with the given tolerance.
+
+    Notes
+    -----
+    Dimensions of the primitive pairs are ordered as in the integral recursions, i.e. the
+    primitives of the second contraction come before the primitives of the first contraction.
+
+    """
+
+    def __init__(self, contractions_one, contractions_two, screen_tol=None):
+        """Initialize.
+
+        Parameters
+        ----------
+        contractions_one : GeneralizedContractionShell
+            Contracted Cartesian Gaussians (of the same shell) associated with the first index.
+        contractions_two : GeneralizedContractionShell
+            Contracted Cartesian Gaussians (of the same shell) associated with the second index.
+        screen_tol : {float, None}
+            Tolerance below which the estimate of the overlap of a primitive pair is screened out.
+            Default does not screen the primitive pairs.
+
+        """
+        self.coord_one = np.array(contractions_one.coord)
+        self.coord_two = np.array(contractions_two.coord)
+        self.prims_one = np.arange(contractions_one.exps.size)
+        self.prims_two = np.arange(contractions_two.exps.size)
+        self.exps_one = contractions_one.exps
+        self.coeffs_one = contractions_one.coeffs
+        self.norm_prim_cart_one = contractions_one.norm_prim_cart
+        self.exps_two = contractions_two.exps
+        self.coeffs_two = contractions_two.coeffs
+        self.norm_prim_cart_two = contractions_two.norm_prim_cart
+
+        exps_a = self.exps_one[np.newaxis, :]
+        exps_b = self.exps_two[:, np.newaxis]
+        rel_coord = self.coord_one - self.coord_two
+        self.mask = np.ones((self.exps_two.size, self.exps_one.size), dtype=bool)
+        self.exps_sum = exps_a + exps_b
+        self.harm_mean = exps_a * exps_b / self.exps_sum
+        self.coord_wac = (
+            exps_a * self.coord_one[:, np.newaxis, np.newaxis]
+            + exps_b * self.coord_two[:, np.newaxis, np.newaxis]
+        ) / self.exps_sum
+        self.exp_coord = np.exp(-self.harm_mean * rel_coord[:, np.newaxis, np.newaxis] ** 2)
+        self.exp_dist = np.exp(-self.harm_mean * np.sum(rel_coord**2))
+        if screen_tol is not None:
+            self._screen(screen_tol)
+
+    def screened(self, screen_tol):
+        """Return a copy of the pair whose primitive pairs are screened with the given tolerance.
+
+        Parameters
+        ----------
+        screen_tol : float
+            Tolerance below which the estimate of the overlap of a primitive pair is screened out.
+
+        Returns
+        -------
+        shell_pair : ShellPair
+            Primitive-pair quantities of the primitive pairs that are not screened out.
+
+        """
+        shell_pair = copy.copy(self)
+        shell_pair._screen(screen_tol)
+        return shell_pair
+
+    def _screen(self, screen_tol):
+        """Screen out the primitive pairs whose estimate of the overlap is below the tolerance.
+
+        Parameters
+        ----------
+        screen_tol : float
+            Tolerance below which the estimate of the overlap of a primitive pair is screened out.
+
+        """
+        bound = (
+            (np.pi / self.exps_sum) ** 1.5
+            * self.exp_dist
+            * np.max(np.abs(self.coeffs_one), axis=1)[np.newaxis, :]
+            * np.max(self.norm_prim_cart_one, axis=0)[np.newaxis, :]
+            * np.max(np.abs(self.coeffs_two), axis=1)[:, np.newaxis]
+            * np.max(self.norm_prim_cart_two, axis=0)[:, np.newaxis]
+        )
+        mask = self.mask & (bound >= screen_tol)
+        kept = mask.copy()
+        if not np.any(kept):
+            # keep the largest pair (with zero prefactor) so that the integrals are zero
+            kept[np.unravel_index(np.argmax(bound), bound.shape)] = True
+        prims_one = np.flatnonzero(np.any(kept, axis=0))
+        prims_two = np.flatnonzero(np.any(kept, axis=1))
+        pairs = (prims_two[:, np.newaxis], prims_one[np.newaxis, :])
+
+        self.prims_one = self.prims_one[prims_one]
+        self.prims_two = self.prims_two[prims_two]
+        self.exps_one = self.exps_one[prims_one]
+        self.coeffs_one = self.coeffs_one[prims_one]
+        self.norm_prim_cart_one = self.norm_prim_cart_one[:, prims_one]
+        self.exps_two = self.exps_two[prims_two]
+        self.coeffs_two = self.coeffs_two[prims_two]
+        self.norm_prim_cart_two = self.norm_prim_cart_two[:, prims_two]
+
+        self.mask = mask[pairs]
+        self.exps_sum = self.exps_sum[pairs]
+        self.harm_mean = self.harm_mean[pairs]
+        self.coord_wac = self.coord_wac[(slice(None),) + pairs]
+        self.exp_coord = self.mask * self.exp_coord[(slice(None),) + pairs]
+        self.exp_dist = self.mask * self.exp_dist[pairs]
+
+
+class ShellPairData:
+    """Cache of the primitive-pair quantities of the shell pairs of a basis set.
+
+    The shell pairs are built when they are first requested and are reused by every one-electron
+    integral that is given the same instance, such that the overlap, kinetic energy, nuclear
+    attraction, and moment integrals of a basis set set up the primitive pairs only once. The pairs
+    are cached by the indices of the shells in `basis`, so `invalidate` must be called after a
+    shell of `basis` is modified.
+
+    The screening tolerance is a heuristic for the overlap only: the screened shell pairs are
+    requested by `Overlap` alone, and are obtained from the cached unscreened shell pairs, which
+    all of the other integrals use.
+
+    Attributes
+    ----------
+    basis : tuple of GeneralizedContractionShell
+        Shells of generalized contractions whose pairs are cached.
+    screen_tol : {float, None}
+        Tolerance below which the estimate of the overlap of a primitive pair is screened out.
+        If None, the primitive pairs are not screened.
+
+    Methods
+    -------
+    __init__(self, basis, screen_tol=None)
+        Initialize.
+    get(self, contractions_one, contractions_two, screen=False) : ShellPair
+        Return the primitive-pair quantities of the given contractions.
+    invalidate(self, indices=None)
+        Drop the cached shell pairs of the given shells.
+
+    """
+
+    def __init__(self, basis, screen_tol=None):
+        """Initialize.
+
+        Parameters
+        ----------
+        basis : list/tuple of GeneralizedContractionShell
+            Shells of generalized contractions.
+        screen_tol : {float, None}
+            Tolerance below which the estimate of the overlap of a primitive pair is screened out.
+            It is only applied to the overlap.
+            Default does not screen the primitive pairs.
+
+        Raises
+        ------
+        TypeError
+            If `basis` is not a list/tuple of `GeneralizedContractionShell` instances.
+        ValueError
+            If `screen_tol` is not positive.
+
+        """
+        if not (
+            isinstance(basis, (list, tuple))
+            and all(isinstance(shell, GeneralizedContractionShell) for shell in basis)
+        ):
+            raise TypeError(
+                "`basis` must be a list/tuple of `GeneralizedContractionShell` instances."
+            )
+        if screen_tol is not None and screen_tol <= 0:
+            raise ValueError("`screen_tol` must be positive.")
+        self.basis = tuple(basis)
+        self.screen_tol = screen_tol
+        self._indices = {id(shell): index for index, shell in enumerate(self.basis)}
+        self._pairs = {}
+        self._screened_pairs = {}
+
+    def get(self, contractions_one, contractions_two, screen=False):
+        """Return the primitive-pair quantities of the given contractions.
+
+        The pair is built on the first request and reused until it is dropped with `invalidate`.
+
+        Parameters
+        ----------
+        contractions_one : GeneralizedContractionShell
+            Contracted Cartesian Gaussians (of the same shell) associated with the first index.
+        contractions_two : GeneralizedContractionShell
+            Contracted Cartesian Gaussians (of the same shell) associated with the second index.
+        screen : bool
+            Flag for screening the primitive pairs with `screen_tol`.
+            Only the overlap may use the screened primitive pairs.
+            Default is False.
+
+        Returns
+        -------
+        shell_pair : ShellPair
+            Primitive-pair quantities of the given contractions.
+
+        Raises
+        ------
+        ValueError
+            If either of the contractions is not a shell of `basis`.
+
+        """
+        key = (self._index(contractions_one), self._index(contractions_two))
+        shell_pair = self._pairs.get(key)
+        if shell_pair is None:
+            shell_pair = ShellPair(contractions_one, contractions_two)
+            self._pairs[key] = shell_pair
+        if not screen or self.screen_tol is None:
+            return shell_pair
+        screened_pair = self._screened_pairs.get(key)
+        if screened_pair is None:
+            screened_pair = shell_pair.screened(self.screen_tol)
+            self._screened_pairs[key] = screened_pair
+        return screened_pair
+
+    def invalidate(self, indices=None):
+        """Drop the cached shell pairs of the given shells.
+
+        Parameters
+        ----------
+        indices : {iterable of int, None}
+            Indices of the shells in `basis` that have been modified.
+            Default drops all of the cached shell pairs.
+
+        """
+        if indices is None:
+            self._pairs.clear()
+            self._screened_pairs.clear()
+            return
+        indices = set(indices)
+        for pairs in (self._pairs, self._screened_pairs):
+            for key in [key for key in pairs if indices.intersection(key)]:
+                del pairs[key]
+
+    def _index(self, contraction):
+        """Return the index of the given contraction in `basis`.
+
+        Parameters
+        ----------
+        contraction : GeneralizedContractionShell
+            Contracted Cartesian Gaussians (of the same shell).
+
+        Returns
+        -------
+        index : int
+            Index of the contraction in `basis`.
+
+        Raises
+        ------
+        ValueError
+            If the contraction is not a shell of `basis`.
+
+        """
+        index = self._indices.get(id(contraction))
+        if index is None:
+            raise ValueError("The contractions must be shells of the `basis` of `ShellPairData`.")
+        return index
+
+
+def shell_pair_primitives(contractions_one, contractions_two, shell_pairs=None, screen=False):
+    """Return the primitives of two contractions and their shell pair, if any.
+
+    Parameters
+    ----------
+    contractions_one : GeneralizedContractionShell
+        Contracted Cartesian Gaussians (of the same shell) associated with the first index.
+    contractions_two : GeneralizedContractionShell
+        Contracted Cartesian Gaussians (of the same shell) associated with the second index.
+    shell_pairs : ShellPairData, optional
+        Cache of the shell pairs.
+        Default uses all of the primitives of the contractions without a shell pair.
+    screen : bool
+        Flag for screening the primitive pairs with the screening tolerance of `shell_pairs`.
+        Only the overlap may use the screened primitive pairs.
+        Default is False.
+
+    Returns
+    -------
+    exps_one : np.ndarray(K_a,)
+        Exponents of the primitives of the first contraction.
+    coeffs_one : np.ndarray(K_a, M_a)
+        Contraction coefficients of the primitives of the first contraction.
+    norm_prim_cart_one : np.ndarray(L_a, K_a)
+        Normalization constants of the primitives of the first contraction.
+    exps_two : np.ndarray(K_b,)
+        Exponents of the primitives of the second contraction.
+    coeffs_two : np.ndarray(K_b, M_b)
+        Contraction coefficients of the primitives of the second contraction.
+    norm_prim_cart_two : np.ndarray(L_b, K_b)
+        Normalization constants of the primitives of the second contraction.
+    shell_pair : {ShellPair, None}
+        Primitive-pair quantities of the contractions.
+        None if `shell_pairs` is not given.
+
+    Raises
+    ------
+    TypeError
+        If `shell_pairs` is not a `ShellPairData` instance or None.
+
+    """
+    if shell_pairs is None:
+        return (
+            contractions_one.exps,
+            contractions_one.coeffs,
+            contractions_one.norm_prim_cart,
+            contractions_two.exps,
+            contractions_two.coeffs,
+            contractions_two.norm_prim_cart,
+            None,
+        )
+    if not isinstance(shell_pairs, ShellPairData):
+        raise TypeError("`shell_pairs` must be a `ShellPairData` instance.")
+    shell_pair = shell_pairs.get(contractions_one, contractions_two, screen=screen)
+    return (
+        shell_pair.exps_one,
+        shell_pair.coeffs_one,
+        shell_pair.norm_prim_cart_one,
+        shell_pair.exps_two,
+        shell_pair.coeffs_two,
+        shell_pair.norm_prim_cart_two,
+        shell_pair,
+    )
@@ -1,6 +1,7 @@
 """Convert from Cartesian Gaussians to spherical Gaussians."""
 
 from collections import defaultdict
+from functools import lru_cache
 
 import numpy as np
 from scipy.special import comb, factorial
@@ -311,9 +312,36 @@ def generate_transformation(angmom, cartesian_order, spherical_order, apply_from
             " from m=1 to `angmom`."
         )
 
-    order = {
-        components: index for index, components in enumerate(list(map(tuple, cartesian_order)))
-    }
+    transform = _cartesian_to_spherical(
+        angmom, tuple(map(tuple, cartesian_order.tolist())), tuple(spherical_order)
+    ).copy()
+
+    if apply_from == "left":
+        return transform.T
+    return transform
+
+
+@lru_cache(maxsize=None)
+def _cartesian_to_spherical(angmom, cartesian_order, spherical_order):
+    """Return the cached transformation matrix from Cartesian to spherical primitives.
+
+    Parameters
+    ----------
+    angmom : int
+        Angular momentum of the primitives.
+    cartesian_order : tuple of tuple of int
+        Order of the Cartesian components of the primitives.
+    spherical_order : tuple of str
+        Order of the spherical components of the primitives.
+
+    Returns
+    -------
+    transform : np.ndarray((angmom + 1)*(angmom + 2) / 2, 2 * angmom + 1)
+        The transformation matrix from Cartesian primitives to spherical primitives. It is shared
+        between the calls and must not be modified.
+
+    """
+    order = {components: index for index, components in enumerate(cartesian_order)}
     transform = np.zeros(((angmom + 1) * (angmom + 2) // 2, 2 * angmom + 1))
 
     for i, pure_fn in enumerate(spherical_order):
@@ -332,9 +360,7 @@ def generate_transformation(angmom, cartesian_order, spherical_order, apply_from
             transform[order[components], i] = sign * coeff
 
     # normalize
+    cartesian_order = np.array(cartesian_order)
     transform *= np.sqrt(np.prod(factorial2(2 * cartesian_order - 1), axis=1))[:, np.newaxis]
     transform /= np.sqrt(factorial2(2 * angmom - 1))
-
-    if apply_from == "left":
-        return transform.T
     return transform
@@ -1,5 +1,10 @@
 """Utility functions for gbasis."""
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import wraps
+import inspect
+from threading import Lock
+
 import numpy as np
 import scipy.special
 
@@ -20,3 +25,151 @@ def factorial2(n):
     out = scipy.special.factorial2(np.array(n))
     out[out <= 0] = 1.0
     return out
+
+
+def evaluate_by_chunks(func, points, chunk_size=None, axis=-1, n_workers=None):
+    """Evaluate a function of the grid points on consecutive blocks of points.
+
+    The results of each block are written into a preallocated output array, such that only the
+    intermediates of the blocks that are being evaluated are kept in memory at a time.
+
+    Parameters
+    ----------
+    func : callable
+        Function that takes an array of points, `np.ndarray(N_block, 3)`, and returns an array whose
+        axis `axis` corresponds to the given points.
+    points : np.ndarray(N, 3)
+        Cartesian coordinates of the points in space (in atomic units).
+    chunk_size : int, optional
+        Maximum number of points that are evaluated at once.
+        Default evaluates all points at once, or splits the points evenly between the workers if
+        `n_workers` is given.
+    axis : int, optional
+        Axis of the output of `func` that corresponds to the points.
+        Default is the last axis.
+    n_workers : int, optional
+        Number of threads that evaluate the blocks of points concurrently. Since `numpy` releases
+        the GIL in most of its array operations, the blocks are evaluated in parallel.
+        Default evaluates the blocks one after another.
+
+    Returns
+    -------
+    output : np.ndarray
+        Output of `func` evaluated at all of the given points.
+
+    Raises
+    ------
+    TypeError
+        If `chunk_size` is not an integer.
+        If `n_workers` is not an integer.
+    ValueError
+        If `chunk_size` is not positive.
+        If `n_workers` is not positive.
+
+    """
+    if n_workers is not None:
+        if not isinstance(n_workers, (int, np.integer)) or isinstance(n_workers, bool):
+            raise TypeError("`n_workers` must be an integer.")
+        if n_workers <= 0:
+            raise ValueError("`n_workers` must be a positive integer.")
+    num_points = points.shape[0]
+    if chunk_size is None:
+        if n_workers is None or n_workers == 1:
+            return func(points)
+        chunk_size = max(-(-num_points // n_workers), 1)
+    if not isinstance(chunk_size, (int, np.integer)) or isinstance(chunk_size, bool):
+        raise TypeError("`chunk_size` must be an integer.")
+    if chunk_size <= 0:
+        raise ValueError("`chunk_size` must be a positive integer.")
+
+    if num_points <= chunk_size:
+        return func(points)
+
+    slices = [
+        slice(start, min(start + chunk_size, num_points))
+        for start in range(0, num_points, chunk_size)
+    ]
+    output = []
+    lock = Lock()
+
+    def evaluate_block(points_slice):
+        """Evaluate the given block of points and write it into the output."""
+        block = func(points[points_slice])
+        with lock:
+            # the output is allocated once the shape of the first block is known
+            if not output:
+                shape = list(block.shape)
+                shape[axis] = num_points
+                output.append(np.empty(shape, dtype=block.dtype))
+        index = [slice(None)] * block.ndim
+        index[axis] = points_slice
+        output[0][tuple(index)] = block
+
+    if n_workers is None or n_workers == 1:
+        for points_slice in slices:
+            evaluate_block(points_slice)
+    else:
+        with ThreadPoolExecutor(max_workers=n_workers) as executor:
+            # propagate the exceptions raised in the threads
+            list(executor.map(evaluate_block, slices))
+    return output[0]
+
+
+def chunked_points(axis=-1):
+    """Decorate a function of the grid points to evaluate it on blocks of points.
+
+    The decorated function must have the parameters `points`, `chunk_size`, and `n_workers`, and it
+    may have the parameter `deriv_cache`. When `chunk_size` or `n_workers` is given, the function is
+    evaluated with `evaluate_by_chunks`, and all of the other arguments of the call are forwarded
+    to the evaluation of each block of points. The blocks have at most `chunk_size` points, which
+    bounds the size of the intermediates kept in memory, and they are evaluated concurrently by
+    `n_workers` threads. If `chunk_size` is not given, the points are split evenly between the
+    threads.
+
+    Parameters
+    ----------
+    axis : int, optional
+        Axis of the output of the decorated function that corresponds to the points.
+        Default is the last axis.
+
+    Returns
+    -------
+    decorator : callable
+        Decorator of the function of the grid points.
+
+    Raises
+    ------
+    ValueError
+        If the decorated function is called with `chunk_size` or `n_workers` together with
+        `deriv_cache`.
+
+    """
+
+    def decorator(func):
+        """Wrap the function to evaluate it on blocks of points."""
+        signature = inspect.signature(func)
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            """Evaluate the function on blocks of points if `chunk_size` or `n_workers` is given."""
+            arguments = signature.bind(*args, **kwargs).arguments
+            chunk_size = arguments.pop("chunk_size", None)
+            n_workers = arguments.pop("n_workers", None)
+            if chunk_size is None and n_workers is None:
+                return func(*args, **kwargs)
+            if arguments.get("deriv_cache") is not None:
+                raise ValueError(
+                    "`chunk_size` and `n_workers` cannot be used together with `deriv_cache`."
+                )
+            points = arguments.pop("points")
+            return evaluate_by_chunks(
+                lambda pts: func(points=pts, **arguments),
+                points,
+                chunk_size,
+                axis=axis,
+                n_workers=n_workers,
+            )
+
+        return wrapper
+
+    return decorator
@@ -730,10 +730,26 @@ def test_construct_array_lincomb():
             orb_transform,
         ),
     )
+    transform_one = np.random.rand(2, 3)
+    transform_two = np.random.rand(4, 3)
+    assert np.allclose(
+        test.construct_array_lincomb(
+            [transform_one, transform_two, None, transform_one], ["cartesian"]
+        ),
+        np.einsum(
+            "ijkl,ai,bj,dl->abkd",
+            np.einsum("ijkl->lkji", np.arange(81).reshape(3, 3, 3, 3)) * 2,
+            transform_one,
+            transform_two,
+            transform_one,
+        ),
+    )
     with pytest.raises(TypeError):
         test.construct_array_lincomb(orb_transform, "spherical", bad_keyword=3)
     with pytest.raises(TypeError):
         test.construct_array_lincomb(orb_transform, "bad", keyword=3)
+    with pytest.raises(TypeError):
+        test.construct_array_lincomb([orb_transform] * 3, ["cartesian"])
 
     Test = disable_abstract(  # noqa: N806
         BaseFourIndexSymmetric,
@@ -0,0 +1,187 @@
+"""Test gbasis.base_three."""
+from gbasis.base_three import BaseThreeIndex
+from gbasis.contractions import GeneralizedContractionShell
+from gbasis.spherical import generate_transformation
+import numpy as np
+import pytest
+from utils import disable_abstract, skip_init
+
+
+def test_init():
+    """Test BaseThreeIndex.__init__."""
+    Test = disable_abstract(BaseThreeIndex)  # noqa: N806
+    test = skip_init(Test)
+    contractions = GeneralizedContractionShell(
+        1, np.array([1, 2, 3]), np.ones(1), np.ones(1), "spherical"
+    )
+    Test.__init__(test, [contractions], [contractions], [contractions])
+    assert test._axes_contractions == ((contractions,), (contractions,), (contractions,))
+    with pytest.raises(TypeError):
+        Test.__init__(test, [contractions], [contractions])
+    with pytest.raises(TypeError):
+        Test.__init__(test, [contractions], [contractions], [contractions], [contractions])
+
+
+def test_contractions():
+    """Test BaseThreeIndex.contractions_one, contractions_two, and contractions_three."""
+    Test = disable_abstract(BaseThreeIndex)  # noqa: N806
+    cont_one = GeneralizedContractionShell(
+        1, np.array([1, 2, 3]), np.ones(1), np.ones(1), "spherical"
+    )
+    cont_two = GeneralizedContractionShell(
+        2, np.array([1, 2, 3]), np.ones(1), np.ones(1), "spherical"
+    )
+    cont_three = GeneralizedContractionShell(
+        0, np.array([1, 2, 3]), np.ones(1), np.ones(1), "spherical"
+    )
+    test = Test([cont_one], [cont_two], [cont_three])
+    assert test.contractions_one[0] == cont_one
+    assert test.contractions_two[0] == cont_two
+    assert test.contractions_three[0] == cont_three
+
+
+def test_contruct_array_cartesian():
+    """Test BaseThreeIndex.construct_array_cartesian."""
+    Test = disable_abstract(  # noqa: N806
+        BaseThreeIndex,
+        dict_overwrite={
+            "construct_array_contraction": (
+                lambda self, cont1, cont2, cont3, a=2: np.ones((2, 3, 1, 3, 1, 1)) * a
+            )
+        },
+    )
+    cont_one = GeneralizedContractionShell(
+        1, np.array([1, 2, 3]), np.ones((1, 2)), np.ones(1), "spherical"
+    )
+    cont_two = GeneralizedContractionShell(
+        1, np.array([1, 2, 3]), np.ones(1), np.ones(1), "spherical"
+    )
+    cont_three = GeneralizedContractionShell(
+        0, np.array([1, 2, 3]), np.ones(1), np.ones(1), "spherical"
+    )
+    cont_one.norm_cont = np.ones((2, 3))
+    cont_two.norm_cont = np.ones((1, 3)) * 3
+    cont_three.norm_cont = np.ones((1, 1)) * 5
+    test = Test([cont_one], [cont_two, cont_two], [cont_three, cont_three, cont_three])
+    assert np.allclose(test.construct_array_cartesian(), np.ones((6, 6, 3)) * 30)
+    assert np.allclose(test.construct_array_cartesian(a=3), np.ones((6, 6, 3)) * 45)
+    with pytest.raises(TypeError):
+        test.construct_array_cartesian(bad_keyword=3)
+
+
+def test_contruct_array_spherical():
+    """Test BaseThreeIndex.construct_array_spherical."""
+    cont_one = GeneralizedContractionShell(
+        1, np.array([1, 2, 3]), np.ones(1), np.ones(1), "spherical"
+    )
+    cont_two = GeneralizedContractionShell(
+        2, np.array([1, 2, 3]), np.ones(1), np.ones(1), "spherical"
+    )
+    transform_one = generate_transformation(
+        1, cont_one.angmom_components_cart, cont_one.angmom_components_sph, "left"
+    )
+    transform_two = generate_transformation(
+        2, cont_two.angmom_components_cart, cont_two.angmom_components_sph, "left"
+    )
+    array = np.random.rand(1, 3, 1, 6, 1, 3)
+    Test = disable_abstract(  # noqa: N806
+        BaseThreeIndex,
+        dict_overwrite={
+            "construct_array_contraction": lambda self, cont1, cont2, cont3: array.copy()
+        },
+    )
+    test = Test([cont_one], [cont_two], [cont_one])
+    assert np.allclose(
+        test.construct_array_spherical(),
+        np.einsum(
+            "ip,jq,kr,pqr->ijk",
+            transform_one,
+            transform_two,
+            transform_one,
+            array[0, :, 0, :, 0] * cont_two.norm_cont[0, :].reshape(1, 6, 1),
+        )
+        * cont_one.norm_cont[0, 0] ** 2,
+    )
+
+    test = Test([cont_one], [cont_two], [cont_one, cont_one])
+    assert np.allclose(
+        test.construct_array_mix(["spherical"], ["cartesian"], ["cartesian", "spherical"]),
+        np.concatenate(
+            [
+                np.einsum("ip,pqr->iqr", transform_one, array[0, :, 0, :, 0]),
+                np.einsum("ip,kr,pqr->iqk", transform_one, transform_one, array[0, :, 0, :, 0]),
+            ],
+            axis=2,
+        )
+        * cont_one.norm_cont[0, 0] ** 2
+        * cont_two.norm_cont[0, :].reshape(1, 6, 1),
+    )
+
+
+def test_construct_array_mix():
+    """Test BaseThreeIndex.construct_array_mix."""
+    contractions = GeneralizedContractionShell(
+        1, np.array([1, 2, 3]), np.ones(1), np.ones(1), "spherical"
+    )
+    Test = disable_abstract(  # noqa: N806
+        BaseThreeIndex,
+        dict_overwrite={
+            "construct_array_contraction": (
+                lambda self, cont1, cont2, cont3, a=2: np.arange(27, dtype=float).reshape(
+                    1, 3, 1, 3, 1, 3
+                )
+                * a
+            )
+        },
+    )
+    test = Test([contractions], [contractions], [contractions, contractions])
+    assert np.allclose(
+        test.construct_array_cartesian(a=3),
+        test.construct_array_mix(["cartesian"], ["cartesian"], ["cartesian"] * 2, a=3),
+    )
+    assert np.allclose(
+        test.construct_array_spherical(),
+        test.construct_array_mix(["spherical"], ["spherical"], ["spherical"] * 2),
+    )
+    with pytest.raises(TypeError):
+        test.construct_array_mix("cartesian", ["cartesian"], ["cartesian"] * 2)
+    with pytest.raises(ValueError):
+        test.construct_array_mix(["cartesian"], ["bad"], ["cartesian"] * 2)
+    with pytest.raises(ValueError):
+        test.construct_array_mix(["cartesian"], ["cartesian"], ["cartesian"])
+
+
+def test_construct_array_lincomb():
+    """Test BaseThreeIndex.construct_array_lincomb."""
+    contractions = GeneralizedContractionShell(
+        1, np.array([1, 2, 3]), np.ones(1), np.ones(1), "spherical"
+    )
+    Test = disable_abstract(  # noqa: N806
+        BaseThreeIndex,
+        dict_overwrite={
+            "construct_array_contraction": (
+                lambda self, cont1, cont2, cont3: np.random.rand(1, 3, 1, 3, 1, 3)
+            )
+        },
+    )
+    test = Test([contractions], [contractions], [contractions])
+    array = test.construct_array_cartesian()
+    Test.construct_array_cartesian = lambda self: array
+    Test.construct_array_mix = lambda self, *coord_types: array
+    transform_one = np.random.rand(4, 3)
+    transform_two = np.random.rand(5, 3)
+    transform_three = np.random.rand(2, 3)
+    assert np.allclose(
+        test.construct_array_lincomb(
+            transform_one, transform_two, transform_three, "cartesian", "cartesian", "cartesian"
+        ),
+        np.einsum("il,jm,kn,lmn->ijk", transform_one, transform_two, transform_three, array),
+    )
+    assert np.allclose(
+        test.construct_array_lincomb(
+            transform_one, None, transform_three, "cartesian", "cartesian", "cartesian"
+        ),
+        np.einsum("il,kn,lmn->imk", transform_one, transform_three, array),
+    )
+    with pytest.raises(TypeError):
+        test.construct_array_lincomb(None, None, None, "cartesian", "cartesian", 1)
@@ -0,0 +1,52 @@
+"""Test gbasis.integrals.boys."""
+from gbasis.integrals.boys import (
+    boys_function_all_orders,
+    boys_function_hyp1f1,
+    boys_function_tabulated,
+    GRID_MAX,
+)
+import numpy as np
+from scipy.special import gamma, gammainc
+
+
+def boys_gammainc(order, weighted_dist):
+    """Return the Boys function written with the regularized lower incomplete gamma function."""
+    order = order + 0.5
+    return gamma(order) * gammainc(order, weighted_dist) / (2 * weighted_dist**order)
+
+
+def test_boys_function_all_orders():
+    """Test gbasis.integrals.boys.boys_function_all_orders."""
+    weighted_dist = np.concatenate(
+        [
+            np.random.rand(50) * 1.2 * GRID_MAX,
+            10 ** np.random.uniform(-6, 3, 50),
+            [GRID_MAX - 0.05, GRID_MAX, 1e6],
+        ]
+    )
+    test = boys_function_all_orders(20, weighted_dist.reshape(1, 103))
+    assert test.shape == (21, 1, 103)
+    ref = boys_gammainc(np.arange(21)[:, None], weighted_dist[None, :])
+    assert np.allclose(test[:, 0], ref, rtol=1e-13, atol=0)
+
+    test = boys_function_all_orders(6, np.zeros(3))
+    assert np.allclose(test, 1 / (2 * np.arange(7)[:, None] + 1) * np.ones(3), rtol=1e-14, atol=0)
+    assert boys_function_all_orders(0, 0.5).shape == (1,)
+
+
+def test_boys_function_tabulated():
+    """Test gbasis.integrals.boys.boys_function_tabulated."""
+    orders = np.arange(10)[:, None, None, None]
+    weighted_dist = np.random.rand(1, 4, 5, 6) * 40
+    test = boys_function_tabulated(orders, weighted_dist)
+    assert test.shape == (10, 4, 5, 6)
+    assert np.allclose(test, boys_function_hyp1f1(orders, weighted_dist))
+    assert np.allclose(test, boys_gammainc(orders, weighted_dist), rtol=1e-13, atol=0)
+
+    assert np.allclose(boys_function_tabulated(0, weighted_dist), test[:1])
+    test = boys_function_tabulated(orders, weighted_dist[:, None])
+    assert test.shape == (1, 10, 4, 5, 6)
+    assert np.allclose(test[0], boys_function_hyp1f1(orders, weighted_dist))
+
+    # no weighted distances
+    assert boys_function_tabulated(orders, np.zeros((1, 0, 5, 6))).shape == (10, 0, 5, 6)
@@ -6,11 +6,12 @@ from gbasis.evals.density import (
     evaluate_density_laplacian,
     evaluate_density_using_evaluated_orbs,
     evaluate_deriv_density,
+    evaluate_deriv_reduced_density_matrix,
     evaluate_general_kinetic_energy_density,
     evaluate_posdef_kinetic_energy_density,
 )
 from gbasis.evals.eval import evaluate_basis
-from gbasis.evals.eval_deriv import evaluate_deriv_basis
+from gbasis.evals.eval_deriv import DerivBasisCache, evaluate_deriv_basis
 from gbasis.parsers import make_contractions, parse_nwchem
 import numpy as np
 import pytest
@@ -57,6 +58,33 @@ def test_evaluate_density_using_evaluated_orbs():
     with pytest.raises(ValueError):
         density_mat = np.array([[1.0, 2.0], [3.0, 4.0]])
         evaluate_density_using_evaluated_orbs(density_mat, orb_eval)
+    dens = evaluate_density_using_evaluated_orbs(density_mat, orb_eval, check_symmetry=False)
+    assert np.allclose(dens, np.einsum("ij,ik,jk->k", density_mat, orb_eval, orb_eval))
+
+
+def test_evaluate_density_using_evaluated_orbs_tol_screen():
+    """Test gbasis.evals.density.evaluate_density_using_evaluated_orbs with screening."""
+    density_mat = np.random.rand(5, 5)
+    density_mat = density_mat.dot(density_mat.T)
+    orb_eval = np.random.rand(5, 10)
+    orb_eval[[1, 3]] *= 1e-14
+    ref = np.einsum("ij,ik,jk->k", density_mat, orb_eval, orb_eval)
+    dens = evaluate_density_using_evaluated_orbs(density_mat, orb_eval, tol_screen=0)
+    assert np.allclose(dens, ref)
+    dens = evaluate_density_using_evaluated_orbs(density_mat, orb_eval, tol_screen=1e-12)
+    assert np.allclose(dens, ref)
+    assert np.allclose(
+        dens,
+        np.einsum(
+            "ij,ik,jk->k",
+            density_mat[np.ix_([0, 2, 4], [0, 2, 4])],
+            orb_eval[[0, 2, 4]],
+            orb_eval[[0, 2, 4]],
+        ),
+    )
+    assert np.allclose(
+        evaluate_density_using_evaluated_orbs(density_mat, orb_eval, tol_screen=1.0), 0
+    )
 
 
 def test_evaluate_density():
@@ -448,3 +476,135 @@ def test_evaluate_general_kinetic_energy_density():
         evaluate_posdef_kinetic_energy_density(np.identity(40), basis, points, np.identity(40))
         + evaluate_density_laplacian(np.identity(40), basis, points, np.identity(40)),
     )
+
+
+def test_evaluate_density_deriv_cache():
+    """Test sharing a DerivBasisCache between the functions of gbasis.evals.density."""
+    basis_dict = parse_nwchem(find_datafile("data_anorcc.nwchem"))
+    basis = make_contractions(basis_dict, ["H"], np.array([[0, 0, 0]]), "spherical")
+    points = np.random.rand(10, 3)
+    density = np.random.rand(40, 40)
+    density = density.dot(density.T)
+    transform = np.identity(40)
+
+    cache = DerivBasisCache(basis, points, transform=transform)
+    assert np.allclose(
+        evaluate_density(density, basis, points, transform, deriv_cache=cache),
+        evaluate_density(density, basis, points, transform),
+    )
+    assert np.allclose(
+        evaluate_density_gradient(density, basis, points, transform, deriv_cache=cache),
+        evaluate_density_gradient(density, basis, points, transform),
+    )
+    assert np.allclose(
+        evaluate_density_hessian(density, basis, points, transform, deriv_cache=cache),
+        evaluate_density_hessian(density, basis, points, transform),
+    )
+    assert np.allclose(
+        evaluate_density_laplacian(density, basis, points, transform, deriv_cache=cache),
+        evaluate_density_laplacian(density, basis, points, transform),
+    )
+    # the zeroth, first and second order derivatives are all stored in the cache
+    assert len(cache) == 10
+    orders = np.array([1, 3, 0])
+    assert np.allclose(
+        evaluate_deriv_density(orders, density, basis, points, transform, deriv_cache=cache),
+        evaluate_deriv_density(orders, density, basis, points, transform),
+    )
+
+    with pytest.raises(TypeError):
+        evaluate_density_gradient(density, basis, points, transform, deriv_cache={})
+
+
+def test_evaluate_density_chunk_size():
+    """Test evaluating the functions of gbasis.evals.density in blocks of points."""
+    basis_dict = parse_nwchem(find_datafile("data_anorcc.nwchem"))
+    basis = make_contractions(basis_dict, ["H"], np.array([[0, 0, 0]]), "spherical")
+    points = np.random.rand(10, 3)
+    density = np.random.rand(40, 40)
+    density = density.dot(density.T)
+    transform = np.identity(40)
+
+    for func in [
+        evaluate_density,
+        evaluate_density_gradient,
+        evaluate_density_hessian,
+        evaluate_density_laplacian,
+        evaluate_posdef_kinetic_energy_density,
+    ]:
+        assert np.allclose(
+            func(density, basis, points, transform, chunk_size=3),
+            func(density, basis, points, transform),
+        )
+    assert np.allclose(
+        evaluate_general_kinetic_energy_density(
+            density, basis, points, 0.5, transform, chunk_size=4
+        ),
+        evaluate_general_kinetic_energy_density(density, basis, points, 0.5, transform),
+    )
+    orders = np.array([1, 0, 2])
+    assert np.allclose(
+        evaluate_deriv_density(orders, density, basis, points, transform, chunk_size=7),
+        evaluate_deriv_density(orders, density, basis, points, transform),
+    )
+    assert np.allclose(
+        evaluate_deriv_reduced_density_matrix(
+            orders, orders, density, basis, points, transform, chunk_size=7
+        ),
+        evaluate_deriv_reduced_density_matrix(orders, orders, density, basis, points, transform),
+    )
+    # the arguments are forwarded to the blocks whether they are given by position or by keyword
+    assert np.allclose(
+        evaluate_density_gradient(density, basis, points, transform, "direct", None, 3),
+        evaluate_density_gradient(density, basis, points, transform, deriv_type="direct"),
+    )
+    assert np.allclose(
+        evaluate_posdef_kinetic_energy_density(
+            density, basis, points, deriv_type="direct", threshold=1.0, chunk_size=3
+        ),
+        evaluate_posdef_kinetic_energy_density(density, basis, points, threshold=1.0),
+    )
+
+    cache = DerivBasisCache(basis, points, transform=transform)
+    with pytest.raises(ValueError):
+        evaluate_density(density, basis, points, transform, deriv_cache=cache, chunk_size=3)
+
+
+def test_evaluate_density_tol_screen():
+    """Test gbasis.evals.density.evaluate_density with screening."""
+    basis_dict = parse_nwchem(find_datafile("data_631g.nwchem"))
+    coords = np.array([[0, 0, 0], [0, 0, 10.0], [0, 0, 20.0]])
+    basis = make_contractions(basis_dict, ["C", "O", "H"], coords, "spherical")
+    points = np.random.rand(100, 3) * np.array([4, 4, 24]) - 2
+    points = points[np.argsort(points[:, 2])]
+    density = np.random.rand(20, 20)
+    density = density.dot(density.T)
+
+    ref = evaluate_density(density, basis, points)
+    assert np.allclose(evaluate_density(density, basis, points, tol_screen=1e-12), ref)
+    assert np.allclose(
+        evaluate_density(density, basis, points, chunk_size=10, tol_screen=1e-12), ref
+    )
+    with pytest.raises(ValueError):
+        evaluate_density(density + np.triu(density), basis, points, chunk_size=10)
+
+
+def test_evaluate_density_n_workers():
+    """Test evaluating the functions of gbasis.evals.density in parallel blocks of points."""
+    basis_dict = parse_nwchem(find_datafile("data_anorcc.nwchem"))
+    basis = make_contractions(basis_dict, ["H"], np.array([[0, 0, 0]]), "spherical")
+    points = np.random.rand(10, 3)
+    density = np.random.rand(40, 40)
+    density = density.dot(density.T)
+
+    assert np.allclose(
+        evaluate_density(density, basis, points, n_workers=3),
+        evaluate_density(density, basis, points),
+    )
+    assert np.allclose(
+        evaluate_density_hessian(density, basis, points, chunk_size=2, n_workers=3),
+        evaluate_density_hessian(density, basis, points),
+    )
+    cache = DerivBasisCache(basis, points)
+    with pytest.raises(ValueError):
+        evaluate_density_gradient(density, basis, points, deriv_cache=cache, n_workers=2)
@@ -0,0 +1,117 @@
+"""Test gbasis.integrals.density_fitting."""
+from gbasis.contractions import GeneralizedContractionShell
+from gbasis.evals.eval import evaluate_basis
+from gbasis.integrals.density_fitting import (
+    three_center_coulomb_integral,
+    ThreeCenterCoulombIntegral,
+    two_center_coulomb_integral,
+    TwoCenterCoulombIntegral,
+)
+from gbasis.integrals.electron_repulsion import electron_repulsion_integral
+from gbasis.parsers import make_contractions, parse_nwchem
+import numpy as np
+import pytest
+from utils import find_datafile
+
+
+def product_shells(angmom, coord, exp_one, exp_two, coord_type):
+    """Return two shells at the same center and the shell of their product.
+
+    The product of a primitive with the given angular momentum and an s-type primitive at the same
+    center is a primitive with the given angular momentum and the sum of the exponents. The factor
+    between the normalized product and the normalized primitive is returned as well.
+
+    """
+    cont_one = GeneralizedContractionShell(
+        angmom, coord, np.ones(1), np.array([exp_one]), coord_type
+    )
+    cont_two = GeneralizedContractionShell(0, coord, np.ones(1), np.array([exp_two]), coord_type)
+    cont_prod = GeneralizedContractionShell(
+        angmom, coord, np.ones(1), np.array([exp_one + exp_two]), coord_type
+    )
+    point = coord.reshape(1, 3) + np.array([[0.1, -0.2, 0.3]])
+    factor = (
+        evaluate_basis([cont_one], point)[:, 0]
+        * evaluate_basis([cont_two], point)[0, 0]
+        / evaluate_basis([cont_prod], point)[:, 0]
+    )
+    return cont_one, cont_two, cont_prod, factor
+
+
+def test_construct_array_contraction():
+    """Test ThreeCenterCoulombIntegral and TwoCenterCoulombIntegral.construct_array_contraction."""
+    cont_one = GeneralizedContractionShell(
+        1, np.array([0.5, 1, 1.5]), np.ones((2, 2)), np.array([0.1, 0.5]), "spherical"
+    )
+    cont_two = GeneralizedContractionShell(
+        2, np.array([1, 2, 3]), np.ones(1), np.array([0.3]), "spherical"
+    )
+    assert ThreeCenterCoulombIntegral.construct_array_contraction(
+        cont_one, cont_two, cont_one
+    ).shape == (2, 3, 1, 6, 2, 3)
+    two_center = TwoCenterCoulombIntegral.construct_array_contraction(cont_two, cont_one)
+    assert two_center.shape == (1, 6, 2, 3)
+    with pytest.raises(TypeError):
+        ThreeCenterCoulombIntegral.construct_array_contraction(cont_one, cont_two, None)
+    with pytest.raises(TypeError):
+        TwoCenterCoulombIntegral.construct_array_contraction(None, cont_one)
+
+
+@pytest.mark.parametrize("coord_type", ["cartesian", "spherical"])
+def test_three_center_coulomb_integral(coord_type):
+    """Test density_fitting.three_center_coulomb_integral against the four-center integrals."""
+    basis_dict = parse_nwchem(find_datafile("data_631g.nwchem"))
+    basis = make_contractions(
+        basis_dict, ["H", "C"], np.array([[0, 0, 0], [0.8, 0.3, 1.2]]), coord_type
+    )
+    num_basis = sum(cont.num_sph if coord_type == "spherical" else cont.num_cart for cont in basis)
+    for angmom in range(3):
+        cont_one, cont_two, cont_prod, factor = product_shells(
+            angmom, np.array([0.3, -0.5, 0.7]), 0.7, 0.4, coord_type
+        )
+        eri = electron_repulsion_integral(list(basis) + [cont_one, cont_two], notation="chemist")
+        assert np.allclose(
+            three_center_coulomb_integral(basis, [cont_prod]) * factor,
+            eri[:num_basis, :num_basis, num_basis:-1, -1],
+        )
+
+    transform = np.random.rand(4, num_basis)
+    aux_basis = basis[:3]
+    assert np.allclose(
+        three_center_coulomb_integral(basis, aux_basis, transform=transform),
+        np.einsum(
+            "ia,jb,abp->ijp", transform, transform, three_center_coulomb_integral(basis, aux_basis)
+        ),
+    )
+
+
+def test_two_center_coulomb_integral():
+    """Test density_fitting.two_center_coulomb_integral against the four-center integrals."""
+    cont_p_one, cont_s_one, cont_p, factor_p = product_shells(
+        1, np.array([0.3, -0.5, 0.7]), 0.7, 0.4, "spherical"
+    )
+    cont_d_one, cont_s_two, cont_d, factor_d = product_shells(
+        2, np.array([-0.2, 0.4, 0.1]), 0.5, 0.9, "spherical"
+    )
+    eri = electron_repulsion_integral(
+        [cont_p_one, cont_s_one, cont_d_one, cont_s_two], notation="chemist"
+    )
+    two_center = two_center_coulomb_integral([cont_p, cont_d])
+    assert np.allclose(
+        two_center[:3, 3:] * factor_p[:, None] * factor_d[None, :], eri[:3, 3, 4:9, 9]
+    )
+    assert np.allclose(
+        two_center[:3, :3] * factor_p[:, None] * factor_p[None, :], eri[:3, 3, :3, 3]
+    )
+    assert np.allclose(two_center, two_center.T)
+    assert np.all(np.linalg.eigvalsh(two_center) > 0)
+
+    cont_d.coord_type = "cartesian"
+    mix = two_center_coulomb_integral([cont_p, cont_d])
+    assert mix.shape == (9, 9)
+    assert np.allclose(mix[:3, :3], two_center[:3, :3])
+    transform = np.random.rand(2, 6)
+    assert np.allclose(
+        two_center_coulomb_integral([cont_p, cont_p_one], transform=transform),
+        transform.dot(two_center_coulomb_integral([cont_p, cont_p_one])).dot(transform.T),
+    )
@@ -5,8 +5,15 @@ from gbasis.integrals._two_elec_int import (
     _compute_two_elec_integrals_angmom_zero,
 )
 from gbasis.integrals.electron_repulsion import (
+    coulomb_exchange_matrices,
     electron_repulsion_integral,
+    electron_repulsion_integral_packed,
+    electron_repulsion_integral_transformed,
     ElectronRepulsionIntegral,
+    packed_coulomb_exchange_matrices,
+    packed_eri_index,
+    pair_index,
+    unpack_electron_repulsion_integral,
 )
 from gbasis.parsers import make_contractions, parse_nwchem
 import numpy as np
@@ -215,3 +222,169 @@ def test_electron_repulsion_lincomb():
     )
     with pytest.raises(ValueError):
         electron_repulsion_integral(basis, transform, notation="bad")
+
+
+def test_electron_repulsion_integral_transformed():
+    """Test gbasis.integrals.electron_repulsion.electron_repulsion_integral_transformed."""
+    basis_dict = parse_nwchem(find_datafile("data_631g.nwchem"))
+    coords = np.array([[0, 0, 0], [0, 0, 1.5], [0, 1.2, 1.0]])
+    basis = make_contractions(basis_dict, ["O", "H", "H"], coords, "spherical")
+    basis[1].coord_type = "cartesian"
+    eri = electron_repulsion_integral(basis, notation="chemist")
+    num_basis = eri.shape[0]
+    occ = np.random.rand(3, num_basis)
+    vir = np.random.rand(5, num_basis)
+    ref = np.einsum("ia,jb,kc,ld,abcd->ijkl", occ, vir, occ, vir, eri)
+
+    for max_memory in [None, 1, 1e-3]:
+        assert np.allclose(
+            electron_repulsion_integral_transformed(basis, occ, vir, max_memory=max_memory), ref
+        )
+    assert np.allclose(
+        electron_repulsion_integral_transformed(basis, occ, vir, screen_tol=1e-12), ref
+    )
+    assert np.allclose(
+        electron_repulsion_integral_transformed(basis, occ, vir, np.identity(num_basis), vir),
+        np.einsum("ia,jb,ld,abcd->ijcl", occ, vir, vir, eri),
+    )
+    assert np.allclose(
+        electron_repulsion_integral(basis, transform=(occ, vir, occ, vir), notation="chemist"),
+        ref,
+    )
+    assert np.allclose(
+        electron_repulsion_integral(basis, transform=[occ, occ, vir, vir], max_memory=1e-3),
+        np.transpose(ref, (0, 2, 1, 3)),
+    )
+    with pytest.raises(TypeError):
+        electron_repulsion_integral(basis, transform=[occ, vir])
+    with pytest.raises(ValueError):
+        electron_repulsion_integral_transformed(basis, occ[:, 1:])
+    with pytest.raises(ValueError):
+        electron_repulsion_integral_transformed(basis, occ, max_memory=0)
+
+
+def test_compute_schwarz_bounds():
+    """Test gbasis.base_four_symm.BaseFourIndexSymmetric.compute_schwarz_bounds."""
+    basis_dict = parse_nwchem(find_datafile("data_sto6g.nwchem"))
+    coords = np.array([[0, 0, 0], [0, 0, 1.5]])
+    basis = make_contractions(basis_dict, ["C", "H"], coords, "spherical")
+    basis[0].coord_type = "cartesian"
+    coord_types = [shell.coord_type for shell in basis]
+    erep_obj = ElectronRepulsionIntegral(basis)
+    bounds = erep_obj.compute_schwarz_bounds(coord_types)
+    assert bounds.shape == (len(basis), len(basis))
+    assert np.allclose(bounds, bounds.T)
+
+    integrals = erep_obj.construct_array_mix(coord_types)
+    sizes = [shell.num_seg_cont * shell.num_cart for shell in basis]
+    sizes[1:] = [shell.num_seg_cont * shell.num_sph for shell in basis[1:]]
+    shell_index = np.repeat(np.arange(len(basis)), sizes)
+    shell_bounds = bounds[shell_index[:, None], shell_index[None, :]]
+    assert np.all(
+        np.abs(integrals)
+        <= shell_bounds[:, :, None, None] * shell_bounds[None, None, :, :] * (1 + 1e-10)
+    )
+
+
+def test_electron_repulsion_screen_tol():
+    """Test gbasis.integrals.electron_repulsion.electron_repulsion_integral with screening."""
+    basis_dict = parse_nwchem(find_datafile("data_sto6g.nwchem"))
+    coords = np.array([[0, 0, 0], [0, 0, 1.5], [0, 0, 20.0]])
+    for coord_type in ["cartesian", "spherical"]:
+        basis = make_contractions(basis_dict, ["C", "H", "H"], coords, coord_type)
+        ref = electron_repulsion_integral(basis)
+        screened = electron_repulsion_integral(basis, screen_tol=1e-10)
+        assert np.all(np.abs(screened - ref) < 1e-10)
+        assert np.sum(screened == 0) > np.sum(ref == 0)
+
+    basis[0].coord_type = "cartesian"
+    ref = electron_repulsion_integral(basis, notation="chemist")
+    screened = electron_repulsion_integral(basis, notation="chemist", screen_tol=1e-12)
+    assert np.allclose(screened, ref)
+    transform = np.random.rand(3, ref.shape[0])
+    assert np.allclose(
+        electron_repulsion_integral(basis, transform=transform, screen_tol=1e-12),
+        electron_repulsion_integral(basis, transform=transform),
+    )
+
+
+def test_coulomb_exchange_matrices():
+    """Test gbasis.integrals.electron_repulsion.coulomb_exchange_matrices."""
+    basis_dict = parse_nwchem(find_datafile("data_631g.nwchem"))
+    coords = np.array([[0, 0, 0], [0, 0, 1.5], [0, 1.2, 1.0]])
+    basis = make_contractions(basis_dict, ["O", "H", "H"], coords, "spherical")
+    basis[1].coord_type = "cartesian"
+    eri = electron_repulsion_integral(basis, notation="chemist")
+    num_basis = eri.shape[0]
+    density = np.random.rand(2, num_basis, num_basis)
+    density += np.swapaxes(density, 1, 2)
+
+    coulomb, exchange = coulomb_exchange_matrices(basis, density)
+    assert np.allclose(coulomb, np.einsum("abcd,ncd->nab", eri, density))
+    assert np.allclose(exchange, np.einsum("abcd,nbd->nac", eri, density))
+
+    coulomb, exchange = coulomb_exchange_matrices(basis, density[0], screen_tol=1e-12)
+    assert coulomb.shape == exchange.shape == (num_basis, num_basis)
+    assert np.allclose(coulomb, np.einsum("abcd,cd->ab", eri, density[0]))
+    assert np.allclose(exchange, np.einsum("abcd,bd->ac", eri, density[0]))
+
+    with pytest.raises(TypeError):
+        coulomb_exchange_matrices(basis, density.tolist())
+    with pytest.raises(ValueError):
+        coulomb_exchange_matrices(basis, density[:, 1:, 1:])
+
+
+def test_packed_eri_index():
+    """Test gbasis.integrals.electron_repulsion.pair_index and packed_eri_index."""
+    assert pair_index(0, 0) == 0
+    assert pair_index(1, 0) == pair_index(0, 1) == 1
+    assert pair_index(2, 1) == 4
+    indices = np.arange(5)
+    pairs = pair_index(indices[:, None], indices[None, :])
+    assert np.array_equal(np.sort(np.unique(pairs)), np.arange(15))
+    assert packed_eri_index(3, 1, 0, 2) == packed_eri_index(2, 0, 1, 3)
+    assert packed_eri_index(3, 1, 0, 2) == packed_eri_index(1, 3, 2, 0)
+    assert packed_eri_index(3, 1, 0, 2) != packed_eri_index(3, 0, 1, 2)
+    assert packed_eri_index(4, 4, 4, 4) == 15 * 16 // 2 - 1
+
+
+def test_electron_repulsion_integral_packed():
+    """Test gbasis.integrals.electron_repulsion.electron_repulsion_integral_packed."""
+    basis_dict = parse_nwchem(find_datafile("data_631g.nwchem"))
+    coords = np.array([[0, 0, 0], [0, 0, 1.5], [0, 1.2, 1.0]])
+    basis = make_contractions(basis_dict, ["O", "H", "H"], coords, "spherical")
+    basis[1].coord_type = "cartesian"
+    eri = electron_repulsion_integral(basis, notation="chemist")
+    num_basis = eri.shape[0]
+    num_pairs = num_basis * (num_basis + 1) // 2
+
+    packed_eri = electron_repulsion_integral_packed(basis)
+    assert packed_eri.shape == (num_pairs * (num_pairs + 1) // 2,)
+    assert np.isclose(packed_eri[packed_eri_index(3, 1, 5, 2)], eri[3, 1, 5, 2])
+    assert np.allclose(unpack_electron_repulsion_integral(packed_eri, notation="chemist"), eri)
+    assert np.allclose(
+        unpack_electron_repulsion_integral(packed_eri), electron_repulsion_integral(basis)
+    )
+    assert np.allclose(electron_repulsion_integral_packed(basis, screen_tol=1e-12), packed_eri)
+
+    density = np.random.rand(2, num_basis, num_basis)
+    for chunk_size in [None, 1, 10]:
+        coulomb, exchange = packed_coulomb_exchange_matrices(
+            packed_eri, density, chunk_size=chunk_size
+        )
+        assert np.allclose(coulomb, np.einsum("abcd,ncd->nab", eri, density))
+        assert np.allclose(exchange, np.einsum("abcd,nbd->nac", eri, density))
+    coulomb, exchange = packed_coulomb_exchange_matrices(packed_eri, density[0])
+    assert np.allclose(coulomb, np.einsum("abcd,cd->ab", eri, density[0]))
+    assert np.allclose(exchange, np.einsum("abcd,bd->ac", eri, density[0]))
+
+    with pytest.raises(TypeError):
+        unpack_electron_repulsion_integral(packed_eri.reshape(1, -1))
+    with pytest.raises(ValueError):
+        unpack_electron_repulsion_integral(packed_eri[1:])
+    with pytest.raises(ValueError):
+        unpack_electron_repulsion_integral(packed_eri, notation="bad")
+    with pytest.raises(TypeError):
+        packed_coulomb_exchange_matrices(packed_eri, density.tolist())
+    with pytest.raises(ValueError):
+        packed_coulomb_exchange_matrices(packed_eri, density[:, 1:, 1:])
@@ -1,5 +1,6 @@
 """Tests for gbasis.evals.electrostatic_potential."""
 from gbasis.evals.electrostatic_potential import electrostatic_potential
+from gbasis.integrals.point_charge import point_charge_integral
 from gbasis.parsers import make_contractions, parse_nwchem
 import numpy as np
 import pytest
@@ -231,3 +232,98 @@ def test_electrostatic_potential_mix():
         ),
         horton_nucattract,
     )
+
+
+def test_electrostatic_potential_chunk_size_n_workers():
+    """Test gbasis.evals.electrostatic_potential.electrostatic_potential in blocks of points."""
+    basis_dict = parse_nwchem(find_datafile("data_anorcc.nwchem"))
+    coords = np.array([[0, 0, 0], [0.8 * 1.0 / 0.5291772083, 0, 0]])
+    basis = make_contractions(basis_dict, ["H", "He"], coords, "spherical")
+    basis = [HortonContractions(i.angmom, i.coord, i.coeffs, i.exps, i.coord_type) for i in basis]
+
+    grid_1d = np.linspace(-2, 2, num=5)
+    grid_x, grid_y, grid_z = np.meshgrid(grid_1d, grid_1d, grid_1d)
+    grid_3d = np.vstack([grid_x.ravel(), grid_y.ravel(), grid_z.ravel()]).T
+
+    horton_nucattract = np.load(find_datafile("data_horton_hhe_sph_esp.npy"))
+    for chunk_size, n_workers in [(10, None), (None, 3), (7, 4)]:
+        assert np.allclose(
+            electrostatic_potential(
+                basis,
+                np.identity(88),
+                grid_3d,
+                coords,
+                np.array([1, 2]),
+                chunk_size=chunk_size,
+                n_workers=n_workers,
+            ),
+            horton_nucattract,
+        )
+
+
+def test_electrostatic_potential_screen_tol():
+    """Test gbasis.evals.electrostatic_potential.electrostatic_potential against the integrals."""
+    basis_dict = parse_nwchem(find_datafile("data_631g.nwchem"))
+    coords = np.array([[0, 0, 0], [0, 0, 1.5], [0, 1.2, 1.0]])
+    basis = make_contractions(basis_dict, ["O", "H", "H"], coords, "spherical")
+    basis[1].coord_type = "cartesian"
+    points = np.random.rand(20, 3) * 4 - 2
+    charges = np.array([8, 1, 1])
+
+    num_basis = sum(
+        cont.num_seg_cont * (cont.num_cart if cont.coord_type == "cartesian" else cont.num_sph)
+        for cont in basis
+    )
+    density = np.random.rand(num_basis, num_basis)
+    density += density.T
+    # block of the density matrix between the two shells of the last atom
+    density[-2, -1] = density[-1, -2] = 0
+    integrals = point_charge_integral(basis, points, -np.ones(points.shape[0]))
+    dist = np.linalg.norm(points[:, None] - coords[None], axis=2)
+    ref = np.sum(charges / dist, axis=1) - np.einsum("ab,abn->n", density, integrals)
+
+    assert np.allclose(electrostatic_potential(basis, density, points, coords, charges), ref)
+    assert np.allclose(
+        electrostatic_potential(basis, density, points, coords, charges, screen_tol=1e-12), ref
+    )
+    transform = np.linalg.qr(np.random.rand(num_basis, num_basis))[0]
+    assert np.allclose(
+        electrostatic_potential(
+            basis, transform.dot(density).dot(transform.T), points, coords, charges, transform
+        ),
+        ref,
+    )
+
+
+@pytest.mark.parametrize("basis_file", ["data_631g.nwchem", "data_ccpvdz.nwchem"])
+def test_electrostatic_potential_far_field_tol(basis_file):
+    """Test gbasis.evals.electrostatic_potential.electrostatic_potential with multipoles."""
+    basis_dict = parse_nwchem(find_datafile(basis_file))
+    coords = np.array([[0, 0, 0], [0, 0, 1.8], [0, 1.7, -0.5]])
+    basis = make_contractions(basis_dict, ["O", "H", "H"], coords, "spherical")
+    basis[1].coord_type = "cartesian"
+    charges = np.array([8, 1, 1])
+    grid_1d = np.linspace(-10, 10, num=7) + 0.1
+    grid_x, grid_y, grid_z = np.meshgrid(grid_1d, grid_1d, grid_1d)
+    points = np.vstack([grid_x.ravel(), grid_y.ravel(), grid_z.ravel()]).T
+    # points between 1.5 and 12 bohr from the oxygen in random directions
+    directions = np.random.randn(500, 3)
+    directions /= np.linalg.norm(directions, axis=1)[:, None]
+    points = np.vstack([points, directions * np.random.uniform(1.5, 12, 500)[:, None]])
+
+    num_basis = sum(
+        cont.num_seg_cont * (cont.num_cart if cont.coord_type == "cartesian" else cont.num_sph)
+        for cont in basis
+    )
+    orbitals = np.random.rand(num_basis, 5)
+    density = orbitals.dot(orbitals.T)
+    ref = electrostatic_potential(basis, density, points, coords, charges)
+    ref_elec = ref - electrostatic_potential(basis, 0 * density, points, coords, charges)
+    for far_field_tol in [1e-3, 1e-6, 1e-10]:
+        test = electrostatic_potential(
+            basis, density, points, coords, charges, far_field_tol=far_field_tol
+        )
+        assert np.all(np.abs(test - ref) < far_field_tol * np.abs(ref_elec))
+
+    with pytest.raises(ValueError):
+        electrostatic_potential(basis, density, points, coords, charges, far_field_tol=0)
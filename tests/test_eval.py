@@ -1,7 +1,7 @@
 """Test gbasis.evals.eval."""
 from gbasis.contractions import GeneralizedContractionShell
 from gbasis.evals._deriv import _eval_deriv_contractions
-from gbasis.evals.eval import Eval, evaluate_basis
+from gbasis.evals.eval import compute_shell_extent, Eval, evaluate_basis
 from gbasis.parsers import make_contractions, parse_nwchem
 from gbasis.utils import factorial2
 import numpy as np
@@ -249,3 +249,87 @@ def test_evaluate_basis_pyscf_cart_norm():
     assert np.allclose(
         evaluate_basis(basis, grid_3d, coord_type="cartesian")[83:103], pyscf_eval_cart.T[83:103]
     )
+
+
+def test_evaluate_basis_chunk_size():
+    """Test gbasis.evals.eval.evaluate_basis with chunk_size."""
+    basis_dict = parse_nwchem(find_datafile("data_anorcc.nwchem"))
+    basis = make_contractions(basis_dict, ["C"], np.array([[0, 0, 0]]), "spherical")
+    points = np.random.rand(25, 3)
+    transform = np.random.rand(10, len(evaluate_basis(basis, points)))
+    for chunk_size in [1, 4, 25, 100]:
+        assert np.allclose(
+            evaluate_basis(basis, points, chunk_size=chunk_size), evaluate_basis(basis, points)
+        )
+        assert np.allclose(
+            evaluate_basis(basis, points, transform=transform, chunk_size=chunk_size),
+            evaluate_basis(basis, points, transform=transform),
+        )
+    with pytest.raises(TypeError):
+        evaluate_basis(basis, points, chunk_size=2.0)
+    with pytest.raises(ValueError):
+        evaluate_basis(basis, points, chunk_size=0)
+
+
+def test_compute_shell_extent():
+    """Test gbasis.evals.eval.compute_shell_extent."""
+    basis_dict = parse_nwchem(find_datafile("data_anorcc.nwchem"))
+    basis = make_contractions(basis_dict, ["C"], np.array([[0, 0, 0]]), "cartesian")
+    directions = np.random.rand(50, 3) - 0.5
+    directions /= np.linalg.norm(directions, axis=1)[:, None]
+    for shell in basis:
+        for tol in [1e-4, 1e-8, 1e-12]:
+            extent = compute_shell_extent(shell, tol)
+            assert extent > 0
+            for scale in [1.0, 1.5, 3.0]:
+                points = directions * extent * scale
+                values = Eval.construct_array_contraction(shell, points)
+                values *= shell.norm_cont[:, :, None]
+                assert np.all(np.abs(values) < tol)
+    assert compute_shell_extent(basis[0], 1e-8) < compute_shell_extent(basis[0], 1e-12)
+    assert compute_shell_extent(basis[0], 1e6) == 0
+
+    with pytest.raises(TypeError):
+        compute_shell_extent(basis_dict["C"], 1e-8)
+    with pytest.raises(ValueError):
+        compute_shell_extent(basis[0], 0.0)
+
+
+def test_evaluate_basis_tol_screen():
+    """Test gbasis.evals.eval.evaluate_basis with spatial screening of the shells."""
+    basis_dict = parse_nwchem(find_datafile("data_631g.nwchem"))
+    coords = np.array([[0, 0, 0], [0, 0, 10.0], [0, 0, 20.0]])
+    points = np.random.rand(100, 3) * np.array([4, 4, 24]) - 2
+    points = points[np.argsort(points[:, 2])]
+    for coord_type in ["cartesian", "spherical"]:
+        basis = make_contractions(basis_dict, ["C", "O", "H"], coords, coord_type)
+        ref = evaluate_basis(basis, points)
+        for tol in [1e-6, 1e-12]:
+            for chunk_size in [None, 10]:
+                screened = evaluate_basis(basis, points, chunk_size=chunk_size, tol_screen=tol)
+                assert np.all(np.abs(screened - ref) < tol)
+                assert np.any(screened[ref != 0] == 0)
+        transform = np.random.rand(5, ref.shape[0])
+        assert np.allclose(
+            evaluate_basis(basis, points, transform=transform, chunk_size=10, tol_screen=1e-12),
+            evaluate_basis(basis, points, transform=transform),
+        )
+
+
+def test_evaluate_basis_n_workers():
+    """Test gbasis.evals.eval.evaluate_basis with n_workers."""
+    basis_dict = parse_nwchem(find_datafile("data_anorcc.nwchem"))
+    basis = make_contractions(basis_dict, ["C"], np.array([[0, 0, 0]]), "spherical")
+    points = np.random.rand(25, 3)
+    ref = evaluate_basis(basis, points)
+    for chunk_size, n_workers in [(None, 1), (None, 4), (3, 4), (10, 2), (None, 30)]:
+        assert np.allclose(
+            evaluate_basis(basis, points, chunk_size=chunk_size, n_workers=n_workers), ref
+        )
+    with pytest.raises(TypeError):
+        evaluate_basis(basis, points, n_workers=2.0)
+    with pytest.raises(ValueError):
+        evaluate_basis(basis, points, n_workers=0)
+    # errors in the threads are raised
+    with pytest.raises(ValueError):
+        evaluate_basis(basis, points, transform=np.identity(3), n_workers=2)
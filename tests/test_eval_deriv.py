@@ -3,7 +3,13 @@ import itertools as it
 
 from gbasis.contractions import GeneralizedContractionShell
 from gbasis.evals._deriv import _eval_deriv_contractions
-from gbasis.evals.eval_deriv import EvalDeriv, evaluate_deriv_basis
+from gbasis.evals.eval_deriv import (
+    DerivBasisCache,
+    EvalDeriv,
+    EvalDerivUpToSecond,
+    evaluate_deriv_basis,
+    evaluate_deriv_basis_up_to_second,
+)
 from gbasis.parsers import make_contractions, parse_nwchem
 from gbasis.utils import factorial2
 import numpy as np
@@ -219,3 +225,94 @@ def test_evaluate_deriv_basis_lincomb():
             spherical_basis, np.array([[1, 1, 1]]), np.array([2, 1, 0]), sph_transform
         ),
     )
+
+
+def test_deriv_basis_cache():
+    """Test gbasis.evals.eval_deriv.DerivBasisCache."""
+    basis_dict = parse_nwchem(find_datafile("data_sto6g.nwchem"))
+    basis = make_contractions(basis_dict, ["Kr"], np.array([[0, 0, 0]]), "spherical")
+    points = np.random.rand(10, 3)
+    transform = np.random.rand(14, 18)
+
+    with pytest.raises(TypeError):
+        DerivBasisCache(basis, points, maxsize=2.0)
+    with pytest.raises(ValueError):
+        DerivBasisCache(basis, points, maxsize=0)
+
+    cache = DerivBasisCache(basis, points, transform=transform, deriv_type="direct", maxsize=2)
+    deriv = cache.evaluate(np.array([1, 0, 0]))
+    assert np.allclose(deriv, evaluate_deriv_basis(basis, points, np.array([1, 0, 0]), transform))
+    assert not deriv.flags.writeable
+    # same orders are not evaluated again
+    assert cache.evaluate([1, 0, 0]) is deriv
+    assert len(cache) == 1
+    # orders greater than two fall back to the general implementation
+    assert np.allclose(
+        cache.evaluate(np.array([3, 0, 1])),
+        evaluate_deriv_basis(basis, points, np.array([3, 0, 1]), transform),
+    )
+    # least recently used evaluation is discarded
+    cache.evaluate(np.array([1, 0, 0]))
+    cache.evaluate(np.array([0, 0, 0]))
+    assert len(cache) == 2
+    assert cache.evaluate(np.array([1, 0, 0])) is deriv
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_evaluate_deriv_basis_up_to_second():
+    """Test gbasis.evals.eval_deriv.evaluate_deriv_basis_up_to_second."""
+    basis_dict = parse_nwchem(find_datafile("data_anorcc.nwchem"))
+    coords = np.array([[0, 0, 0], [1.0, 0.5, 0.2]])
+    points = np.random.rand(10, 3)
+    all_orders = [
+        [0, 0, 0],
+        [1, 0, 0],
+        [0, 1, 0],
+        [0, 0, 1],
+        [2, 0, 0],
+        [1, 1, 0],
+        [1, 0, 1],
+        [0, 2, 0],
+        [0, 1, 1],
+        [0, 0, 2],
+    ]
+
+    with pytest.raises(TypeError):
+        EvalDerivUpToSecond.construct_array_contraction(None, points)
+    with pytest.raises(TypeError):
+        basis = make_contractions(basis_dict, ["C"], coords[:1], "cartesian")
+        EvalDerivUpToSecond.construct_array_contraction(basis[0], points.T)
+
+    for coord_type in ["cartesian", "spherical", "mix"]:
+        if coord_type == "mix":
+            basis = make_contractions(basis_dict, ["C", "H"], coords, "spherical")
+            for shell in basis[::2]:
+                shell.coord_type = "cartesian"
+        else:
+            basis = make_contractions(basis_dict, ["C", "H"], coords, coord_type)
+        derivs = evaluate_deriv_basis_up_to_second(basis, points)
+        assert derivs.shape[0] == 10
+        for deriv, orders in zip(derivs, all_orders):
+            assert np.allclose(deriv, evaluate_deriv_basis(basis, points, np.array(orders)))
+
+    transform = np.random.rand(20, derivs.shape[1])
+    derivs = evaluate_deriv_basis_up_to_second(basis, points, transform=transform)
+    for deriv, orders in zip(derivs, all_orders):
+        assert np.allclose(deriv, evaluate_deriv_basis(basis, points, np.array(orders), transform))
+
+
+def test_evaluate_deriv_basis_chunk_size():
+    """Test gbasis.evals.eval_deriv.evaluate_deriv_basis with chunk_size."""
+    basis_dict = parse_nwchem(find_datafile("data_anorcc.nwchem"))
+    basis = make_contractions(basis_dict, ["C"], np.array([[0, 0, 0]]), "spherical")
+    points = np.random.rand(25, 3)
+    for orders in [np.array([0, 0, 0]), np.array([1, 0, 1]), np.array([0, 3, 0])]:
+        assert np.allclose(
+            evaluate_deriv_basis(basis, points, orders, chunk_size=6),
+            evaluate_deriv_basis(basis, points, orders),
+        )
+    assert np.allclose(
+        evaluate_deriv_basis_up_to_second(basis, points, chunk_size=6),
+        evaluate_deriv_basis_up_to_second(basis, points),
+    )
@@ -142,6 +142,11 @@ def test_integral(basis, atsyms, atcoords, coord_type, integral):
             npt.assert_array_equal(py_int.shape, (lc_basis.nbfn, lc_basis.nbfn, i))
             lc_int = lc_basis.point_charge_integral(charge_coords[:i], charges[:i])
             npt.assert_array_equal(lc_int.shape, (lc_basis.nbfn, lc_basis.nbfn, i))
+            npt.assert_allclose(lc_int, py_int, atol=atol, rtol=rtol)
+            lc_int_sum = lc_basis.point_charge_integral(
+                charge_coords[:i], charges[:i], sum_charges=True
+            )
+            npt.assert_allclose(lc_int_sum, np.sum(lc_int, axis=2), atol=atol, rtol=rtol)
 
     elif integral == "moment":
         origin = np.zeros(3)
@@ -338,3 +343,346 @@ def test_integral_iodata(fname, elements, coord_type, integral, transform):
         raise ValueError("Invalid integral name '{integral}' passed")
 
     npt.assert_allclose(lc_int, py_int, atol=atol, rtol=rtol)
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="This test does not work on Windows")
+@pytest.mark.skipif(
+    len(glob(join(dirname(gbasis.__file__), "integrals", "lib", "libcint.so*"))) == 0,
+    reason="The libcint shared library object was not found",
+)
+@pytest.mark.parametrize("coord_type", TEST_COORD_TYPES)
+def test_n_threads(coord_type):
+    from gbasis.integrals.libcint import CBasis
+
+    r"""
+    Test gbasis.integrals.libcint.CBasis integrals split over multiple threads.
+
+    """
+    atsyms = ["H", "He", "Li"]
+    atcoords = np.eye(3, dtype=float)
+    basis_dict = parse_nwchem(find_datafile("data_631g.nwchem"))
+    py_basis = make_contractions(basis_dict, atsyms, atcoords, coord_types=coord_type)
+
+    lc_basis = CBasis(py_basis, atsyms, atcoords, coord_type=coord_type)
+    lc_basis_threads = CBasis(py_basis, atsyms, atcoords, coord_type=coord_type, n_threads=3)
+
+    npt.assert_allclose(lc_basis_threads.overlap_integral(), lc_basis.overlap_integral())
+    npt.assert_allclose(
+        lc_basis_threads.electron_repulsion_integral(), lc_basis.electron_repulsion_integral()
+    )
+    charge_coords = np.asarray([[2.0, 2.0, 2.0], [-3.0, -3.0, -3.0]])
+    charges = np.asarray([1.0, -0.5])
+    npt.assert_allclose(
+        lc_basis_threads.point_charge_integral(charge_coords, charges),
+        lc_basis.point_charge_integral(charge_coords, charges),
+    )
+
+    with pytest.raises(TypeError):
+        CBasis(py_basis, atsyms, atcoords, coord_type=coord_type, n_threads=2.0)
+    with pytest.raises(ValueError):
+        CBasis(py_basis, atsyms, atcoords, coord_type=coord_type, n_threads=0)
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="This test does not work on Windows")
+@pytest.mark.skipif(
+    len(glob(join(dirname(gbasis.__file__), "integrals", "lib", "libcint.so*"))) == 0,
+    reason="The libcint shared library object was not found",
+)
+@pytest.mark.parametrize("coord_type", TEST_COORD_TYPES)
+def test_cached_optimizers_and_out(coord_type):
+    from gbasis.integrals.libcint import CBasis
+
+    r"""
+    Test gbasis.integrals.libcint.CBasis cached optimizers and preallocated output arrays.
+
+    """
+    atsyms = ["H", "He", "Li"]
+    atcoords = np.eye(3, dtype=float)
+    basis_dict = parse_nwchem(find_datafile("data_631g.nwchem"))
+    py_basis = make_contractions(basis_dict, atsyms, atcoords, coord_types=coord_type)
+
+    with CBasis(py_basis, atsyms, atcoords, coord_type=coord_type) as lc_basis:
+        ovlp = lc_basis.overlap_integral()
+        assert "int1e_ovlp_optimizer" in lc_basis._optimizers
+        npt.assert_allclose(lc_basis.overlap_integral(), ovlp)
+
+        out = np.empty((lc_basis.nbfn, lc_basis.nbfn))
+        assert lc_basis.overlap_integral(out=out) is out
+        npt.assert_allclose(out, ovlp)
+
+        eri = lc_basis.electron_repulsion_integral(notation="chemist")
+        out = np.empty((lc_basis.nbfn,) * 4)
+        lc_basis.electron_repulsion_integral(notation="chemist", out=out)
+        npt.assert_allclose(out, eri)
+        transform = np.random.rand(2, lc_basis.nbfn)
+        out = np.empty((2, 2, 2, 2))
+        lc_basis.electron_repulsion_integral(notation="chemist", transform=transform, out=out)
+        npt.assert_allclose(out, np.einsum("ai,bj,ck,dl,ijkl->abcd", *(4 * [transform]), eri))
+
+        orders = np.asarray([[0, 0, 0], [1, 0, 0], [0, 2, 1]])
+        out = np.empty((lc_basis.nbfn, lc_basis.nbfn, 3))
+        lc_basis.moment_integral(orders, origin=np.zeros(3), out=out)
+        npt.assert_allclose(out, lc_basis.moment_integral(orders, origin=np.zeros(3)))
+
+        with pytest.raises(ValueError):
+            lc_basis.overlap_integral(out=np.empty((lc_basis.nbfn, lc_basis.nbfn + 1)))
+
+    assert lc_basis._optimizers == {}
+    assert lc_basis._buffers == {}
+    npt.assert_allclose(lc_basis.overlap_integral(), ovlp)
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="This test does not work on Windows")
+@pytest.mark.skipif(
+    len(glob(join(dirname(gbasis.__file__), "integrals", "lib", "libcint.so*"))) == 0,
+    reason="The libcint shared library object was not found",
+)
+@pytest.mark.parametrize("coord_type", TEST_COORD_TYPES)
+def test_update_coordinates(coord_type):
+    from gbasis.integrals.libcint import CBasis
+
+    r"""
+    Test gbasis.integrals.libcint.CBasis.update_coordinates.
+
+    """
+    atsyms = ["H", "He", "Li"]
+    atcoords = np.eye(3, dtype=float)
+    new_atcoords = atcoords + np.asarray([[0.1, 0.0, -0.2], [0.0, 0.3, 0.0], [-0.1, 0.2, 0.4]])
+    basis_dict = parse_nwchem(find_datafile("data_631g.nwchem"))
+    py_basis = make_contractions(basis_dict, atsyms, atcoords, coord_types=coord_type)
+    new_py_basis = make_contractions(basis_dict, atsyms, new_atcoords, coord_types=coord_type)
+
+    lc_basis = CBasis(py_basis, atsyms, atcoords, coord_type=coord_type)
+    lc_basis.overlap_integral()
+    lc_basis.update_coordinates(new_atcoords)
+    assert lc_basis._optimizers == {}
+    npt.assert_allclose(lc_basis.atcoords, new_atcoords)
+
+    new_lc_basis = CBasis(new_py_basis, atsyms, new_atcoords, coord_type=coord_type)
+    npt.assert_allclose(lc_basis.env, new_lc_basis.env)
+    npt.assert_allclose(lc_basis.overlap_integral(), new_lc_basis.overlap_integral())
+    npt.assert_allclose(
+        lc_basis.nuclear_attraction_integral(), new_lc_basis.nuclear_attraction_integral()
+    )
+
+    with pytest.raises(ValueError):
+        lc_basis.update_coordinates(new_atcoords[:2])
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="This test does not work on Windows")
+@pytest.mark.skipif(
+    len(glob(join(dirname(gbasis.__file__), "integrals", "lib", "libcint.so*"))) == 0,
+    reason="The libcint shared library object was not found",
+)
+@pytest.mark.parametrize("coord_type", TEST_COORD_TYPES)
+def test_lazy_integrals(coord_type):
+    from gbasis.integrals.libcint import CBasis, INTEGRALS
+
+    r"""
+    Test that gbasis.integrals.libcint.CBasis makes its integral methods on first use.
+
+    """
+    atsyms = ["H", "He"]
+    atcoords = np.asarray([[0.0, 0.0, 0.0], [0.8, 0.0, 0.0]])
+    basis_dict = parse_nwchem(find_datafile("data_631g.nwchem"))
+    py_basis = make_contractions(basis_dict, atsyms, atcoords, coord_types=coord_type)
+
+    lc_basis = CBasis(py_basis, atsyms, atcoords, coord_type=coord_type)
+    assert not any(attr in vars(lc_basis) for attr in INTEGRALS)
+    assert "_ovlp_minhalf" not in vars(lc_basis)
+
+    npt.assert_allclose(
+        lc_basis.kinetic_energy_integral(),
+        kinetic_energy_integral(py_basis),
+        atol=1e-4,
+        rtol=1e-4,
+    )
+    assert "_kin" in vars(lc_basis)
+    assert "_eri" not in vars(lc_basis)
+
+    lc_basis.moment_integral(np.asarray([[1, 0, 0]]), origin=np.zeros(3))
+    assert list(lc_basis._moments) == [(1, 0, 0)]
+    with pytest.raises(ValueError):
+        lc_basis.moment_integral(np.asarray([[5, 0, 0]]), origin=np.zeros(3))
+    with pytest.raises(AttributeError):
+        lc_basis._not_an_integral
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="This test does not work on Windows")
+@pytest.mark.skipif(
+    len(glob(join(dirname(gbasis.__file__), "integrals", "lib", "libcint.so*"))) == 0,
+    reason="The libcint shared library object was not found",
+)
+@pytest.mark.parametrize("coord_type", TEST_COORD_TYPES)
+def test_nuclear_derivatives(coord_type):
+    from gbasis.integrals.libcint import CBasis
+
+    r"""
+    Test gbasis.integrals.libcint.CBasis nuclear derivative integrals and gradients against
+    finite differences.
+
+    """
+    atsyms = ["H", "Li"]
+    atcoords = np.asarray([[0.0, 0.1, -0.2], [0.3, 0.2, 1.5]])
+    basis_dict = parse_nwchem(find_datafile("data_631g.nwchem"))
+    py_basis = make_contractions(basis_dict, atsyms, atcoords, coord_types=coord_type)
+    lc_basis = CBasis(py_basis, atsyms, atcoords, coord_type=coord_type)
+
+    dm = np.random.rand(lc_basis.nbfn, lc_basis.nbfn)
+    dm = dm + dm.T
+    deriv_integrals = {
+        "overlap": lc_basis.overlap_deriv_integral(),
+        "kinetic_energy": lc_basis.kinetic_energy_deriv_integral(),
+        "nuclear_attraction": lc_basis.nuclear_attraction_deriv_integral(),
+    }
+    gradients = {name: getattr(lc_basis, name + "_gradient")(dm) for name in deriv_integrals}
+    gradients["electron_repulsion"] = lc_basis.electron_repulsion_gradient(dm)
+    deriv_eri = lc_basis.electron_repulsion_deriv_integral(notation="chemist")
+    assert deriv_eri.shape == (lc_basis.nbfn,) * 4 + (2, 3)
+
+    def energies(lc_basis):
+        integrals = {
+            name: getattr(lc_basis, name + "_integral")(notation="chemist")
+            for name in ["overlap", "kinetic_energy", "nuclear_attraction", "electron_repulsion"]
+        }
+        energies = {name: np.sum(dm * integrals[name]) for name in deriv_integrals}
+        energies["electron_repulsion"] = 0.5 * (
+            np.einsum("ij,kl,ijkl", dm, dm, integrals["electron_repulsion"])
+            - 0.5 * np.einsum("ik,jl,ijkl", dm, dm, integrals["electron_repulsion"])
+        )
+        return integrals, energies
+
+    step = 1e-4
+    for iatm in range(2):
+        for ix in range(3):
+            displacement = np.zeros((2, 3))
+            displacement[iatm, ix] = step
+            lc_basis.update_coordinates(atcoords + displacement)
+            ints_plus, energies_plus = energies(lc_basis)
+            lc_basis.update_coordinates(atcoords - displacement)
+            ints_minus, energies_minus = energies(lc_basis)
+            for name, deriv_integral in deriv_integrals.items():
+                npt.assert_allclose(
+                    deriv_integral[:, :, iatm, ix],
+                    (ints_plus[name] - ints_minus[name]) / (2 * step),
+                    atol=1e-6,
+                )
+            npt.assert_allclose(
+                deriv_eri[..., iatm, ix],
+                (ints_plus["electron_repulsion"] - ints_minus["electron_repulsion"]) / (2 * step),
+                atol=1e-6,
+            )
+            for name, gradient in gradients.items():
+                npt.assert_allclose(
+                    gradient[iatm, ix],
+                    (energies_plus[name] - energies_minus[name]) / (2 * step),
+                    atol=1e-5,
+                )
+
+    with pytest.raises(ValueError):
+        lc_basis.overlap_gradient(dm[:-1])
+    with pytest.raises(ValueError):
+        lc_basis.electron_repulsion_gradient(np.triu(dm))
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="This test does not work on Windows")
+@pytest.mark.skipif(
+    len(glob(join(dirname(gbasis.__file__), "integrals", "lib", "libcint.so*"))) == 0,
+    reason="The libcint shared library object was not found",
+)
+@pytest.mark.parametrize("coord_type", TEST_COORD_TYPES)
+def test_schwarz_screening(coord_type):
+    from gbasis.integrals.libcint import CBasis
+
+    r"""
+    Test gbasis.integrals.libcint.CBasis electron repulsion integrals with Schwarz screening.
+
+    """
+    atsyms = ["H", "He", "Li"]
+    atcoords = np.asarray([[0.0, 0.0, 0.0], [0.0, 0.0, 20.0], [0.0, 25.0, 0.0]])
+    basis_dict = parse_nwchem(find_datafile("data_631g.nwchem"))
+    py_basis = make_contractions(basis_dict, atsyms, atcoords, coord_types=coord_type)
+    lc_basis = CBasis(py_basis, atsyms, atcoords, coord_type=coord_type)
+
+    eri = lc_basis.electron_repulsion_integral(notation="chemist")
+    bounds = lc_basis.schwarz_bounds()
+    assert bounds.shape == (lc_basis.nbas * (lc_basis.nbas + 1) // 2,)
+    diag = np.einsum("abab->ab", eri)
+    assert np.all(np.sqrt(np.abs(diag)) <= np.max(bounds) * (1 + 1e-12))
+
+    npt.assert_allclose(
+        lc_basis.electron_repulsion_integral(notation="chemist", screen_tol=0.0), eri
+    )
+    screened = lc_basis.electron_repulsion_integral(notation="chemist", screen_tol=1e-10)
+    npt.assert_allclose(screened, eri, atol=1e-10)
+    assert np.count_nonzero(screened) < np.count_nonzero(eri)
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="This test does not work on Windows")
+@pytest.mark.skipif(
+    len(glob(join(dirname(gbasis.__file__), "integrals", "lib", "libcint.so*"))) == 0,
+    reason="The libcint shared library object was not found",
+)
+@pytest.mark.parametrize("coord_type", TEST_COORD_TYPES)
+def test_jk(coord_type):
+    from gbasis.integrals.libcint import CBasis
+
+    r"""
+    Test gbasis.integrals.libcint.CBasis.jk against the electron repulsion integrals.
+
+    """
+    atsyms = ["H", "He", "Li"]
+    atcoords = np.eye(3, dtype=float)
+    basis_dict = parse_nwchem(find_datafile("data_631g.nwchem"))
+    py_basis = make_contractions(basis_dict, atsyms, atcoords, coord_types=coord_type)
+    lc_basis = CBasis(py_basis, atsyms, atcoords, coord_type=coord_type, n_threads=2)
+
+    eri = lc_basis.electron_repulsion_integral(notation="chemist")
+    dm = np.random.rand(2, lc_basis.nbfn, lc_basis.nbfn)
+    coulomb, exchange = lc_basis.jk(dm)
+    npt.assert_allclose(coulomb, np.einsum("abcd,ncd->nab", eri, dm))
+    npt.assert_allclose(exchange, np.einsum("abcd,nbd->nac", eri, dm))
+    coulomb, exchange = lc_basis.jk(dm[0], screen_tol=1e-12)
+    npt.assert_allclose(coulomb, np.einsum("abcd,cd->ab", eri, dm[0]), atol=1e-10)
+    npt.assert_allclose(exchange, np.einsum("abcd,bd->ac", eri, dm[0]), atol=1e-10)
+
+    with pytest.raises(TypeError):
+        lc_basis.jk(dm.tolist())
+    with pytest.raises(ValueError):
+        lc_basis.jk(dm[:, :-1])
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="This test does not work on Windows")
+@pytest.mark.skipif(
+    len(glob(join(dirname(gbasis.__file__), "integrals", "lib", "libcint.so*"))) == 0,
+    reason="The libcint shared library object was not found",
+)
+@pytest.mark.parametrize("coord_type", TEST_COORD_TYPES)
+def test_point_charge_integral(coord_type):
+    from gbasis.integrals.libcint import CBasis
+
+    r"""
+    Test gbasis.integrals.libcint.CBasis.point_charge_integral against the Python integrals.
+
+    Every point charge must be evaluated for every shell pair, including when the shell pairs are
+    split over several threads.
+
+    """
+    atsyms = ["H", "C", "O"]
+    atcoords = np.asarray([[0.0, 0.0, 0.0], [1.1, 0.2, -0.3], [-0.4, 1.5, 0.8]])
+    basis_dict = parse_nwchem(find_datafile("data_ccpvdz.nwchem"))
+    py_basis = make_contractions(basis_dict, atsyms, atcoords, coord_types=coord_type)
+    lc_basis = CBasis(py_basis, atsyms, atcoords, coord_type=coord_type, n_threads=2)
+
+    charge_coords = np.random.rand(7, 3) * 4 - 2
+    charges = np.random.rand(7) - 0.5
+    py_int = point_charge_integral(py_basis, charge_coords, charges)
+    lc_int = lc_basis.point_charge_integral(charge_coords, charges)
+    assert np.count_nonzero(lc_int) > 0
+    npt.assert_allclose(lc_int, py_int, atol=1e-12, rtol=0)
+    npt.assert_allclose(
+        lc_basis.point_charge_integral(charge_coords, charges, sum_charges=True),
+        np.sum(py_int, axis=2),
+        atol=1e-12,
+        rtol=0,
+    )
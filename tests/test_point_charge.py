@@ -185,3 +185,45 @@ def test_point_charge_lincomb():
             basis, points_coords=points_coords, points_charge=points_charge, transform=transform
         ),
     )
+
+
+def test_point_charge_sum_charges():
+    """Test gbasis.integrals.point_charge.point_charge_integral with sum_charges."""
+    basis_dict = parse_nwchem(find_datafile("data_631g.nwchem"))
+    coords = np.array([[0, 0, 0], [0, 0, 1.5], [0, 1.2, 1.0]])
+    basis = make_contractions(basis_dict, ["O", "H", "H"], coords, "spherical")
+    basis[1].coord_type = "cartesian"
+
+    points_coords = np.random.rand(37, 3) * 4
+    points_charge = np.random.rand(37) - 0.5
+    ref = point_charge_integral(basis, points_coords, points_charge)
+    for charge_batch_size in [1, np.int64(5), 1000]:
+        assert np.allclose(
+            point_charge_integral(
+                basis,
+                points_coords,
+                points_charge,
+                sum_charges=True,
+                charge_batch_size=charge_batch_size,
+            ),
+            np.sum(ref, axis=2),
+        )
+    transform = np.random.rand(4, ref.shape[0])
+    assert np.allclose(
+        point_charge_integral(
+            basis, points_coords, points_charge, transform=transform, sum_charges=True
+        ),
+        np.einsum("ia,jb,abn->ij", transform, transform, ref),
+    )
+    with pytest.raises(ValueError):
+        point_charge_integral(
+            basis, points_coords, points_charge, sum_charges=True, charge_batch_size=0
+        )
+    with pytest.raises(TypeError):
+        point_charge_integral(
+            basis, points_coords, points_charge, sum_charges=True, charge_batch_size=2.0
+        )
+    with pytest.raises(TypeError):
+        point_charge_integral(
+            basis, points_coords, points_charge, sum_charges=True, charge_batch_size=True
+        )
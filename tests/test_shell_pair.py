@@ -0,0 +1,184 @@
+"""Test gbasis.integrals.shell_pair."""
+from gbasis.contractions import GeneralizedContractionShell
+from gbasis.integrals.angular_momentum import angular_momentum_integral
+from gbasis.integrals.kinetic_energy import kinetic_energy_integral
+from gbasis.integrals.moment import moment_integral
+from gbasis.integrals.momentum import momentum_integral
+from gbasis.integrals.nuclear_electron_attraction import nuclear_electron_attraction_integral
+from gbasis.integrals.overlap import overlap_integral
+from gbasis.integrals.point_charge import point_charge_integral
+from gbasis.integrals.shell_pair import ShellPair, ShellPairData, shell_pair_primitives
+from gbasis.parsers import make_contractions, parse_nwchem
+import numpy as np
+import pytest
+from utils import find_datafile
+
+
+def test_shell_pair():
+    """Test shell_pair.ShellPair."""
+    cont_one = GeneralizedContractionShell(
+        1, np.array([0.5, 1, 1.5]), np.array([1.0, 2.0]), np.array([0.1, 0.5]), "spherical"
+    )
+    cont_two = GeneralizedContractionShell(
+        2, np.array([1, 2, 3]), np.array([1.0, 0.5, 0.2]), np.array([0.3, 2.0, 9.0]), "spherical"
+    )
+    shell_pair = ShellPair(cont_one, cont_two)
+    exps_a = cont_one.exps[np.newaxis, :]
+    exps_b = cont_two.exps[:, np.newaxis]
+    harm_mean = exps_a * exps_b / (exps_a + exps_b)
+    rel_dist = cont_one.coord - cont_two.coord
+    assert np.all(shell_pair.mask)
+    assert np.allclose(shell_pair.prims_one, [0, 1])
+    assert np.allclose(shell_pair.prims_two, [0, 1, 2])
+    assert np.allclose(shell_pair.exps_sum, exps_a + exps_b)
+    assert np.allclose(shell_pair.harm_mean, harm_mean)
+    assert np.allclose(
+        shell_pair.coord_wac,
+        (exps_a * cont_one.coord[:, None, None] + exps_b * cont_two.coord[:, None, None])
+        / (exps_a + exps_b),
+    )
+    assert np.allclose(shell_pair.exp_coord, np.exp(-harm_mean * rel_dist[:, None, None] ** 2))
+    assert np.allclose(shell_pair.exp_dist, np.exp(-harm_mean * np.sum(rel_dist**2)))
+
+    # the tightest primitive of the second contraction is screened out with every primitive of the
+    # first contraction and the second tightest with the tightest of the first contraction
+    cont_two.coord = np.array([2.5, 3, 3.5])
+    shell_pair = ShellPair(cont_one, cont_two, screen_tol=0.2)
+    assert np.allclose(shell_pair.prims_one, [0, 1])
+    assert np.allclose(shell_pair.prims_two, [0, 1])
+    assert np.allclose(shell_pair.mask, [[True, True], [True, False]])
+    assert np.allclose(shell_pair.exps_one, [0.1, 0.5])
+    assert np.allclose(shell_pair.coeffs_one, [[1.0], [2.0]])
+    assert np.allclose(shell_pair.norm_prim_cart_one, cont_one.norm_prim_cart)
+    assert np.allclose(shell_pair.exps_two, [0.3, 2.0])
+    assert np.allclose(shell_pair.coeffs_two, [[1.0], [0.5]])
+    assert np.allclose(shell_pair.norm_prim_cart_two, cont_two.norm_prim_cart[:, :2])
+    harm_mean = harm_mean[:2]
+    assert np.allclose(shell_pair.harm_mean, harm_mean)
+    assert np.allclose(shell_pair.exp_dist, shell_pair.mask * np.exp(-harm_mean * 12))
+
+    # every primitive pair is screened out
+    shell_pair = ShellPair(cont_one, cont_two, screen_tol=1e3)
+    assert not np.any(shell_pair.mask)
+    assert shell_pair.exp_dist.shape == (1, 1)
+    assert np.allclose(shell_pair.exp_coord, 0)
+    assert np.allclose(shell_pair.exp_dist, 0)
+
+
+def test_shell_pair_data():
+    """Test shell_pair.ShellPairData and shell_pair.shell_pair_primitives."""
+    cont_one = GeneralizedContractionShell(
+        1, np.array([0.5, 1, 1.5]), np.ones(2), np.array([0.1, 0.5]), "spherical"
+    )
+    cont_two = GeneralizedContractionShell(
+        0, np.array([1, 2, 3]), np.ones(1), np.array([0.3]), "spherical"
+    )
+    with pytest.raises(TypeError):
+        ShellPairData(cont_one)
+    with pytest.raises(TypeError):
+        ShellPairData([cont_one, None])
+    with pytest.raises(ValueError):
+        ShellPairData([cont_one, cont_two], screen_tol=0)
+    with pytest.raises(TypeError):
+        shell_pair_primitives(cont_one, cont_two, shell_pairs={})
+
+    shell_pairs = ShellPairData([cont_one, cont_two])
+    shell_pair = shell_pairs.get(cont_one, cont_two)
+    assert shell_pairs.get(cont_one, cont_two) is shell_pair
+    assert shell_pairs.get(cont_two, cont_one) is not shell_pair
+    assert shell_pairs.get(cont_two, cont_one).exps_sum.shape == (2, 1)
+    with pytest.raises(ValueError):
+        shell_pairs.get(
+            cont_one,
+            GeneralizedContractionShell(
+                0, np.array([1, 2, 3]), np.ones(1), np.array([0.3]), "spherical"
+            ),
+        )
+
+    # the pair is kept until the modified shell is invalidated
+    cont_two.coord = np.array([1, 2, 4])
+    assert shell_pairs.get(cont_one, cont_two) is shell_pair
+    shell_pair_one = shell_pairs.get(cont_one, cont_one)
+    shell_pairs.invalidate([1])
+    assert shell_pairs.get(cont_one, cont_one) is shell_pair_one
+    new_shell_pair = shell_pairs.get(cont_one, cont_two)
+    assert new_shell_pair is not shell_pair
+    assert np.allclose(new_shell_pair.coord_two, [1, 2, 4])
+    assert shell_pairs.get(cont_one, cont_two) is new_shell_pair
+    shell_pairs.invalidate()
+    assert shell_pairs.get(cont_one, cont_one) is not shell_pair_one
+    new_shell_pair = shell_pairs.get(cont_one, cont_two)
+
+    output = shell_pair_primitives(cont_one, cont_two)
+    assert output[0] is cont_one.exps
+    assert output[4] is cont_two.coeffs
+    assert output[-1] is None
+    output = shell_pair_primitives(cont_one, cont_two, shell_pairs)
+    assert output[0] is new_shell_pair.exps_one
+    assert output[-1] is new_shell_pair
+
+    # the screening tolerance is only applied to the shell pairs of the overlap, which are obtained
+    # from the unscreened shell pairs
+    shell_pairs = ShellPairData([cont_one, cont_two], screen_tol=1e3)
+    shell_pair = shell_pairs.get(cont_one, cont_two)
+    screened_pair = shell_pairs.get(cont_one, cont_two, screen=True)
+    assert np.all(shell_pair.mask)
+    assert not np.any(screened_pair.mask)
+    assert screened_pair is not shell_pair
+    assert shell_pairs.get(cont_one, cont_two, screen=True) is screened_pair
+    assert shell_pairs.get(cont_one, cont_two) is shell_pair
+    shell_pairs.invalidate([0])
+    assert shell_pairs.get(cont_one, cont_two, screen=True) is not screened_pair
+    assert np.allclose(overlap_integral([cont_one, cont_two], shell_pairs=shell_pairs), 0)
+    assert np.allclose(
+        point_charge_integral(
+            [cont_one, cont_two], np.zeros((2, 3)), np.ones(2), shell_pairs=shell_pairs
+        ),
+        point_charge_integral([cont_one, cont_two], np.zeros((2, 3)), np.ones(2)),
+    )
+
+
+@pytest.mark.parametrize("coord_type", ["cartesian", "spherical"])
+def test_shell_pair_data_integrals(coord_type):
+    """Test that the one-electron integrals are unchanged by sharing a ShellPairData."""
+    basis_dict = parse_nwchem(find_datafile("data_anorcc.nwchem"))
+    coords = np.array([[0, 0, 0], [1.5, 0.3, -0.4], [0.2, -2.0, 8.0]])
+    charges = np.array([6, 8, 1.0])
+    basis = make_contractions(basis_dict, ["C", "O", "H"], coords, coord_type)
+    orders = np.array([[1, 0, 0], [0, 1, 0], [0, 0, 1]])
+    integrals = [
+        lambda shell_pairs: overlap_integral(basis, shell_pairs=shell_pairs),
+        lambda shell_pairs: kinetic_energy_integral(basis, shell_pairs=shell_pairs),
+        lambda shell_pairs: momentum_integral(basis, shell_pairs=shell_pairs),
+        lambda shell_pairs: angular_momentum_integral(basis, shell_pairs=shell_pairs),
+        lambda shell_pairs: moment_integral(basis, coords[1], orders, shell_pairs=shell_pairs),
+        lambda shell_pairs: point_charge_integral(basis, coords, charges, shell_pairs=shell_pairs),
+        lambda shell_pairs: nuclear_electron_attraction_integral(
+            basis, coords, charges, shell_pairs=shell_pairs
+        ),
+    ]
+
+    shell_pairs = ShellPairData(basis)
+    for integral in integrals:
+        assert np.allclose(integral(None), integral(shell_pairs), rtol=0, atol=1e-15)
+    num_pairs = len(shell_pairs._pairs)
+    for integral in integrals:
+        integral(shell_pairs)
+    assert len(shell_pairs._pairs) == num_pairs
+
+    # only the overlap is screened, and the screened pairs are obtained from the unscreened pairs
+    shell_pairs = ShellPairData(basis, screen_tol=1e-12)
+    overlap = integrals[0](shell_pairs)
+    assert np.allclose(integrals[0](None), overlap, rtol=0, atol=1e-9)
+    assert np.count_nonzero(overlap == integrals[0](None)) < overlap.size
+    for integral in integrals[1:]:
+        assert np.allclose(integral(None), integral(shell_pairs), rtol=0, atol=1e-15)
+    assert len(shell_pairs._pairs) == num_pairs
+    assert all(shell_pair.mask.all() for shell_pair in shell_pairs._pairs.values())
+    assert not all(shell_pair.mask.all() for shell_pair in shell_pairs._screened_pairs.values())
+
+    transform = np.random.rand(5, overlap_integral(basis).shape[0])
+    assert np.allclose(
+        kinetic_energy_integral(basis, transform=transform, shell_pairs=shell_pairs),
+        kinetic_energy_integral(basis, transform=transform),
+    )
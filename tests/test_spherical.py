@@ -130,6 +130,17 @@ def test_generate_transformation():
             1, np.array([(1, 0, 0), (0, 1, 0), (0, 0, 1)]), ("s1", "c0", "c1"), "left"
         ),
     )
+    # the cached transformation is not modified through the returned array
+    transform = generate_transformation(
+        1, np.array([(1, 0, 0), (0, 1, 0), (0, 0, 1)]), ("s1", "c0", "c1"), "right"
+    )
+    transform[:] = 0
+    assert np.array_equal(
+        generate_transformation(
+            1, np.array([(1, 0, 0), (0, 1, 0), (0, 0, 1)]), ("s1", "c0", "c1"), "right"
+        ),
+        np.array([[0.0, 0.0, 1.0], [1.0, 0.0, 0.0], [0.0, 1.0, 0.0]]),
+    )
     with pytest.raises(TypeError):
         generate_transformation(0.0, np.array([(0, 0, 0)]), ("c0",), "right")
     with pytest.raises(TypeError):
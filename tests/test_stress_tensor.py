@@ -273,3 +273,28 @@ def test_evaluate_ehrenfest_hessian():
         )
         / 2,
     )
+
+
+def test_evaluate_stress_tensor_chunk_size_n_workers():
+    """Test the functions of gbasis.evals.stress_tensor in parallel blocks of points."""
+    basis_dict = parse_nwchem(find_datafile("data_anorcc.nwchem"))
+    coords = np.array([[0, 0, 0]])
+    basis = make_contractions(basis_dict, ["H"], coords, "spherical")
+    points = np.random.rand(10, 3)
+    density = np.identity(40)
+    transform = np.identity(40)
+
+    assert np.allclose(
+        evaluate_stress_tensor(density, basis, points, 0.5, 2, transform, n_workers=3),
+        evaluate_stress_tensor(density, basis, points, 0.5, 2, transform),
+    )
+    assert np.allclose(
+        evaluate_ehrenfest_force(density, basis, points, 0.5, 2, transform, chunk_size=4),
+        evaluate_ehrenfest_force(density, basis, points, 0.5, 2, transform),
+    )
+    assert np.allclose(
+        evaluate_ehrenfest_hessian(
+            density, basis, points, 0.5, 2, transform, symmetric=True, chunk_size=4, n_workers=2
+        ),
+        evaluate_ehrenfest_hessian(density, basis, points, 0.5, 2, transform, symmetric=True),
+    )